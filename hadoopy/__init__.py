@@ -19,7 +19,7 @@ __license__ = 'GPL V3'
 
 from _runner import launch, launch_frozen
 from _local import launch_local
-from _hdfs import get, put, readtb, writetb, writetb_parts, ls, exists, rmr, isempty, abspath, isdir, mv, mkdir, cp, stat
+from _hdfs import get, put, readtb, writetb, writetb_parts, writetb_from_fd, ls, ils, exists, rmr, isempty, abspath, isdir, exists_many, isdir_many, isempty_many, mv, mkdir, cp, stat
 from _job_cli import run
 from _reporter import status, counter
 from _test import Test
@@ -18,80 +18,264 @@ __author__ = 'Brandyn A. White <bwhite@cs.umd.edu>'
 __license__ = 'GPL V3'
 
 import subprocess
+import collections
+import posixpath
+import select
+import tempfile
+import itertools
+import fcntl
+import functools
+import threading
+import Queue
+import time
+import sys
 import re
 import os
 import hadoopy
 from hadoopy._runner import _find_hstreaming
 
 
+# Matches log lines like "12/08/23 01:32:17 INFO ..." and only scans 3 tokens
+_INFO_WARN_RE = re.compile(r'\S+\s+\S+\s+(?:INFO|WARN)(?:\s|$)')
+
+
 def _cleaned_hadoop_stderr(hdfs_stderr):
     for line in hdfs_stderr:
-        parts = line.split()
-        if parts[2] == 'INFO' or parts[2] == 'WARN':
-            pass
-        else:
+        if not _INFO_WARN_RE.match(line):
             yield line
         
 
-def _hadoop_fs_command(cmd, stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, java_mem_mb=100):
+def _hadoop_fs_command(argv, stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, java_mem_mb=100, bufsize=0):
     env = dict(os.environ)
     env['HADOOP_OPTS'] = "-Xmx%dm" % java_mem_mb
-    p = subprocess.Popen(cmd, env=env, shell=True, close_fds=True,
+    # No close_fds, it closes every fd up to the fd limit in the child (can
+    # be ~1M).  Our own fds are close-on-exec instead (see _pipe).
+    p = subprocess.Popen(argv, env=env, bufsize=bufsize,
                          stdin=stdin,
                          stdout=stdout,
                          stderr=stderr)
     return p
 
 
-def _checked_hadoop_fs_command(cmd, *args, **kw):
-    p = _hadoop_fs_command(cmd, *args, **kw)
+def _checked_hadoop_fs_command(argv, *args, **kw):
+    p = _hadoop_fs_command(argv, *args, **kw)
     stdout, stderr = p.communicate()
     rcode = p.returncode
-    if rcode is not 0:
-        raise IOError('Ran[%s]: %s' % (cmd, stderr))
+    if rcode != 0:
+        raise IOError('Ran[%s]: %s' % (' '.join(argv), stderr))
     return rcode, stdout, stderr
 
 
+_HDFS_CLIENT = None  # Cache for the native HDFS client (False if unavailable)
+
+
+def _hdfs_client():
+    """Get the native HDFS client, connecting on the first call
+
+    Uses pyarrow (libhdfs) which keeps one connection to the namenode per
+    process instead of starting a JVM for every 'hadoop fs' call.  If pyarrow
+    isn't available, the connection fails, or the environmental variable
+    HADOOPY_USE_CLI=1 is set, then the 'hadoop fs' command line is used.
+
+    :returns: A pyarrow HadoopFileSystem or None if the CLI should be used.
+    """
+    global _HDFS_CLIENT
+    if _HDFS_CLIENT is None:
+        _HDFS_CLIENT = False
+        if os.environ.get('HADOOPY_USE_CLI') != '1':
+            try:
+                import pyarrow
+                _HDFS_CLIENT = pyarrow.hdfs.connect()
+            except Exception:  # Missing/failed import, connect or CLASSPATH lookup
+                _HDFS_CLIENT = False
+    return _HDFS_CLIENT or None
+
+
+# Seconds to cache exists/isdir/isempty/ls results (0 disables).  Only safe
+# when nothing else (e.g., a running job) is changing the paths being checked.
+_META_TTL = float(os.environ.get('HADOOPY_METADATA_TTL', 0))
+_META_CACHE = {}  # (func name, path) -> (time, result)
+
+
+def _cache_get(name, path):
+    """
+    :returns: Cached result of name(path) or None if missing/expired
+    """
+    try:
+        cache_time, out = _META_CACHE[(name, path)]
+    except KeyError:
+        return
+    if time.time() - cache_time < _META_TTL:
+        return out
+
+
+def _cache_put(name, path, out, cache_time):
+    if _META_TTL > 0:
+        _META_CACHE[(name, path)] = (cache_time, out)
+
+
+def _cached_metadata(func):
+    """Cache func(path) for _META_TTL seconds (HDFS files are write once)"""
+    @functools.wraps(func)
+    def inner(path):
+        if _META_TTL <= 0:
+            return func(path)
+        out = _cache_get(func.__name__, path)
+        if out is None:
+            cache_time = time.time()
+            out = func(path)
+            _cache_put(func.__name__, path, out, cache_time)
+        return out
+    return inner
+
+
+def _invalidates_metadata(func):
+    """Clear the metadata cache after func modifies HDFS"""
+    @functools.wraps(func)
+    def inner(*args, **kw):
+        try:
+            return func(*args, **kw)
+        finally:
+            _META_CACHE.clear()
+    return inner
+
+
+_SCHEME_RE = re.compile('^[a-zA-Z][a-zA-Z0-9+.-]*://[^/]*')
+
+
+def _has_glob(path):
+    return any(x in path for x in '*?[{')
+
+
+def _path_client(path):
+    """Get the native HDFS client if it can handle path
+
+    Paths with wildcards or a scheme (e.g., s3n://, hdfs://other-nn/) use the
+    CLI, the client is only connected to the default filesystem.
+
+    :returns: A pyarrow HadoopFileSystem or None if the CLI should be used.
+    """
+    if _has_glob(path) or _SCHEME_RE.match(path):
+        return
+    return _hdfs_client()
+
+
+def _strip_scheme(path):
+    # Client returns hdfs://host:port/path, the CLI returns /path.  Not
+    # urlparse as '#' and '?' are legal in HDFS names.
+    return _SCHEME_RE.sub('', path)
+
+
+@_cached_metadata
 def exists(path):
     """Check if a file exists.
 
     :param path: A string for the path.  This should not have any wildcards.
     :returns: True if the path exists, False otherwise.
     """
-    cmd = "hadoop fs -test -e %s"
-    p = _hadoop_fs_command(cmd % (path))
+    client = _path_client(path)
+    if client:
+        return client.exists(path)
+    p = _hadoop_fs_command(['hadoop', 'fs', '-test', '-e', path])
     p.communicate()
     rcode = p.returncode
-    return bool(int(rcode == 0))
+    return rcode == 0
 
 
+@_cached_metadata
 def isdir(path):
     """Check if a path is a directory
 
     :param path: A string for the path.  This should not have any wildcards.
     :returns: True if the path is a directory, False otherwise.
     """
-    cmd = "hadoop fs -test -d %s"
-    p = _hadoop_fs_command(cmd % (path))
+    client = _path_client(path)
+    if client:
+        return client.isdir(path)
+    p = _hadoop_fs_command(['hadoop', 'fs', '-test', '-d', path])
     p.communicate()
     rcode = p.returncode
-    return bool(int(rcode == 0))
+    return rcode == 0
 
 
+@_cached_metadata
 def isempty(path):
     """Check if a path has zero length (also true if it's a directory)
 
     :param path: A string for the path.  This should not have any wildcards.
     :returns: True if the path has zero length, False otherwise.
     """
-    cmd = "hadoop fs -test -z %s"
-    p = _hadoop_fs_command(cmd % (path))
+    client = _path_client(path)
+    if client:
+        try:
+            info = client.info(path)
+        except IOError:
+            return False
+        return info['kind'] == 'directory' or info['size'] == 0
+    p = _hadoop_fs_command(['hadoop', 'fs', '-test', '-z', path])
     p.communicate()
     rcode = p.returncode
-    return bool(int(rcode == 0))
+    return rcode == 0
+
+
+def _test_many(func, flag, paths, num_procs):
+    paths = list(paths)
+    if all(_path_client(path) for path in paths):
+        return map(func, paths)
+    # Keep up to num_procs 'hadoop fs -test' procs running so their JVM
+    # startups overlap, collecting return codes in the order of paths
+    out = [_cache_get(func.__name__, path) for path in paths]
+    procs = collections.deque()
+
+    def _finish():
+        num, path, cache_time, p = procs.popleft()
+        p.communicate()
+        out[num] = p.returncode == 0
+        _cache_put(func.__name__, path, out[num], cache_time)
+    for num, path in enumerate(paths):
+        if out[num] is not None:
+            continue
+        if len(procs) >= num_procs:
+            _finish()
+        procs.append((num, path, time.time(), _hadoop_fs_command(['hadoop', 'fs', '-test', flag, path])))
+    while procs:
+        _finish()
+    return out
+
+
+def exists_many(paths, num_procs=10):
+    """Check if many files exist, checking them in parallel
+
+    :param paths: Iterator of paths.  These should not have any wildcards.
+    :param num_procs: Max number of checks to run at once (default 10)
+    :returns: List of bools, True where the path exists.
+    """
+    return _test_many(exists, '-e', paths, num_procs)
+
+
+def isdir_many(paths, num_procs=10):
+    """Check if many paths are directories, checking them in parallel
+
+    :param paths: Iterator of paths.  These should not have any wildcards.
+    :param num_procs: Max number of checks to run at once (default 10)
+    :returns: List of bools, True where the path is a directory.
+    """
+    return _test_many(isdir, '-d', paths, num_procs)
+
+
+def isempty_many(paths, num_procs=10):
+    """Check if many paths have zero length, checking them in parallel
+
+    :param paths: Iterator of paths.  These should not have any wildcards.
+    :param num_procs: Max number of checks to run at once (default 10)
+    :returns: List of bools, True where the path has zero length.
+    """
+    return _test_many(isempty, '-z', paths, num_procs)
 
 
 _USER_HOME_DIR = None  # Cache for user's home directory
+_ABSPATH_CACHE = {}  # Cache for abspath results, cleared when it is full
+_ABSPATH_CACHE_SIZE = 4096
 
 
 def _get_home_dir_old():
@@ -110,21 +294,10 @@ def _get_home_dir():
     return '/'.join([''] + out)
 
 
-def abspath(path):
-    """Return the absolute path to a file and canonicalize it
-
-    Path is returned without a trailing slash and without redundant slashes.
-    Caches the user's home directory.
-
-    :param path: A string for the path.  This should not have any wildcards.
-    :returns: Absolute path to the file
-    :raises IOError: If unsuccessful
-    """
+def _user_home_dir():
     global _USER_HOME_DIR
     # FIXME(brandyn): User's home directory must exist
     # FIXME(brandyn): Requires something to be in home dir
-    if path[0] == '/':
-        return os.path.abspath(path)
     if _USER_HOME_DIR is None:
         try:
             _USER_HOME_DIR = _get_home_dir()
@@ -132,19 +305,47 @@ def abspath(path):
             if not exists('.'):
                 raise IOError("Home directory doesn't exist")
             raise e
-    return os.path.abspath(os.path.join(_USER_HOME_DIR, path))
+    return _USER_HOME_DIR
+
+
+def abspath(path):
+    """Return the absolute path to a file and canonicalize it
+
+    Path is returned without a trailing slash and without redundant slashes.
+    Caches the user's home directory and the results.
 
+    :param path: A string for the path.  This should not have any wildcards.
+    :returns: Absolute path to the file
+    :raises IOError: If unsuccessful
+    """
+    try:
+        return _ABSPATH_CACHE[path]
+    except KeyError:
+        pass
+    if path[0] == '/':
+        out = posixpath.normpath(path)
+    else:
+        out = posixpath.normpath(posixpath.join(_user_home_dir(), path))
+    if len(_ABSPATH_CACHE) >= _ABSPATH_CACHE_SIZE:
+        _ABSPATH_CACHE.clear()
+    _ABSPATH_CACHE[path] = out
+    return out
 
+
+@_invalidates_metadata
 def rmr(path):
     """Remove a file if it exists (recursive)
 
+    Always uses 'hadoop fs -rmr' (not the native client) so the path is moved
+    to .Trash when the cluster has trash enabled, the client deletes permanently.
+
     :param path: A string (potentially with wildcards).
     :raises IOError: If unsuccessful
     """
-    cmd = "hadoop fs -rmr %s" % (path)
-    rcode, stdout, stderr = _checked_hadoop_fs_command(cmd)
+    rcode, stdout, stderr = _checked_hadoop_fs_command(['hadoop', 'fs', '-rmr', path])
 
 
+@_invalidates_metadata
 def cp(hdfs_src, hdfs_dst):
     """Copy a file
 
@@ -152,8 +353,7 @@ def cp(hdfs_src, hdfs_dst):
     :param hdfs_dst: Destination (str)
     :raises: IOError: If unsuccessful
     """
-    cmd = "hadoop fs -cp %s %s" % (hdfs_src, hdfs_dst)
-    rcode, stdout, stderr = _checked_hadoop_fs_command(cmd)
+    rcode, stdout, stderr = _checked_hadoop_fs_command(['hadoop', 'fs', '-cp', hdfs_src, hdfs_dst])
 
 
 def stat(path, format):
@@ -164,21 +364,21 @@ def stat(path, format):
     :returns: Stat output
     :raises: IOError: If unsuccessful
     """
-    cmd = "hadoop fs -stat %s %s" % (format, path)
-    rcode, stdout, stderr = _checked_hadoop_fs_command(cmd)
+    rcode, stdout, stderr = _checked_hadoop_fs_command(['hadoop', 'fs', '-stat', format, path])
     return stdout.rstrip()
 
 
+@_invalidates_metadata
 def mkdir(path):
     """Make a directory
 
     :param path: A string (potentially with wildcards).
     :raises IOError: If unsuccessful
     """
-    cmd = "hadoop fs -mkdir %s" % (path)
-    rcode, stdout, stderr = _checked_hadoop_fs_command(cmd)
+    rcode, stdout, stderr = _checked_hadoop_fs_command(['hadoop', 'fs', '-mkdir', path])
 
 
+@_invalidates_metadata
 def mv(hdfs_src, hdfs_dst):
     """Move a file on hdfs
 
@@ -186,10 +386,10 @@ def mv(hdfs_src, hdfs_dst):
     :param hdfs_dst: Destination (str)
     :raises: IOError: If unsuccessful
     """
-    cmd = "hadoop fs -mv %s %s" % (hdfs_src, hdfs_dst)
-    rcode, stdout, stderr = _checked_hadoop_fs_command(cmd)
+    rcode, stdout, stderr = _checked_hadoop_fs_command(['hadoop', 'fs', '-mv', hdfs_src, hdfs_dst])
 
 
+@_invalidates_metadata
 def put(local_path, hdfs_path):
     """Put a file on hdfs
 
@@ -197,8 +397,61 @@ def put(local_path, hdfs_path):
     :param hdfs_path: Destination (str)
     :raises: IOError: If unsuccessful
     """
-    cmd = "hadoop fs -put %s %s" % (local_path, hdfs_path)
-    rcode, stdout, stderr = _checked_hadoop_fs_command(cmd)
+    client = _path_client(hdfs_path)
+    if client and not _has_glob(local_path) and not os.path.isdir(local_path):
+        if client.isdir(hdfs_path):
+            hdfs_path = posixpath.join(hdfs_path, os.path.basename(local_path))
+        if client.exists(hdfs_path):
+            raise IOError('put: Target %s already exists' % hdfs_path)
+        with open(local_path, 'rb') as fp:
+            client.upload(hdfs_path, fp)
+        return
+    rcode, stdout, stderr = _checked_hadoop_fs_command(['hadoop', 'fs', '-put', local_path, hdfs_path])
+
+
+_GET_RANGE_SIZE = 134217728  # Bytes per concurrent range in get (128MB)
+_GET_NUM_THREADS = 4
+
+
+def _download_ranges(client, hdfs_path, local_path, size):
+    """Download hdfs_path with concurrent ranged reads, each to its own offset"""
+    ranges = Queue.Queue()
+    for start in range(0, size, _GET_RANGE_SIZE):
+        ranges.put((start, min(start + _GET_RANGE_SIZE, size)))
+    errors = []
+
+    def _download():
+        with client.open(hdfs_path, 'rb') as hdfs_fp:
+            with open(local_path, 'r+b') as fp:
+                while not errors:
+                    try:
+                        start, stop = ranges.get_nowait()
+                    except Queue.Empty:
+                        return
+                    hdfs_fp.seek(start)
+                    fp.seek(start)
+                    while start < stop:
+                        data = hdfs_fp.read(min(1048576, stop - start))
+                        if not data:
+                            raise IOError('get: %s is shorter than expected' % hdfs_path)
+                        fp.write(data)
+                        start += len(data)
+
+    def _run():
+        try:
+            _download()
+        except Exception, e:
+            errors.append(e)
+    with open(local_path, 'wb') as fp:
+        fp.truncate(size)
+    threads = [threading.Thread(target=_run) for x in range(min(_GET_NUM_THREADS, ranges.qsize()))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        os.remove(local_path)  # Don't leave a full size but partial file
+        raise errors[0]
 
 
 def get(hdfs_path, local_path):
@@ -208,8 +461,74 @@ def get(hdfs_path, local_path):
     :param local_path: Source (str)
     :raises: IOError: If unsuccessful
     """
-    cmd = "hadoop fs -get %s %s" % (hdfs_path, local_path)
-    rcode, stdout, stderr = _checked_hadoop_fs_command(cmd)
+    client = _path_client(hdfs_path)
+    if client and not client.isdir(hdfs_path):
+        if os.path.isdir(local_path):
+            local_path = os.path.join(local_path, posixpath.basename(hdfs_path))
+        if os.path.exists(local_path):
+            raise IOError('get: Target %s already exists' % local_path)
+        size = client.info(hdfs_path)['size']
+        if size > _GET_RANGE_SIZE:
+            # Ranges are read from different blocks/datanodes
+            _download_ranges(client, hdfs_path, local_path, size)
+            return
+        try:
+            with open(local_path, 'wb') as fp:
+                client.download(hdfs_path, fp)
+        except Exception:
+            os.remove(local_path)  # Don't leave a partial file
+            raise
+        return
+    rcode, stdout, stderr = _checked_hadoop_fs_command(['hadoop', 'fs', '-get', hdfs_path, local_path])
+
+
+_FOUND_RE = re.compile('Found [0-9]+ items$')
+
+
+def _keep_non_log(path):
+    # Log files (e.g., _SUCCESS, _logs) start with an underscore
+    return os.path.basename(path)[0] != '_'
+
+
+def ils(path):
+    """Iterate over files on HDFS as they are listed.
+
+    Unlike ls, the listing isn't buffered so memory use is constant and the
+    first paths are available before the listing finishes.
+
+    :param path: A string (potentially with wildcards).
+    :rtype: An iterator of strings representing HDFS paths.
+    :raises: IOError: An error occurred listing the directory (e.g., not available).
+    """
+    client = _path_client(path)
+    if client:
+        for x in client.ls(path):
+            yield _strip_scheme(x)
+        return
+    argv = ['hadoop', 'fs', '-ls', path]
+    # Stderr goes to a file so it can't fill up and block us
+    stderr_fp = tempfile.TemporaryFile()
+    # Buffered stdout, unbuffered would cost a read(2) per byte
+    p = _hadoop_fs_command(argv, stderr=stderr_fp, bufsize=-1)
+    try:
+        for line in p.stdout:
+            line = line.rstrip('\n')
+            if line and not _FOUND_RE.search(line):
+                yield line.split(' ')[-1]
+        p.wait()
+        if p.returncode != 0:
+            stderr_fp.seek(0)
+            raise IOError('Ran[%s]: %s' % (' '.join(argv), stderr_fp.read()))
+    finally:
+        if p.poll() is None:
+            p.kill()
+            p.wait()
+        stderr_fp.close()
+
+
+@_cached_metadata
+def _ls(path):
+    return tuple(ils(path))
 
 
 def ls(path):
@@ -219,13 +538,36 @@ def ls(path):
     :rtype: A list of strings representing HDFS paths.
     :raises: IOError: An error occurred listing the directory (e.g., not available).
     """
-    rcode, stdout, stderr = _checked_hadoop_fs_command('hadoop fs -ls %s' % path)
-    found_line = lambda x: re.search('Found [0-9]+ items$', x)
-    out = [x.split(' ')[-1] for x in stdout.split('\n')
-           if x and not found_line(x)]
-    return out
+    return list(_ls(path))
+
+
+_F_SETPIPE_SZ = 1031  # Linux specific, missing from Python 2's fcntl
+
+
+def _set_cloexec(fd):
+    fcntl.fcntl(fd, fcntl.F_SETFD, fcntl.fcntl(fd, fcntl.F_GETFD) | fcntl.FD_CLOEXEC)
+
+
+def _pipe(size=1048576):
+    """Make a close-on-exec pipe with a larger buffer (1MB default) when the OS supports it
+
+    Fewer producer stalls when the reader is bursty (Linux defaults to 64KB).
+    Close-on-exec keeps other hadoop procs from holding our ends open (e.g.,
+    a loadtb proc never seeing EOF), the end given to a proc is dup'd as its
+    stdin/stdout which clears the flag.
+    """
+    read_fd, write_fd = os.pipe()
+    _set_cloexec(read_fd)
+    _set_cloexec(write_fd)
+    if sys.platform.startswith('linux'):
+        try:
+            fcntl.fcntl(write_fd, _F_SETPIPE_SZ, size)
+        except IOError:  # Kernel < 2.6.35 or above /proc/sys/fs/pipe-max-size
+            pass
+    return read_fd, write_fd
 
 
+@_invalidates_metadata
 def writetb(path, kvs, java_mem_mb=256):
     """Write typedbytes sequence file to HDFS given an iterator of KeyValue pairs
 
@@ -234,23 +576,42 @@ def writetb(path, kvs, java_mem_mb=256):
     :param java_mem_mb: Integer of java heap size in MB (default 256)
     :raises: IOError: An error occurred while saving the data.
     """
-    read_fd, write_fd = os.pipe()
+    read_fd, write_fd = _pipe()
     read_fp = os.fdopen(read_fd, 'r')
     hstreaming = _find_hstreaming()
-    cmd = 'hadoop jar %s loadtb %s' % (hstreaming, path)
-    p = _hadoop_fs_command(cmd, stdin=read_fp, java_mem_mb=java_mem_mb)
+    p = _hadoop_fs_command(['hadoop', 'jar', hstreaming, 'loadtb', path], stdin=read_fp, java_mem_mb=java_mem_mb)
     read_fp.close()
-    with hadoopy.TypedBytesFile(write_fd=write_fd) as tb_fp:
+    # Large buffer so each write(2) sends many records
+    with hadoopy.TypedBytesFile(write_fd=write_fd, write_buffer_size=1048576) as tb_fp:
         for kv in kvs:
             if p.poll() is not None:
                 raise IOError('writetb: Hadoop process quit while we were sending it data.  Hadoop output below...\nstdout\n%s\nstderr\n%s' % p.communicate())
             tb_fp.write(kv)
         tb_fp.flush()
     p.wait()
-    if p.returncode is not 0:
+    if p.returncode != 0:
         raise IOError('writetb: Hadoop process returned [%d]. Hadoop output below...\nstderr\n%s' % (p.returncode, p.stderr.read()))
 
 
+@_invalidates_metadata
+def writetb_from_fd(path, fd, java_mem_mb=256):
+    """Write typedbytes sequence file to HDFS given a file of encoded TypedBytes
+
+    The hadoop process reads the fd directly (e.g., an on disk .tb file), so
+    the records are never decoded/encoded or copied through Python.
+
+    :param path: HDFS path (string)
+    :param fd: File descriptor (int) or file object positioned at the first record
+    :param java_mem_mb: Integer of java heap size in MB (default 256)
+    :raises: IOError: An error occurred while saving the data.
+    """
+    hstreaming = _find_hstreaming()
+    p = _hadoop_fs_command(['hadoop', 'jar', hstreaming, 'loadtb', path], stdin=fd, java_mem_mb=java_mem_mb)
+    stdout, stderr = p.communicate()
+    if p.returncode != 0:
+        raise IOError('writetb_from_fd: Hadoop process returned [%d]. Hadoop output below...\nstderr\n%s' % (p.returncode, stderr))
+
+
 def writetb_parts(path, kvs, num_per_file, **kw):
     """Write typedbytes sequence files to HDFS given an iterator of KeyValue pairs
 
@@ -279,7 +640,47 @@ def writetb_parts(path, kvs, num_per_file, **kw):
         out, part_num = _flush(out, part_num)
 
 
-def readtb(paths, num_procs=1, java_mem_mb=256, ignore_logs=True):
+class _ReadPoller(object):
+    """Waits until registered fds are readable
+
+    Uses epoll when available (Linux) as it doesn't rescan every fd per wakeup
+    and isn't limited to FD_SETSIZE fds, otherwise falls back to select.
+    """
+
+    def __init__(self):
+        self._fds = set()
+        self._epoll = select.epoll() if hasattr(select, 'epoll') else None
+        if self._epoll:
+            # Python 2 doesn't make it close-on-exec, keep the dumptb procs from inheriting it
+            _set_cloexec(self._epoll.fileno())
+
+    def __len__(self):
+        return len(self._fds)
+
+    def register(self, fd):
+        self._fds.add(fd)
+        if self._epoll:
+            self._epoll.register(fd, select.EPOLLIN)
+
+    def unregister(self, fd):
+        self._fds.remove(fd)
+        if self._epoll:
+            self._epoll.unregister(fd)
+
+    def poll(self):
+        """
+        :returns: List of ready fds.  EOF/hangup counts as ready.
+        """
+        if self._epoll:
+            return [fd for fd, event in self._epoll.poll()]
+        return select.select(self._fds, [], [])[0]
+
+    def close(self):
+        if self._epoll:
+            self._epoll.close()
+
+
+def readtb(paths, num_procs=1, java_mem_mb=256, ignore_logs=True, batch_size=16):
     """Read typedbytes sequence files on HDFS (with optional compression).
 
     By default, ignores files who's names start with an underscore '_' as they
@@ -292,38 +693,40 @@ def readtb(paths, num_procs=1, java_mem_mb=256, ignore_logs=True):
     :param num_procs: Number of reading procs to open (default 1)
     :param java_mem_mb: Integer of java heap size in MB (default 256)
     :param ignore_logs: If True, ignore all files who's name starts with an underscore.  Defaults to True.
+    :param batch_size: Max number of KV pairs read from a proc before checking the others.  Larger is faster but holds more pairs in memory and delays pairs from the other procs.  Defaults to 16.
     :returns: An iterator of key, value pairs.
     :raises: IOError: An error occurred reading the directory (e.g., not available).
     """
-    import select
     hstreaming = _find_hstreaming()
     if isinstance(paths, (str, unicode)):
         paths = [paths]
-    read_fds = set()
+    read_fds = _ReadPoller()
     procs = {}
     tb_fps = {}
 
     def _open_tb(cur_path):
-        cmd = 'hadoop jar %s dumptb %s' % (hstreaming, cur_path)
-        read_fd, write_fd = os.pipe()
+        read_fd, write_fd = _pipe()
         write_fp = os.fdopen(write_fd, 'w')
-        p = _hadoop_fs_command(cmd, stdout=write_fp, java_mem_mb=java_mem_mb)
+        p = _hadoop_fs_command(['hadoop', 'jar', hstreaming, 'dumptb', cur_path], stdout=write_fp, java_mem_mb=java_mem_mb)
         write_fp.close()
-        read_fds.add(read_fd)
+        read_fds.register(read_fd)
         procs[read_fd] = p
-        tb_fps[read_fd] = hadoopy.TypedBytesFile(read_fd=read_fd)
+        # Large buffer so each read(2) gets many records
+        tb_fps[read_fd] = hadoopy.TypedBytesFile(read_fd=read_fd, read_buffer_size=65536)
 
     def _path_gen():
         for root_path in paths:
-            try:
-                all_paths = ls(root_path)
-            except IOError:
-                raise IOError("No such file or directory: '%s'" % root_path)
+            # Paths are opened as they are listed, overlapping the two
+            all_paths = ils(root_path)
             if ignore_logs:
-                # Ignore any files that start with an underscore
-                keep_file = lambda x: os.path.basename(x)[0] != '_'
-                all_paths = filter(keep_file, all_paths)
-            for cur_path in all_paths:
+                all_paths = itertools.ifilter(_keep_non_log, all_paths)
+            while True:
+                try:
+                    cur_path = all_paths.next()
+                except StopIteration:
+                    break
+                except IOError:
+                    raise IOError("No such file or directory: '%s'" % root_path)
                 yield _open_tb(cur_path)
     try:
         path_gen = _path_gen()
@@ -333,25 +736,28 @@ def readtb(paths, num_procs=1, java_mem_mb=256, ignore_logs=True):
             except (AttributeError, StopIteration):
                 path_gen = None
         while read_fds:
-            cur_fds = select.select(read_fds, [], [])[0]
-            for read_fd in cur_fds:
+            for read_fd in read_fds.poll():
                 p = procs[read_fd]
                 tp_fp = tb_fps[read_fd]
                 try:
-                    yield tp_fp.next()
+                    for kv in tp_fp.next_batch(batch_size):
+                        yield kv
                 except StopIteration:
-                    p.wait()
-                    del procs[read_fd]
-                    del tb_fps[read_fd]
-                    del p
-                    os.close(read_fd)
-                    read_fds.remove(read_fd)
+                    # Start the next proc first so its JVM startup overlaps
+                    # with this one exiting
                     try:
                         path_gen.next()
                     except (AttributeError, StopIteration):
                         path_gen = None
+                    p.wait()
+                    del procs[read_fd]
+                    del tb_fps[read_fd]
+                    del p
+                    read_fds.unregister(read_fd)
+                    tp_fp.close()  # Closes read_fd
     finally:
         # Cleanup outstanding procs
         for p in procs.values():
             p.kill()
             p.wait()
+        read_fds.close()
@@ -116,6 +116,7 @@ class LocalTask(object):
                 pass
 
 
+@hadoopy._runner._clears_metadata
 def launch_local(in_name, out_name, script_path, poll=None, max_input=None,
                  files=(), cmdenvs=(), pipe=True, python_cmd='python', remove_tempdir=True,
                  identity_mapper=False, num_reducers=None,
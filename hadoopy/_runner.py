@@ -29,6 +29,7 @@ import logging
 import time
 import select
 import atexit
+import functools
 
 # These two globals are only used in the follow function
 WARNED_HADOOP_HOME = False
@@ -46,7 +47,8 @@ def _find_hstreaming():
         string.
     """
     global WARNED_HADOOP_HOME, HADOOP_STREAMING_PATH_CACHE
-    if HADOOP_STREAMING_PATH_CACHE:
+    # A failed search is cached too, so it isn't repeated per call
+    if HADOOP_STREAMING_PATH_CACHE is not None:
         return HADOOP_STREAMING_PATH_CACHE
     try:
         search_root = os.environ['HADOOP_HOME']
@@ -63,6 +65,17 @@ def _find_hstreaming():
     return HADOOP_STREAMING_PATH_CACHE
 
 
+def _clears_metadata(func):
+    """Clear the HDFS metadata cache after func runs a job (it may have written anywhere)"""
+    @functools.wraps(func)
+    def inner(*args, **kw):
+        try:
+            return func(*args, **kw)
+        finally:
+            hadoopy._hdfs._META_CACHE.clear()  # Not imported here, _hdfs imports us
+    return inner
+
+
 def _listeq_to_dict(jobconfs):
     """Convert iterators of 'key=val' into a dictionary with later values taking priority."""
     if not isinstance(jobconfs, dict):
@@ -118,6 +131,7 @@ def _check_script(script_path, files, python_cmd):
         os.chdir(orig_pwd)
     
 
+@_clears_metadata
 def launch(in_name, out_name, script_path, partitioner=False, files=(), jobconfs=(),
            cmdenvs=(), libjars=(), input_format=None, output_format=None, copy_script=True,
            wait=True, hstreaming=None, name=None,
@@ -338,6 +352,7 @@ def launch(in_name, out_name, script_path, partitioner=False, files=(), jobconfs
     return out
 
 
+@_clears_metadata
 def launch_frozen(in_name, out_name, script_path, frozen_tar_path=None,
                   temp_path='_hadoopy_temp', cache=True, check_script=False,
                   **kw):
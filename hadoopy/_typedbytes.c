@@ -1,17 +1,21 @@
-/* Generated by Cython 0.16 on Thu Aug 23 01:32:17 2012 */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
-#elif PY_VERSION_HEX < 0x02040000
-    #error Cython requires Python 2.4+.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#include <stddef.h> /* For offsetof */
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
 #ifndef offsetof
-#define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
 #endif
-
 #if !defined(WIN32) && !defined(MS_WINDOWS)
   #ifndef __stdcall
     #define __stdcall
@@ -23,160 +27,633 @@
     #define __fastcall
   #endif
 #endif
-
 #ifndef DL_IMPORT
   #define DL_IMPORT(t) t
 #endif
 #ifndef DL_EXPORT
   #define DL_EXPORT(t) t
 #endif
-
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
 #ifndef PY_LONG_LONG
   #define PY_LONG_LONG LONG_LONG
 #endif
-
 #ifndef Py_HUGE_VAL
   #define Py_HUGE_VAL HUGE_VAL
 #endif
-
 #ifdef PYPY_VERSION
-#define CYTHON_COMPILING_IN_PYPY 1
-#define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
-#define CYTHON_COMPILING_IN_PYPY 0
-#define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
-
-#if CYTHON_COMPILING_IN_PYPY
-  #define __Pyx_PyCFunction_Call PyObject_Call
-#else
-  #define __Pyx_PyCFunction_Call PyCFunction_Call
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PY_FORMAT_SIZE_T ""
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   __Pyx_PyInt_AsInt(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
-  #define __PYX_BUILD_PY_SSIZE_T "i"
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
 #else
-  #define __PYX_BUILD_PY_SSIZE_T "n"
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
 #endif
 
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-     void *buf;
-     PyObject *obj;
-     Py_ssize_t len;
-     Py_ssize_t itemsize;
-     int readonly;
-     int ndim;
-     char *format;
-     Py_ssize_t *shape;
-     Py_ssize_t *strides;
-     Py_ssize_t *suboffsets;
-     void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-  #define PyBUF_RECORDS (PyBUF_STRIDES | PyBUF_FORMAT | PyBUF_WRITABLE)
-  #define PyBUF_FULL (PyBUF_INDIRECT | PyBUF_FORMAT | PyBUF_WRITABLE)
-
-  typedef int (*getbufferproc)(PyObject *, Py_buffer *, int);
-  typedef void (*releasebufferproc)(PyObject *, Py_buffer *);
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
 #endif
 
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
   #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos) \
-          PyCode_New(a, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos) \
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
 #endif
-
-#if PY_MAJOR_VERSION < 3 && PY_MINOR_VERSION < 6
-  #define PyUnicode_FromString(s) PyUnicode_Decode(s, strlen(s), "UTF-8", "strict")
+  #define __Pyx_DefaultClassType PyType_Type
 #endif
-
-#if PY_MAJOR_VERSION >= 3
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
   #define Py_TPFLAGS_HAVE_INDEX 0
 #endif
-
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
   #define Py_TPFLAGS_HAVE_NEWBUFFER 0
 #endif
-
-
-#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_GET_LENGTH)
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_GET_LENGTH(u) PyUnicode_GET_LENGTH(u)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
-  #define __Pyx_PyUnicode_GET_LENGTH(u) PyUnicode_GET_SIZE(u)
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
 #endif
-
 #if PY_MAJOR_VERSION >= 3
   #define PyBaseString_Type            PyUnicode_Type
   #define PyStringObject               PyUnicodeObject
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
 #endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define PyBytesObject                PyStringObject
-  #define PyBytes_Type                 PyString_Type
-  #define PyBytes_Check                PyString_Check
-  #define PyBytes_CheckExact           PyString_CheckExact
-  #define PyBytes_FromString           PyString_FromString
-  #define PyBytes_FromStringAndSize    PyString_FromStringAndSize
-  #define PyBytes_FromFormat           PyString_FromFormat
-  #define PyBytes_DecodeEscape         PyString_DecodeEscape
-  #define PyBytes_AsString             PyString_AsString
-  #define PyBytes_AsStringAndSize      PyString_AsStringAndSize
-  #define PyBytes_Size                 PyString_Size
-  #define PyBytes_AS_STRING            PyString_AS_STRING
-  #define PyBytes_GET_SIZE             PyString_GET_SIZE
-  #define PyBytes_Repr                 PyString_Repr
-  #define PyBytes_Concat               PyString_Concat
-  #define PyBytes_ConcatAndDel         PyString_ConcatAndDel
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define PySet_Check(obj)             PyObject_TypeCheck(obj, &PySet_Type)
-  #define PyFrozenSet_Check(obj)       PyObject_TypeCheck(obj, &PyFrozenSet_Type)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
 #endif
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
-
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define PyIntObject                  PyLongObject
   #define PyInt_Type                   PyLong_Type
@@ -192,70 +669,73 @@
   #define PyInt_AsSsize_t              PyLong_AsSsize_t
   #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
   #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
 #endif
-
 #if PY_MAJOR_VERSION >= 3
   #define PyBoolObject                 PyLongObject
 #endif
-
-#if PY_VERSION_HEX < 0x03020000
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
-#endif
-
-#if (PY_MAJOR_VERSION < 3) || (PY_VERSION_HEX >= 0x03010300)
-  #define __Pyx_PySequence_GetSlice(obj, a, b) PySequence_GetSlice(obj, a, b)
-  #define __Pyx_PySequence_SetSlice(obj, a, b, value) PySequence_SetSlice(obj, a, b, value)
-  #define __Pyx_PySequence_DelSlice(obj, a, b) PySequence_DelSlice(obj, a, b)
-#else
-  #define __Pyx_PySequence_GetSlice(obj, a, b) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), (PyObject*)0) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_GetSlice(obj, a, b)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object is unsliceable", (obj)->ob_type->tp_name), (PyObject*)0)))
-  #define __Pyx_PySequence_SetSlice(obj, a, b, value) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_SetSlice(obj, a, b, value)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice assignment", (obj)->ob_type->tp_name), -1)))
-  #define __Pyx_PySequence_DelSlice(obj, a, b) (unlikely(!(obj)) ? \
-        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
-        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_DelSlice(obj, a, b)) : \
-            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice deletion", (obj)->ob_type->tp_name), -1)))
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
-
 #if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : PyInstanceMethod_New(func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
 #else
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_NAMESTR(n) ((char *)(n))
-  #define __Pyx_DOCSTR(n)  ((char *)(n))
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
 #else
-  #define __Pyx_NAMESTR(n) (n)
-  #define __Pyx_DOCSTR(n)  (n)
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
 #endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
 #else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#define __Pyx_truncl truncl
 #endif
 
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
     #define __PYX_EXTERN_C extern "C"
@@ -264,13 +744,10 @@
   #endif
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-#define _USE_MATH_DEFINES
-#endif
-#include <math.h>
 #define __PYX_HAVE___hadoopy_typedbytes
 #define __PYX_HAVE_API___hadoopy_typedbytes
-#include "stdint.h"
+/* Early includes */
+#include <stdint.h>
 #include "stdlib.h"
 #include "stdio.h"
 #include "byteconversion.h"
@@ -278,77 +755,204 @@
 #include <omp.h>
 #endif /* _OPENMP */
 
-#ifdef PYREX_WITHOUT_ASSERTIONS
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
 #define CYTHON_WITHOUT_ASSERTIONS
 #endif
 
-
-/* inline attribute */
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_INLINE inline
-  #else
-    #define CYTHON_INLINE
-  #endif
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
 #endif
-
-/* unused attribute */
-#ifndef CYTHON_UNUSED
-# if defined(__GNUC__)
-#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define CYTHON_UNUSED __attribute__ ((__unused__))
-#   else
-#     define CYTHON_UNUSED
-#   endif
-# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
-#   define CYTHON_UNUSED __attribute__ ((__unused__))
-# else
-#   define CYTHON_UNUSED
-# endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
 #endif
-
-typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
-
-
-/* Type Conversion Predeclarations */
-
-#define __Pyx_PyBytes_FromUString(s) PyBytes_FromString((char*)s)
-#define __Pyx_PyBytes_AsUString(s)   ((unsigned char*) PyBytes_AsString(s))
-
-#define __Pyx_Owned_Py_None(b) (Py_INCREF(Py_None), Py_None)
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
-
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
 #define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
 
-#ifdef __GNUC__
-  /* Test for GCC > 2.95 */
-  #if __GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95))
-    #define likely(x)   __builtin_expect(!!(x), 1)
-    #define unlikely(x) __builtin_expect(!!(x), 0)
-  #else /* __GNUC__ > 2 ... */
-    #define likely(x)   (x)
-    #define unlikely(x) (x)
-  #endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
   #define likely(x)   (x)
   #define unlikely(x) (x)
 #endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
 static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
 static PyObject *__pyx_empty_tuple;
 static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
 static int __pyx_lineno;
 static int __pyx_clineno = 0;
 static const char * __pyx_cfilenm= __FILE__;
@@ -356,13 +960,14 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "_typedbytes.pyx",
+  "hadoopy/_typedbytes.pyx",
+  "stringsource",
 };
 
 /*--- Type declarations ---*/
 struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile;
 
-/* "hadoopy/_typedbytes.pyx":534
+/* "hadoopy/_typedbytes.pyx":566
  * 
  * 
  * cdef class TypedBytesFile(object):             # <<<<<<<<<<<<<<
@@ -374,8 +979,11 @@ struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile {
   struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *__pyx_vtab;
   void *_write_ptr;
   void *_read_ptr;
+  char *_read_buf;
+  char *_write_buf;
   PyObject *_repr;
   PyObject *file_method;
+  PyObject *_batch_error;
   int flush_writes;
 };
 
@@ -386,6 +994,9 @@ struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile {
   PyObject *(*flush)(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *__pyx_vtabptr_19_hadoopy_typedbytes_TypedBytesFile;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
   #define CYTHON_REFNANNY 0
 #endif
@@ -399,22 +1010,22 @@ static struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *__pyx_vtabp
     void (*FinishContext)(void**);
   } __Pyx_RefNannyAPIStruct;
   static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname); /*proto*/
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
   #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
 #ifdef WITH_THREAD
-  #define __Pyx_RefNannySetupContext(name, acquire_gil) \
-          if (acquire_gil) { \
-              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure(); \
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__); \
-              PyGILState_Release(__pyx_gilstate_save); \
-          } else { \
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__); \
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
           }
 #else
-  #define __Pyx_RefNannySetupContext(name, acquire_gil) \
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
           __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
 #endif
-  #define __Pyx_RefNannyFinishContext() \
+  #define __Pyx_RefNannyFinishContext()\
           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
   #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
   #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
@@ -436,98 +1047,370 @@ static struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *__pyx_vtabp
   #define __Pyx_XDECREF(r) Py_XDECREF(r)
   #define __Pyx_XGOTREF(r)
   #define __Pyx_XGIVEREF(r)
-#endif /* CYTHON_REFNANNY */
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
 
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
 
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause); /*proto*/
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
 
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
 
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
 
-static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected); /*proto*/
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
 
-static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name); /*proto*/
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
 
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[], \
-    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args, \
-    const char* function_name); /*proto*/
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
 
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
 
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level); /*proto*/
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
 
-static CYTHON_INLINE int32_t __Pyx_PyInt_from_py_int32_t(PyObject *);
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
 
-static CYTHON_INLINE int64_t __Pyx_PyInt_from_py_int64_t(PyObject *);
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
 
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_int32_t(int32_t);
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
 
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_int64_t(int64_t);
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
 
-#include <string.h>
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
 
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals); /*proto*/
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
 
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals); /*proto*/
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
 
-#if PY_MAJOR_VERSION >= 3
-#define __Pyx_PyString_Equals __Pyx_PyUnicode_Equals
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
 #else
-#define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
 #endif
 
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
 
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
+#else
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+#endif
 
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
 
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
+/* IncludeStringH.proto */
+#include <string.h>
 
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
 
-static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject *);
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
 
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
+/* StrEquals.proto */
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyString_Equals __Pyx_PyUnicode_Equals
+#else
+#define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
+#endif
 
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
 
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
 
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
 
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
 
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
 
-static int __Pyx_check_binary_version(void);
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
-static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
 
+/* CodeObjectCache.proto */
 typedef struct {
-    int code_line;
     PyCodeObject* code_object;
+    int code_line;
 } __Pyx_CodeObjectCacheEntry;
 struct __Pyx_CodeObjectCache {
     int count;
@@ -539,16 +1422,76 @@ static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int co
 static PyCodeObject *__pyx_find_code_object(int code_line);
 static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 
+/* AddTraceback.proto */
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename); /*proto*/
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int32_t __Pyx_PyInt_As_int32_t(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_signed__char(signed char value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE signed char __Pyx_PyInt_As_signed__char(PyObject *);
 
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int32_t(int32_t value);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile__close(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile_flush(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 
 /* Module declarations from 'libc.stdint' */
 
 /* Module declarations from '_hadoopy_typedbytes' */
 static PyTypeObject *__pyx_ptype_19_hadoopy_typedbytes_TypedBytesFile = 0;
+static char *__pyx_v_19_hadoopy_typedbytes__unicode_buf;
+static int32_t __pyx_v_19_hadoopy_typedbytes__unicode_buf_size;
 static CYTHON_INLINE int32_t __pyx_f_19_hadoopy_typedbytes__read_int(void *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__raw_write_int(void *, PyObject *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *, PyObject *); /*proto*/
@@ -561,6 +1504,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_byte(void *);
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bool(void *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_bool(void *, PyObject *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bytes(void *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__decode_utf8(char *, int32_t); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_unicode(void *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_bytes(void *, PyObject *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_unicode(void *, PyObject *); /*proto*/
@@ -577,143 +1521,185 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *); /*proto*/
 static PyObject *__pyx_f_19_hadoopy_typedbytes___read_key_value_tb(void *); /*proto*/
 static PyObject *__pyx_f_19_hadoopy_typedbytes___write_key_value_tb(void *, PyObject *); /*proto*/
 #define __Pyx_MODULE_NAME "_hadoopy_typedbytes"
+extern int __pyx_module_is_main__hadoopy_typedbytes;
 int __pyx_module_is_main__hadoopy_typedbytes = 0;
 
 /* Implementation of '_hadoopy_typedbytes' */
 static PyObject *__pyx_builtin_OverflowError;
 static PyObject *__pyx_builtin_UnicodeError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_StopIteration;
 static PyObject *__pyx_builtin_KeyError;
 static PyObject *__pyx_builtin_IndexError;
 static PyObject *__pyx_builtin_IOError;
-static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_TypeError;
+static const char __pyx_k_n[] = "n";
+static const char __pyx_k_r[] = "r";
+static const char __pyx_k_fn[] = "fn";
+static const char __pyx_k_kv[] = "kv";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_mode[] = "mode";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_type[] = "type";
+static const char __pyx_k_dumps[] = "dumps";
+static const char __pyx_k_flush[] = "flush";
+static const char __pyx_k_loads[] = "loads";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_types[] = "types";
+static const char __pyx_k_utf_8[] = "utf-8";
+static const char __pyx_k_value[] = "value";
+static const char __pyx_k_GPL_V3[] = "GPL V3";
+static const char __pyx_k_author[] = "__author__";
+static const char __pyx_k_encode[] = "encode";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_IOError[] = "IOError";
+static const char __pyx_k_IntType[] = "IntType";
+static const char __pyx_k_cPickle[] = "cPickle";
+static const char __pyx_k_license[] = "__license__";
+static const char __pyx_k_read_fd[] = "read_fd";
+static const char __pyx_k_read_tb[] = "read_tb";
+static const char __pyx_k_DictType[] = "DictType";
+static const char __pyx_k_KeyError[] = "KeyError";
+static const char __pyx_k_ListType[] = "ListType";
+static const char __pyx_k_LongType[] = "LongType";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_stdinout[] = "stdinout";
+static const char __pyx_k_write_fd[] = "write_fd";
+static const char __pyx_k_write_tb[] = "write_tb";
+static const char __pyx_k_FloatType[] = "FloatType";
+static const char __pyx_k_TupleType[] = "TupleType";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_iteritems[] = "iteritems";
+static const char __pyx_k_out_types[] = "_out_types";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_traceback[] = "traceback";
+static const char __pyx_k_IndexError[] = "IndexError";
+static const char __pyx_k_StringType[] = "StringType";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_Bad_index_d[] = "Bad index %d ";
+static const char __pyx_k_BooleanType[] = "BooleanType";
+static const char __pyx_k_MemoryError[] = "MemoryError";
+static const char __pyx_k_UnicodeType[] = "UnicodeType";
+static const char __pyx_k_UnicodeError[] = "UnicodeError";
+static const char __pyx_k_flush_writes[] = "flush_writes";
+static const char __pyx_k_readwritefds[] = "readwritefds";
+static const char __pyx_k_OverflowError[] = "OverflowError";
+static const char __pyx_k_StopIteration[] = "StopIteration";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_TypedBytesFile[] = "TypedBytesFile";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_read_buffer_size[] = "read_buffer_size";
+static const char __pyx_k_unbuffered_reads[] = "unbuffered_reads";
+static const char __pyx_k_write_buffer_size[] = "write_buffer_size";
+static const char __pyx_k_Cannot_open_file_s[] = "Cannot open file [%s]";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_hadoopy_typedbytes[] = "_hadoopy_typedbytes";
+static const char __pyx_k_Read_pointer_not_set[] = "Read pointer not set!";
+static const char __pyx_k_Write_pointer_not_set[] = "Write pointer not set!";
+static const char __pyx_k_TypedBytesFile_s_s_s_s[] = "TypedBytesFile(%s, %s, %s, %s)";
+static const char __pyx_k_hadoopy__typedbytes_pyx[] = "hadoopy/_typedbytes.pyx";
+static const char __pyx_k_Bad_unicode_string_size_d[] = "Bad unicode string size %d";
+static const char __pyx_k_Brandyn_A_White_bwhite_cs_umd_ed[] = "Brandyn A. White <bwhite@cs.umd.edu>";
+static const char __pyx_k_Error_decoding_unicode_string_Se[] = "Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.";
+static const char __pyx_k_self__read_ptr_self__write_ptr_c[] = "self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling";
+static PyObject *__pyx_kp_s_Bad_index_d;
+static PyObject *__pyx_kp_s_Bad_unicode_string_size_d;
+static PyObject *__pyx_n_s_BooleanType;
+static PyObject *__pyx_kp_s_Brandyn_A_White_bwhite_cs_umd_ed;
+static PyObject *__pyx_kp_s_Cannot_open_file_s;
+static PyObject *__pyx_n_s_DictType;
+static PyObject *__pyx_kp_s_Error_decoding_unicode_string_Se;
+static PyObject *__pyx_n_s_FloatType;
+static PyObject *__pyx_kp_s_GPL_V3;
+static PyObject *__pyx_n_s_IOError;
+static PyObject *__pyx_n_s_IndexError;
+static PyObject *__pyx_n_s_IntType;
+static PyObject *__pyx_n_s_KeyError;
+static PyObject *__pyx_n_s_ListType;
+static PyObject *__pyx_n_s_LongType;
+static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_n_s_OverflowError;
+static PyObject *__pyx_kp_s_Read_pointer_not_set;
+static PyObject *__pyx_n_s_StopIteration;
+static PyObject *__pyx_n_s_StringType;
+static PyObject *__pyx_n_s_TupleType;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_TypedBytesFile;
+static PyObject *__pyx_kp_s_TypedBytesFile_s_s_s_s;
+static PyObject *__pyx_n_s_UnicodeError;
+static PyObject *__pyx_n_s_UnicodeType;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_kp_s_Write_pointer_not_set;
+static PyObject *__pyx_n_s_author;
+static PyObject *__pyx_n_s_cPickle;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_dumps;
+static PyObject *__pyx_n_s_encode;
+static PyObject *__pyx_n_s_flush;
+static PyObject *__pyx_n_s_flush_writes;
+static PyObject *__pyx_n_s_fn;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_kp_s_hadoopy__typedbytes_pyx;
+static PyObject *__pyx_n_s_hadoopy_typedbytes;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_iteritems;
+static PyObject *__pyx_n_s_kv;
+static PyObject *__pyx_n_s_license;
+static PyObject *__pyx_n_s_loads;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_mode;
+static PyObject *__pyx_n_s_n;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_out_types;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_r;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_read_buffer_size;
+static PyObject *__pyx_n_s_read_fd;
+static PyObject *__pyx_n_s_read_tb;
+static PyObject *__pyx_n_s_readwritefds;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_kp_s_self__read_ptr_self__write_ptr_c;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_stdinout;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_traceback;
+static PyObject *__pyx_n_s_type;
+static PyObject *__pyx_n_s_types;
+static PyObject *__pyx_n_s_unbuffered_reads;
+static PyObject *__pyx_kp_s_utf_8;
+static PyObject *__pyx_n_s_value;
+static PyObject *__pyx_n_s_write_buffer_size;
+static PyObject *__pyx_n_s_write_fd;
+static PyObject *__pyx_n_s_write_tb;
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_read_tb(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_2write_tb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_kv); /* proto */
-static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_fn, PyObject *__pyx_v_mode, PyObject *__pyx_v_read_fd, PyObject *__pyx_v_write_fd, PyObject *__pyx_v_flush_writes, PyObject *__pyx_v_unbuffered_reads); /* proto */
+static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_fn, PyObject *__pyx_v_mode, PyObject *__pyx_v_read_fd, PyObject *__pyx_v_write_fd, PyObject *__pyx_v_flush_writes, PyObject *__pyx_v_unbuffered_reads, PyObject *__pyx_v_read_buffer_size, PyObject *__pyx_v_write_buffer_size); /* proto */
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_2__repr__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_4__enter__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_6__exit__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_type, CYTHON_UNUSED PyObject *__pyx_v_value, CYTHON_UNUSED PyObject *__pyx_v_traceback); /* proto */
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_8__del__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_10__iter__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_12__next__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14write(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kv); /* proto */
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16writes(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kvs); /* proto */
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18flush(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20close(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
-static char __pyx_k_1[] = "utf-8";
-static char __pyx_k_2[] = "Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.";
-static char __pyx_k_5[] = "Bad index %d ";
-static char __pyx_k_8[] = "TypedBytesFile(%s, %s, %s, %s)";
-static char __pyx_k_9[] = "Cannot open file [%s]";
-static char __pyx_k_10[] = "Read pointer not set!";
-static char __pyx_k_12[] = "Write pointer not set!";
-static char __pyx_k_15[] = "Brandyn A. White <bwhite@cs.umd.edu>";
-static char __pyx_k_16[] = "GPL V3";
-static char __pyx_k_18[] = "/home/brandyn/projects/hadoopy/hadoopy/_typedbytes.pyx";
-static char __pyx_k__r[] = "r";
-static char __pyx_k__w[] = "w";
-static char __pyx_k__fn[] = "fn";
-static char __pyx_k__kv[] = "kv";
-static char __pyx_k__mode[] = "mode";
-static char __pyx_k__type[] = "type";
-static char __pyx_k__dumps[] = "dumps";
-static char __pyx_k__flush[] = "flush";
-static char __pyx_k__loads[] = "loads";
-static char __pyx_k__range[] = "range";
-static char __pyx_k__types[] = "types";
-static char __pyx_k__value[] = "value";
-static char __pyx_k__encode[] = "encode";
-static char __pyx_k__pickle[] = "pickle";
-static char __pyx_k__IOError[] = "IOError";
-static char __pyx_k__IntType[] = "IntType";
-static char __pyx_k__cPickle[] = "cPickle";
-static char __pyx_k__read_fd[] = "read_fd";
-static char __pyx_k__read_tb[] = "read_tb";
-static char __pyx_k__DictType[] = "DictType";
-static char __pyx_k__KeyError[] = "KeyError";
-static char __pyx_k__ListType[] = "ListType";
-static char __pyx_k__LongType[] = "LongType";
-static char __pyx_k____main__[] = "__main__";
-static char __pyx_k____test__[] = "__test__";
-static char __pyx_k__stdinout[] = "stdinout";
-static char __pyx_k__write_fd[] = "write_fd";
-static char __pyx_k__write_tb[] = "write_tb";
-static char __pyx_k__FloatType[] = "FloatType";
-static char __pyx_k__TupleType[] = "TupleType";
-static char __pyx_k__iteritems[] = "iteritems";
-static char __pyx_k__traceback[] = "traceback";
-static char __pyx_k__IndexError[] = "IndexError";
-static char __pyx_k__StringType[] = "StringType";
-static char __pyx_k__ValueError[] = "ValueError";
-static char __pyx_k____author__[] = "__author__";
-static char __pyx_k___out_types[] = "_out_types";
-static char __pyx_k__BooleanType[] = "BooleanType";
-static char __pyx_k__UnicodeType[] = "UnicodeType";
-static char __pyx_k____license__[] = "__license__";
-static char __pyx_k__UnicodeError[] = "UnicodeError";
-static char __pyx_k__flush_writes[] = "flush_writes";
-static char __pyx_k__readwritefds[] = "readwritefds";
-static char __pyx_k__OverflowError[] = "OverflowError";
-static char __pyx_k__StopIteration[] = "StopIteration";
-static char __pyx_k__unbuffered_reads[] = "unbuffered_reads";
-static char __pyx_k___hadoopy_typedbytes[] = "_hadoopy_typedbytes";
-static PyObject *__pyx_kp_s_1;
-static PyObject *__pyx_kp_s_10;
-static PyObject *__pyx_kp_s_12;
-static PyObject *__pyx_kp_s_15;
-static PyObject *__pyx_kp_s_16;
-static PyObject *__pyx_kp_s_18;
-static PyObject *__pyx_kp_s_2;
-static PyObject *__pyx_kp_s_5;
-static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_kp_s_9;
-static PyObject *__pyx_n_s__BooleanType;
-static PyObject *__pyx_n_s__DictType;
-static PyObject *__pyx_n_s__FloatType;
-static PyObject *__pyx_n_s__IOError;
-static PyObject *__pyx_n_s__IndexError;
-static PyObject *__pyx_n_s__IntType;
-static PyObject *__pyx_n_s__KeyError;
-static PyObject *__pyx_n_s__ListType;
-static PyObject *__pyx_n_s__LongType;
-static PyObject *__pyx_n_s__OverflowError;
-static PyObject *__pyx_n_s__StopIteration;
-static PyObject *__pyx_n_s__StringType;
-static PyObject *__pyx_n_s__TupleType;
-static PyObject *__pyx_n_s__UnicodeError;
-static PyObject *__pyx_n_s__UnicodeType;
-static PyObject *__pyx_n_s__ValueError;
-static PyObject *__pyx_n_s____author__;
-static PyObject *__pyx_n_s____license__;
-static PyObject *__pyx_n_s____main__;
-static PyObject *__pyx_n_s____test__;
-static PyObject *__pyx_n_s___hadoopy_typedbytes;
-static PyObject *__pyx_n_s___out_types;
-static PyObject *__pyx_n_s__cPickle;
-static PyObject *__pyx_n_s__dumps;
-static PyObject *__pyx_n_s__encode;
-static PyObject *__pyx_n_s__flush;
-static PyObject *__pyx_n_s__flush_writes;
-static PyObject *__pyx_n_s__fn;
-static PyObject *__pyx_n_s__iteritems;
-static PyObject *__pyx_n_s__kv;
-static PyObject *__pyx_n_s__loads;
-static PyObject *__pyx_n_s__mode;
-static PyObject *__pyx_n_s__pickle;
-static PyObject *__pyx_n_s__r;
-static PyObject *__pyx_n_s__range;
-static PyObject *__pyx_n_s__read_fd;
-static PyObject *__pyx_n_s__read_tb;
-static PyObject *__pyx_n_s__readwritefds;
-static PyObject *__pyx_n_s__stdinout;
-static PyObject *__pyx_n_s__traceback;
-static PyObject *__pyx_n_s__type;
-static PyObject *__pyx_n_s__types;
-static PyObject *__pyx_n_s__unbuffered_reads;
-static PyObject *__pyx_n_s__value;
-static PyObject *__pyx_n_s__write_fd;
-static PyObject *__pyx_n_s__write_tb;
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14next_batch(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, int __pyx_v_n); /* proto */
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16write(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kv); /* proto */
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18writes(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kvs); /* proto */
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20flush(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_22close(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_19_hadoopy_typedbytes_TypedBytesFile(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_2;
 static PyObject *__pyx_int_3;
@@ -722,24 +1708,23 @@ static PyObject *__pyx_int_6;
 static PyObject *__pyx_int_7;
 static PyObject *__pyx_int_8;
 static PyObject *__pyx_int_9;
-static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_int_10;
 static PyObject *__pyx_int_2147483647;
+static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_int_neg_2147483648;
 static PyObject *__pyx_int_9223372036854775807L;
-static PyObject *__pyx_int_neg_9223372036854775808;
-static PyObject *__pyx_k_6;
-static PyObject *__pyx_k_7;
-static PyObject *__pyx_k_tuple_3;
-static PyObject *__pyx_k_tuple_4;
-static PyObject *__pyx_k_tuple_11;
-static PyObject *__pyx_k_tuple_13;
-static PyObject *__pyx_k_tuple_14;
-static PyObject *__pyx_k_tuple_19;
-static PyObject *__pyx_k_codeobj_17;
-static PyObject *__pyx_k_codeobj_20;
+static PyObject *__pyx_int_neg_9223372036854775808L;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_codeobj__6;
+static PyObject *__pyx_codeobj__8;
+/* Late includes */
 
-/* "hadoopy/_typedbytes.pyx":54
+/* "hadoopy/_typedbytes.pyx":57
  * 
  * 
  * cdef inline int32_t _read_int(void *fp):             # <<<<<<<<<<<<<<
@@ -753,16 +1738,16 @@ static CYTHON_INLINE int32_t __pyx_f_19_hadoopy_typedbytes__read_int(void *__pyx
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_read_int", 0);
 
-  /* "hadoopy/_typedbytes.pyx":64
+  /* "hadoopy/_typedbytes.pyx":67
  *     """
  *     cdef int32_t val
  *     fread(&val, 4, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  *     return _be32toh(val)
  * 
  */
-  fread((&__pyx_v_val), 4, 1, __pyx_v_fp);
+  (void)(fread((&__pyx_v_val), 4, 1, __pyx_v_fp));
 
-  /* "hadoopy/_typedbytes.pyx":65
+  /* "hadoopy/_typedbytes.pyx":68
  *     cdef int32_t val
  *     fread(&val, 4, 1, fp)  # = 1
  *     return _be32toh(val)             # <<<<<<<<<<<<<<
@@ -772,13 +1757,21 @@ static CYTHON_INLINE int32_t __pyx_f_19_hadoopy_typedbytes__read_int(void *__pyx
   __pyx_r = _be32toh(__pyx_v_val);
   goto __pyx_L0;
 
-  __pyx_r = 0;
+  /* "hadoopy/_typedbytes.pyx":57
+ * 
+ * 
+ * cdef inline int32_t _read_int(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read integer
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":68
+/* "hadoopy/_typedbytes.pyx":71
  * 
  * 
  * cdef inline _raw_write_int(void *fp, val):             # <<<<<<<<<<<<<<
@@ -796,17 +1789,17 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__raw_write_int(void
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_raw_write_int", 0);
 
-  /* "hadoopy/_typedbytes.pyx":77
+  /* "hadoopy/_typedbytes.pyx":80
  *         OverflowError: If val overflows an int
  *     """
  *     cdef int32_t cval = val             # <<<<<<<<<<<<<<
  *     cval = _htobe32(cval)
  *     fwrite(&cval, 4, 1, fp)  # = 1
  */
-  __pyx_t_1 = __Pyx_PyInt_from_py_int32_t(__pyx_v_val); if (unlikely((__pyx_t_1 == (int32_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int32_t(__pyx_v_val); if (unlikely((__pyx_t_1 == ((int32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 80, __pyx_L1_error)
   __pyx_v_cval = __pyx_t_1;
 
-  /* "hadoopy/_typedbytes.pyx":78
+  /* "hadoopy/_typedbytes.pyx":81
  *     """
  *     cdef int32_t cval = val
  *     cval = _htobe32(cval)             # <<<<<<<<<<<<<<
@@ -815,15 +1808,24 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__raw_write_int(void
  */
   __pyx_v_cval = _htobe32(__pyx_v_cval);
 
-  /* "hadoopy/_typedbytes.pyx":79
+  /* "hadoopy/_typedbytes.pyx":82
  *     cdef int32_t cval = val
  *     cval = _htobe32(cval)
  *     fwrite(&cval, 4, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_cval), 4, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_cval), 4, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":71
+ * 
+ * 
+ * cdef inline _raw_write_int(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write integer (used for sizes)
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -835,7 +1837,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__raw_write_int(void
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":82
+/* "hadoopy/_typedbytes.pyx":85
  * 
  * 
  * cdef inline _write_int(void *fp, val):             # <<<<<<<<<<<<<<
@@ -861,7 +1863,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_int", 0);
 
-  /* "hadoopy/_typedbytes.pyx":92
+  /* "hadoopy/_typedbytes.pyx":95
  *     """
  *     cdef int32_t cval
  *     try:             # <<<<<<<<<<<<<<
@@ -869,44 +1871,54 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *__
  *     except OverflowError:
  */
   {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
     __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
     __Pyx_XGOTREF(__pyx_t_1);
     __Pyx_XGOTREF(__pyx_t_2);
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "hadoopy/_typedbytes.pyx":93
+      /* "hadoopy/_typedbytes.pyx":96
  *     cdef int32_t cval
  *     try:
  *         cval = val             # <<<<<<<<<<<<<<
  *     except OverflowError:
  *         return _write_long(fp, val)
  */
-      __pyx_t_4 = __Pyx_PyInt_from_py_int32_t(__pyx_v_val); if (unlikely((__pyx_t_4 == (int32_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_t_4 = __Pyx_PyInt_As_int32_t(__pyx_v_val); if (unlikely((__pyx_t_4 == ((int32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 96, __pyx_L3_error)
       __pyx_v_cval = __pyx_t_4;
+
+      /* "hadoopy/_typedbytes.pyx":95
+ *     """
+ *     cdef int32_t cval
+ *     try:             # <<<<<<<<<<<<<<
+ *         cval = val
+ *     except OverflowError:
+ */
     }
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    goto __pyx_L10_try_end;
+    goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "hadoopy/_typedbytes.pyx":94
+    /* "hadoopy/_typedbytes.pyx":97
  *     try:
  *         cval = val
  *     except OverflowError:             # <<<<<<<<<<<<<<
  *         return _write_long(fp, val)
  *     cval = _htobe32(cval)
  */
-    __pyx_t_5 = PyErr_ExceptionMatches(__pyx_builtin_OverflowError);
+    __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_OverflowError);
     if (__pyx_t_5) {
       __Pyx_AddTraceback("_hadoopy_typedbytes._write_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      if (__Pyx_GetException(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8) < 0) __PYX_ERR(0, 97, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
       __Pyx_GOTREF(__pyx_t_8);
 
-      /* "hadoopy/_typedbytes.pyx":95
+      /* "hadoopy/_typedbytes.pyx":98
  *         cval = val
  *     except OverflowError:
  *         return _write_long(fp, val)             # <<<<<<<<<<<<<<
@@ -914,7 +1926,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *__
  *     fwrite(&cval, 4, 1, fp)  # = 1
  */
       __Pyx_XDECREF(__pyx_r);
-      __pyx_t_9 = __pyx_f_19_hadoopy_typedbytes__write_long(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __pyx_t_9 = __pyx_f_19_hadoopy_typedbytes__write_long(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 98, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_9);
       __pyx_r = __pyx_t_9;
       __pyx_t_9 = 0;
@@ -922,12 +1934,17 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *__
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       goto __pyx_L6_except_return;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      goto __pyx_L4_exception_handled;
     }
+    goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
+
+    /* "hadoopy/_typedbytes.pyx":95
+ *     """
+ *     cdef int32_t cval
+ *     try:             # <<<<<<<<<<<<<<
+ *         cval = val
+ *     except OverflowError:
+ */
     __Pyx_XGIVEREF(__pyx_t_1);
     __Pyx_XGIVEREF(__pyx_t_2);
     __Pyx_XGIVEREF(__pyx_t_3);
@@ -939,15 +1956,10 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *__
     __Pyx_XGIVEREF(__pyx_t_3);
     __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
     goto __pyx_L0;
-    __pyx_L4_exception_handled:;
-    __Pyx_XGIVEREF(__pyx_t_1);
-    __Pyx_XGIVEREF(__pyx_t_2);
-    __Pyx_XGIVEREF(__pyx_t_3);
-    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
-    __pyx_L10_try_end:;
+    __pyx_L8_try_end:;
   }
 
-  /* "hadoopy/_typedbytes.pyx":96
+  /* "hadoopy/_typedbytes.pyx":99
  *     except OverflowError:
  *         return _write_long(fp, val)
  *     cval = _htobe32(cval)             # <<<<<<<<<<<<<<
@@ -956,15 +1968,24 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *__
  */
   __pyx_v_cval = _htobe32(__pyx_v_cval);
 
-  /* "hadoopy/_typedbytes.pyx":97
+  /* "hadoopy/_typedbytes.pyx":100
  *         return _write_long(fp, val)
  *     cval = _htobe32(cval)
  *     fwrite(&cval, 4, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_cval), 4, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_cval), 4, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":85
+ * 
+ * 
+ * cdef inline _write_int(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write integer
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -980,7 +2001,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_int(void *__
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":100
+/* "hadoopy/_typedbytes.pyx":103
  * 
  * 
  * cdef inline int64_t _read_long(void *fp):             # <<<<<<<<<<<<<<
@@ -994,16 +2015,16 @@ static CYTHON_INLINE int64_t __pyx_f_19_hadoopy_typedbytes__read_long(void *__py
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_read_long", 0);
 
-  /* "hadoopy/_typedbytes.pyx":110
+  /* "hadoopy/_typedbytes.pyx":113
  *     """
  *     cdef int64_t val
  *     fread(&val, 8, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  *     return _be64toh(val)
  * 
  */
-  fread((&__pyx_v_val), 8, 1, __pyx_v_fp);
+  (void)(fread((&__pyx_v_val), 8, 1, __pyx_v_fp));
 
-  /* "hadoopy/_typedbytes.pyx":111
+  /* "hadoopy/_typedbytes.pyx":114
  *     cdef int64_t val
  *     fread(&val, 8, 1, fp)  # = 1
  *     return _be64toh(val)             # <<<<<<<<<<<<<<
@@ -1013,13 +2034,21 @@ static CYTHON_INLINE int64_t __pyx_f_19_hadoopy_typedbytes__read_long(void *__py
   __pyx_r = _be64toh(__pyx_v_val);
   goto __pyx_L0;
 
-  __pyx_r = 0;
+  /* "hadoopy/_typedbytes.pyx":103
+ * 
+ * 
+ * cdef inline int64_t _read_long(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read integer
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":114
+/* "hadoopy/_typedbytes.pyx":117
  * 
  * 
  * cdef inline _write_long(void *fp, val):             # <<<<<<<<<<<<<<
@@ -1037,17 +2066,17 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_long(void *_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_long", 0);
 
-  /* "hadoopy/_typedbytes.pyx":123
+  /* "hadoopy/_typedbytes.pyx":126
  *         val: Python int
  *     """
  *     cdef int64_t cval = val             # <<<<<<<<<<<<<<
  *     cval = _htobe64(cval)
  *     fwrite(&cval, 8, 1, fp)  # = 1
  */
-  __pyx_t_1 = __Pyx_PyInt_from_py_int64_t(__pyx_v_val); if (unlikely((__pyx_t_1 == (int64_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_int64_t(__pyx_v_val); if (unlikely((__pyx_t_1 == ((int64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 126, __pyx_L1_error)
   __pyx_v_cval = __pyx_t_1;
 
-  /* "hadoopy/_typedbytes.pyx":124
+  /* "hadoopy/_typedbytes.pyx":127
  *     """
  *     cdef int64_t cval = val
  *     cval = _htobe64(cval)             # <<<<<<<<<<<<<<
@@ -1056,15 +2085,24 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_long(void *_
  */
   __pyx_v_cval = _htobe64(__pyx_v_cval);
 
-  /* "hadoopy/_typedbytes.pyx":125
+  /* "hadoopy/_typedbytes.pyx":128
  *     cdef int64_t cval = val
  *     cval = _htobe64(cval)
  *     fwrite(&cval, 8, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_cval), 8, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_cval), 8, 1, __pyx_v_fp));
 
+  /* "hadoopy/_typedbytes.pyx":117
+ * 
+ * 
+ * cdef inline _write_long(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write long
+ * 
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -1076,7 +2114,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_long(void *_
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":128
+/* "hadoopy/_typedbytes.pyx":131
  * 
  * 
  * cdef inline float _read_float(void *fp):             # <<<<<<<<<<<<<<
@@ -1090,16 +2128,16 @@ static CYTHON_INLINE float __pyx_f_19_hadoopy_typedbytes__read_float(void *__pyx
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_read_float", 0);
 
-  /* "hadoopy/_typedbytes.pyx":138
+  /* "hadoopy/_typedbytes.pyx":141
  *     """
  *     cdef int32_t val
  *     fread(&val, 4, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  *     val = _be32toh(val)
  *     return (<float*>&val)[0]
  */
-  fread((&__pyx_v_val), 4, 1, __pyx_v_fp);
+  (void)(fread((&__pyx_v_val), 4, 1, __pyx_v_fp));
 
-  /* "hadoopy/_typedbytes.pyx":139
+  /* "hadoopy/_typedbytes.pyx":142
  *     cdef int32_t val
  *     fread(&val, 4, 1, fp)  # = 1
  *     val = _be32toh(val)             # <<<<<<<<<<<<<<
@@ -1108,7 +2146,7 @@ static CYTHON_INLINE float __pyx_f_19_hadoopy_typedbytes__read_float(void *__pyx
  */
   __pyx_v_val = _be32toh(__pyx_v_val);
 
-  /* "hadoopy/_typedbytes.pyx":140
+  /* "hadoopy/_typedbytes.pyx":143
  *     fread(&val, 4, 1, fp)  # = 1
  *     val = _be32toh(val)
  *     return (<float*>&val)[0]             # <<<<<<<<<<<<<<
@@ -1118,13 +2156,21 @@ static CYTHON_INLINE float __pyx_f_19_hadoopy_typedbytes__read_float(void *__pyx
   __pyx_r = (((float *)(&__pyx_v_val))[0]);
   goto __pyx_L0;
 
-  __pyx_r = 0;
+  /* "hadoopy/_typedbytes.pyx":131
+ * 
+ * 
+ * cdef inline float _read_float(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read float
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":143
+/* "hadoopy/_typedbytes.pyx":146
  * 
  * 
  * cdef inline _write_float(void *fp, val):             # <<<<<<<<<<<<<<
@@ -1143,17 +2189,17 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_float(void *
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_float", 0);
 
-  /* "hadoopy/_typedbytes.pyx":152
+  /* "hadoopy/_typedbytes.pyx":155
  *         val: Python float
  *     """
  *     cdef float cval = val             # <<<<<<<<<<<<<<
  *     cdef int32_t cvalo = _htobe32((<int32_t*>&cval)[0])
  *     fwrite(&cvalo, 4, 1, fp)  # = 1
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_val); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_val); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
   __pyx_v_cval = __pyx_t_1;
 
-  /* "hadoopy/_typedbytes.pyx":153
+  /* "hadoopy/_typedbytes.pyx":156
  *     """
  *     cdef float cval = val
  *     cdef int32_t cvalo = _htobe32((<int32_t*>&cval)[0])             # <<<<<<<<<<<<<<
@@ -1162,15 +2208,24 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_float(void *
  */
   __pyx_v_cvalo = _htobe32((((int32_t *)(&__pyx_v_cval))[0]));
 
-  /* "hadoopy/_typedbytes.pyx":154
+  /* "hadoopy/_typedbytes.pyx":157
  *     cdef float cval = val
  *     cdef int32_t cvalo = _htobe32((<int32_t*>&cval)[0])
  *     fwrite(&cvalo, 4, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_cvalo), 4, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_cvalo), 4, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":146
+ * 
+ * 
+ * cdef inline _write_float(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write float
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -1182,7 +2237,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_float(void *
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":157
+/* "hadoopy/_typedbytes.pyx":160
  * 
  * 
  * cdef inline double _read_double(void *fp):             # <<<<<<<<<<<<<<
@@ -1196,16 +2251,16 @@ static CYTHON_INLINE double __pyx_f_19_hadoopy_typedbytes__read_double(void *__p
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_read_double", 0);
 
-  /* "hadoopy/_typedbytes.pyx":167
+  /* "hadoopy/_typedbytes.pyx":170
  *     """
  *     cdef int64_t val
  *     fread(&val, 8, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  *     val = _be64toh(val)
  *     return (<double*>&val)[0]
  */
-  fread((&__pyx_v_val), 8, 1, __pyx_v_fp);
+  (void)(fread((&__pyx_v_val), 8, 1, __pyx_v_fp));
 
-  /* "hadoopy/_typedbytes.pyx":168
+  /* "hadoopy/_typedbytes.pyx":171
  *     cdef int64_t val
  *     fread(&val, 8, 1, fp)  # = 1
  *     val = _be64toh(val)             # <<<<<<<<<<<<<<
@@ -1214,7 +2269,7 @@ static CYTHON_INLINE double __pyx_f_19_hadoopy_typedbytes__read_double(void *__p
  */
   __pyx_v_val = _be64toh(__pyx_v_val);
 
-  /* "hadoopy/_typedbytes.pyx":169
+  /* "hadoopy/_typedbytes.pyx":172
  *     fread(&val, 8, 1, fp)  # = 1
  *     val = _be64toh(val)
  *     return (<double*>&val)[0]             # <<<<<<<<<<<<<<
@@ -1224,13 +2279,21 @@ static CYTHON_INLINE double __pyx_f_19_hadoopy_typedbytes__read_double(void *__p
   __pyx_r = (((double *)(&__pyx_v_val))[0]);
   goto __pyx_L0;
 
-  __pyx_r = 0;
+  /* "hadoopy/_typedbytes.pyx":160
+ * 
+ * 
+ * cdef inline double _read_double(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read double
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":172
+/* "hadoopy/_typedbytes.pyx":175
  * 
  * 
  * cdef inline _write_double(void *fp, val):             # <<<<<<<<<<<<<<
@@ -1249,17 +2312,17 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_double(void
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_double", 0);
 
-  /* "hadoopy/_typedbytes.pyx":181
+  /* "hadoopy/_typedbytes.pyx":184
  *         val: Python float
  *     """
  *     cdef double cval = val             # <<<<<<<<<<<<<<
  *     cdef int64_t cvalo = _htobe64((<int64_t*>&cval)[0])
  *     fwrite(&cvalo, 8, 1, fp)  # = 1
  */
-  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_v_val); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_v_val); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 184, __pyx_L1_error)
   __pyx_v_cval = __pyx_t_1;
 
-  /* "hadoopy/_typedbytes.pyx":182
+  /* "hadoopy/_typedbytes.pyx":185
  *     """
  *     cdef double cval = val
  *     cdef int64_t cvalo = _htobe64((<int64_t*>&cval)[0])             # <<<<<<<<<<<<<<
@@ -1268,15 +2331,24 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_double(void
  */
   __pyx_v_cvalo = _htobe64((((int64_t *)(&__pyx_v_cval))[0]));
 
-  /* "hadoopy/_typedbytes.pyx":183
+  /* "hadoopy/_typedbytes.pyx":186
  *     cdef double cval = val
  *     cdef int64_t cvalo = _htobe64((<int64_t*>&cval)[0])
  *     fwrite(&cvalo, 8, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_cvalo), 8, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_cvalo), 8, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":175
+ * 
+ * 
+ * cdef inline _write_double(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write double
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -1288,7 +2360,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_double(void
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":186
+/* "hadoopy/_typedbytes.pyx":189
  * 
  * 
  * cdef inline _read_byte(void *fp):             # <<<<<<<<<<<<<<
@@ -1307,16 +2379,16 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_byte(void *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_byte", 0);
 
-  /* "hadoopy/_typedbytes.pyx":196
+  /* "hadoopy/_typedbytes.pyx":199
  *     """
  *     cdef signed char val
  *     fread(&val, 1, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  *     return int(val)
  * 
  */
-  fread((&__pyx_v_val), 1, 1, __pyx_v_fp);
+  (void)(fread((&__pyx_v_val), 1, 1, __pyx_v_fp));
 
-  /* "hadoopy/_typedbytes.pyx":197
+  /* "hadoopy/_typedbytes.pyx":200
  *     cdef signed char val
  *     fread(&val, 1, 1, fp)  # = 1
  *     return int(val)             # <<<<<<<<<<<<<<
@@ -1324,22 +2396,24 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_byte(void *__
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_val); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_signed__char(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyInt_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)(&PyInt_Type))), ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":189
+ * 
+ * 
+ * cdef inline _read_byte(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read byte
+ * 
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
@@ -1351,7 +2425,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_byte(void *__
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":200
+/* "hadoopy/_typedbytes.pyx":203
  * 
  * 
  * cdef inline _write_byte(void *fp, val):             # <<<<<<<<<<<<<<
@@ -1369,25 +2443,34 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_byte(void *_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_byte", 0);
 
-  /* "hadoopy/_typedbytes.pyx":209
+  /* "hadoopy/_typedbytes.pyx":212
  *         val: Python int
  *     """
  *     cdef signed char cval = val             # <<<<<<<<<<<<<<
  *     fwrite(&cval, 1, 1, fp)  # = 1
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_AsSignedChar(__pyx_v_val); if (unlikely((__pyx_t_1 == (signed char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_signed__char(__pyx_v_val); if (unlikely((__pyx_t_1 == (signed char)-1) && PyErr_Occurred())) __PYX_ERR(0, 212, __pyx_L1_error)
   __pyx_v_cval = __pyx_t_1;
 
-  /* "hadoopy/_typedbytes.pyx":210
+  /* "hadoopy/_typedbytes.pyx":213
  *     """
  *     cdef signed char cval = val
  *     fwrite(&cval, 1, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_cval), 1, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_cval), 1, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":203
+ * 
+ * 
+ * cdef inline _write_byte(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write byte
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -1399,7 +2482,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_byte(void *_
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":213
+/* "hadoopy/_typedbytes.pyx":216
  * 
  * 
  * cdef inline _read_bool(void *fp):             # <<<<<<<<<<<<<<
@@ -1417,7 +2500,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bool(void *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_bool", 0);
 
-  /* "hadoopy/_typedbytes.pyx":222
+  /* "hadoopy/_typedbytes.pyx":225
  *         Python Bool
  *     """
  *     return bool(_read_byte(fp))             # <<<<<<<<<<<<<<
@@ -1425,18 +2508,25 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bool(void *__
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_byte(__pyx_v_fp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_byte(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyBool_FromLong((!(!__pyx_t_2))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyBool_FromLong((!(!__pyx_t_2))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":216
+ * 
+ * 
+ * cdef inline _read_bool(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read integer
+ * 
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("_hadoopy_typedbytes._read_bool", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -1447,7 +2537,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bool(void *__
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":225
+/* "hadoopy/_typedbytes.pyx":228
  * 
  * 
  * cdef inline _write_bool(void *fp, val):             # <<<<<<<<<<<<<<
@@ -1465,25 +2555,34 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_bool(void *_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_bool", 0);
 
-  /* "hadoopy/_typedbytes.pyx":234
+  /* "hadoopy/_typedbytes.pyx":237
  *         val: Python bool
  *     """
  *     cdef signed char cval = val             # <<<<<<<<<<<<<<
  *     fwrite(&cval, 1, 1, fp)  # = 1
  * 
  */
-  __pyx_t_1 = __Pyx_PyInt_AsSignedChar(__pyx_v_val); if (unlikely((__pyx_t_1 == (signed char)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_signed__char(__pyx_v_val); if (unlikely((__pyx_t_1 == (signed char)-1) && PyErr_Occurred())) __PYX_ERR(0, 237, __pyx_L1_error)
   __pyx_v_cval = __pyx_t_1;
 
-  /* "hadoopy/_typedbytes.pyx":235
+  /* "hadoopy/_typedbytes.pyx":238
  *     """
  *     cdef signed char cval = val
  *     fwrite(&cval, 1, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_cval), 1, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_cval), 1, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":228
+ * 
+ * 
+ * cdef inline _write_bool(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write bool
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -1495,7 +2594,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_bool(void *_
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":238
+/* "hadoopy/_typedbytes.pyx":241
  * 
  * 
  * cdef inline _read_bytes(void *fp):             # <<<<<<<<<<<<<<
@@ -1505,7 +2604,6 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_bool(void *_
 
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bytes(void *__pyx_v_fp) {
   int32_t __pyx_v_sz;
-  char *__pyx_v_bytes;
   PyObject *__pyx_v_out = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -1515,57 +2613,39 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bytes(void *_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_bytes", 0);
 
-  /* "hadoopy/_typedbytes.pyx":247
+  /* "hadoopy/_typedbytes.pyx":250
  *         Python string of bytes
  *     """
- *     sz = _read_int(fp)             # <<<<<<<<<<<<<<
- *     cdef char *bytes = <char*>malloc(sz)
- *     fread(bytes, sz, 1, fp)  # = 1
+ *     cdef int32_t sz = _read_int(fp)             # <<<<<<<<<<<<<<
+ *     # Read directly into the new string, no temporary buffer
+ *     out = PyString_FromStringAndSize(NULL, sz)
  */
   __pyx_v_sz = __pyx_f_19_hadoopy_typedbytes__read_int(__pyx_v_fp);
 
-  /* "hadoopy/_typedbytes.pyx":248
- *     """
- *     sz = _read_int(fp)
- *     cdef char *bytes = <char*>malloc(sz)             # <<<<<<<<<<<<<<
- *     fread(bytes, sz, 1, fp)  # = 1
- *     out = PyString_FromStringAndSize(bytes, sz)
- */
-  __pyx_v_bytes = ((char *)malloc(__pyx_v_sz));
-
-  /* "hadoopy/_typedbytes.pyx":249
- *     sz = _read_int(fp)
- *     cdef char *bytes = <char*>malloc(sz)
- *     fread(bytes, sz, 1, fp)  # = 1             # <<<<<<<<<<<<<<
- *     out = PyString_FromStringAndSize(bytes, sz)
- *     free(bytes)
- */
-  fread(__pyx_v_bytes, __pyx_v_sz, 1, __pyx_v_fp);
-
-  /* "hadoopy/_typedbytes.pyx":250
- *     cdef char *bytes = <char*>malloc(sz)
- *     fread(bytes, sz, 1, fp)  # = 1
- *     out = PyString_FromStringAndSize(bytes, sz)             # <<<<<<<<<<<<<<
- *     free(bytes)
+  /* "hadoopy/_typedbytes.pyx":252
+ *     cdef int32_t sz = _read_int(fp)
+ *     # Read directly into the new string, no temporary buffer
+ *     out = PyString_FromStringAndSize(NULL, sz)             # <<<<<<<<<<<<<<
+ *     fread(PyString_AS_STRING(out), sz, 1, fp)  # = 1
  *     return out
  */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_bytes, __pyx_v_sz); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyString_FromStringAndSize(NULL, __pyx_v_sz); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_out = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":251
- *     fread(bytes, sz, 1, fp)  # = 1
- *     out = PyString_FromStringAndSize(bytes, sz)
- *     free(bytes)             # <<<<<<<<<<<<<<
+  /* "hadoopy/_typedbytes.pyx":253
+ *     # Read directly into the new string, no temporary buffer
+ *     out = PyString_FromStringAndSize(NULL, sz)
+ *     fread(PyString_AS_STRING(out), sz, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  *     return out
  * 
  */
-  free(__pyx_v_bytes);
+  (void)(fread(PyString_AS_STRING(__pyx_v_out), __pyx_v_sz, 1, __pyx_v_fp));
 
-  /* "hadoopy/_typedbytes.pyx":252
- *     out = PyString_FromStringAndSize(bytes, sz)
- *     free(bytes)
+  /* "hadoopy/_typedbytes.pyx":254
+ *     out = PyString_FromStringAndSize(NULL, sz)
+ *     fread(PyString_AS_STRING(out), sz, 1, fp)  # = 1
  *     return out             # <<<<<<<<<<<<<<
  * 
  * 
@@ -1575,8 +2655,15 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bytes(void *_
   __pyx_r = __pyx_v_out;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":241
+ * 
+ * 
+ * cdef inline _read_bytes(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read bytes
+ * 
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("_hadoopy_typedbytes._read_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -1588,195 +2675,479 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_bytes(void *_
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":256
+/* "hadoopy/_typedbytes.pyx":263
  * 
- * # NOTE(brandyn): This is incompatible with Dumbo's typedbytes as strings and unicode both go to string
- * cdef inline _read_unicode(void *fp):             # <<<<<<<<<<<<<<
- *     """Read bytes
  * 
+ * cdef inline _decode_utf8(char *buf, int32_t sz):             # <<<<<<<<<<<<<<
+ *     try:
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
  */
 
-static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_unicode(void *__pyx_v_fp) {
-  int32_t __pyx_v_sz;
-  char *__pyx_v_bytes;
-  PyObject *__pyx_v_out = NULL;
+static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__decode_utf8(char *__pyx_v_buf, int32_t __pyx_v_sz) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_read_unicode", 0);
-
-  /* "hadoopy/_typedbytes.pyx":265
- *         Python unicode
- *     """
- *     sz = _read_int(fp)             # <<<<<<<<<<<<<<
- *     cdef char *bytes = <char*>malloc(sz)
- *     fread(bytes, sz, 1, fp)  # = 1
- */
-  __pyx_v_sz = __pyx_f_19_hadoopy_typedbytes__read_int(__pyx_v_fp);
-
-  /* "hadoopy/_typedbytes.pyx":266
- *     """
- *     sz = _read_int(fp)
- *     cdef char *bytes = <char*>malloc(sz)             # <<<<<<<<<<<<<<
- *     fread(bytes, sz, 1, fp)  # = 1
- *     out = PyString_FromStringAndSize(bytes, sz)
- */
-  __pyx_v_bytes = ((char *)malloc(__pyx_v_sz));
-
-  /* "hadoopy/_typedbytes.pyx":267
- *     sz = _read_int(fp)
- *     cdef char *bytes = <char*>malloc(sz)
- *     fread(bytes, sz, 1, fp)  # = 1             # <<<<<<<<<<<<<<
- *     out = PyString_FromStringAndSize(bytes, sz)
- *     free(bytes)
- */
-  fread(__pyx_v_bytes, __pyx_v_sz, 1, __pyx_v_fp);
-
-  /* "hadoopy/_typedbytes.pyx":268
- *     cdef char *bytes = <char*>malloc(sz)
- *     fread(bytes, sz, 1, fp)  # = 1
- *     out = PyString_FromStringAndSize(bytes, sz)             # <<<<<<<<<<<<<<
- *     free(bytes)
- *     try:
- */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_bytes, __pyx_v_sz); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_out = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "hadoopy/_typedbytes.pyx":269
- *     fread(bytes, sz, 1, fp)  # = 1
- *     out = PyString_FromStringAndSize(bytes, sz)
- *     free(bytes)             # <<<<<<<<<<<<<<
- *     try:
- *         return unicode(out, 'utf-8')
- */
-  free(__pyx_v_bytes);
+  __Pyx_RefNannySetupContext("_decode_utf8", 0);
 
-  /* "hadoopy/_typedbytes.pyx":270
- *     out = PyString_FromStringAndSize(bytes, sz)
- *     free(bytes)
+  /* "hadoopy/_typedbytes.pyx":264
+ * 
+ * cdef inline _decode_utf8(char *buf, int32_t sz):
  *     try:             # <<<<<<<<<<<<<<
- *         return unicode(out, 'utf-8')
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
  *     except UnicodeError:
  */
   {
-    __Pyx_ExceptionSave(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4);
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
     __Pyx_XGOTREF(__pyx_t_2);
     __Pyx_XGOTREF(__pyx_t_3);
-    __Pyx_XGOTREF(__pyx_t_4);
     /*try:*/ {
 
-      /* "hadoopy/_typedbytes.pyx":271
- *     free(bytes)
+      /* "hadoopy/_typedbytes.pyx":265
+ * cdef inline _decode_utf8(char *buf, int32_t sz):
  *     try:
- *         return unicode(out, 'utf-8')             # <<<<<<<<<<<<<<
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)             # <<<<<<<<<<<<<<
  *     except UnicodeError:
  *         raise UnicodeError('Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.')
  */
       __Pyx_XDECREF(__pyx_r);
-      __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_INCREF(__pyx_v_out);
-      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_out);
-      __Pyx_GIVEREF(__pyx_v_out);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-      PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_kp_s_1));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-      __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)(&PyUnicode_Type))), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-      __pyx_r = __pyx_t_5;
-      __pyx_t_5 = 0;
+      __pyx_t_4 = PyUnicode_DecodeUTF8(__pyx_v_buf, __pyx_v_sz, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 265, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_r = __pyx_t_4;
+      __pyx_t_4 = 0;
       goto __pyx_L7_try_return;
+
+      /* "hadoopy/_typedbytes.pyx":264
+ * 
+ * cdef inline _decode_utf8(char *buf, int32_t sz):
+ *     try:             # <<<<<<<<<<<<<<
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
+ *     except UnicodeError:
+ */
     }
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    goto __pyx_L10_try_end;
-    __pyx_L7_try_return:;
-    __Pyx_XGIVEREF(__pyx_t_2);
-    __Pyx_XGIVEREF(__pyx_t_3);
-    __Pyx_XGIVEREF(__pyx_t_4);
-    __Pyx_ExceptionReset(__pyx_t_2, __pyx_t_3, __pyx_t_4);
-    goto __pyx_L0;
     __pyx_L3_error:;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":272
+    /* "hadoopy/_typedbytes.pyx":266
  *     try:
- *         return unicode(out, 'utf-8')
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
  *     except UnicodeError:             # <<<<<<<<<<<<<<
  *         raise UnicodeError('Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.')
  * 
  */
-    __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_UnicodeError);
-    if (__pyx_t_6) {
-      __Pyx_AddTraceback("_hadoopy_typedbytes._read_unicode", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_1, &__pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeError);
+    if (__pyx_t_5) {
+      __Pyx_AddTraceback("_hadoopy_typedbytes._decode_utf8", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(0, 266, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "hadoopy/_typedbytes.pyx":273
- *         return unicode(out, 'utf-8')
+      /* "hadoopy/_typedbytes.pyx":267
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
  *     except UnicodeError:
  *         raise UnicodeError('Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-      __pyx_t_8 = PyObject_Call(__pyx_builtin_UnicodeError, ((PyObject *)__pyx_k_tuple_3), NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_UnicodeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 267, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      goto __pyx_L4_exception_handled;
+      __PYX_ERR(0, 267, __pyx_L5_except_error)
     }
+    goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
+
+    /* "hadoopy/_typedbytes.pyx":264
+ * 
+ * cdef inline _decode_utf8(char *buf, int32_t sz):
+ *     try:             # <<<<<<<<<<<<<<
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
+ *     except UnicodeError:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
     __Pyx_XGIVEREF(__pyx_t_2);
     __Pyx_XGIVEREF(__pyx_t_3);
-    __Pyx_XGIVEREF(__pyx_t_4);
-    __Pyx_ExceptionReset(__pyx_t_2, __pyx_t_3, __pyx_t_4);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
     goto __pyx_L1_error;
-    __pyx_L4_exception_handled:;
+    __pyx_L7_try_return:;
+    __Pyx_XGIVEREF(__pyx_t_1);
     __Pyx_XGIVEREF(__pyx_t_2);
     __Pyx_XGIVEREF(__pyx_t_3);
-    __Pyx_XGIVEREF(__pyx_t_4);
-    __Pyx_ExceptionReset(__pyx_t_2, __pyx_t_3, __pyx_t_4);
-    __pyx_L10_try_end:;
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L0;
   }
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":263
+ * 
+ * 
+ * cdef inline _decode_utf8(char *buf, int32_t sz):             # <<<<<<<<<<<<<<
+ *     try:
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("_hadoopy_typedbytes._decode_utf8", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hadoopy/_typedbytes.pyx":271
+ * 
+ * # NOTE(brandyn): This is incompatible with Dumbo's typedbytes as strings and unicode both go to string
+ * cdef inline _read_unicode(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read bytes
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_unicode(void *__pyx_v_fp) {
+  int32_t __pyx_v_sz;
+  char *__pyx_v_buf;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  char const *__pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_read_unicode", 0);
+
+  /* "hadoopy/_typedbytes.pyx":281
+ *     """
+ *     global _unicode_buf, _unicode_buf_size
+ *     cdef int32_t sz = _read_int(fp)             # <<<<<<<<<<<<<<
+ *     cdef char *buf
+ *     if sz < 0:
+ */
+  __pyx_v_sz = __pyx_f_19_hadoopy_typedbytes__read_int(__pyx_v_fp);
+
+  /* "hadoopy/_typedbytes.pyx":283
+ *     cdef int32_t sz = _read_int(fp)
+ *     cdef char *buf
+ *     if sz < 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Bad unicode string size %d' % sz)
+ *     if sz > _UNICODE_BUF_MAX:
+ */
+  __pyx_t_1 = ((__pyx_v_sz < 0) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "hadoopy/_typedbytes.pyx":284
+ *     cdef char *buf
+ *     if sz < 0:
+ *         raise ValueError('Bad unicode string size %d' % sz)             # <<<<<<<<<<<<<<
+ *     if sz > _UNICODE_BUF_MAX:
+ *         # Too large to keep around, use a buffer for just this string
+ */
+    __pyx_t_2 = __Pyx_PyInt_From_int32_t(__pyx_v_sz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_Bad_unicode_string_size_d, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 284, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":283
+ *     cdef int32_t sz = _read_int(fp)
+ *     cdef char *buf
+ *     if sz < 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError('Bad unicode string size %d' % sz)
+ *     if sz > _UNICODE_BUF_MAX:
+ */
+  }
+
+  /* "hadoopy/_typedbytes.pyx":285
+ *     if sz < 0:
+ *         raise ValueError('Bad unicode string size %d' % sz)
+ *     if sz > _UNICODE_BUF_MAX:             # <<<<<<<<<<<<<<
+ *         # Too large to keep around, use a buffer for just this string
+ *         buf = <char*>malloc(sz)
+ */
+  __pyx_t_1 = ((__pyx_v_sz > 0x100000) != 0);
+  if (__pyx_t_1) {
+
+    /* "hadoopy/_typedbytes.pyx":287
+ *     if sz > _UNICODE_BUF_MAX:
+ *         # Too large to keep around, use a buffer for just this string
+ *         buf = <char*>malloc(sz)             # <<<<<<<<<<<<<<
+ *         if buf == NULL:
+ *             raise MemoryError
+ */
+    __pyx_v_buf = ((char *)malloc(__pyx_v_sz));
+
+    /* "hadoopy/_typedbytes.pyx":288
+ *         # Too large to keep around, use a buffer for just this string
+ *         buf = <char*>malloc(sz)
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         try:
+ */
+    __pyx_t_1 = ((__pyx_v_buf == NULL) != 0);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "hadoopy/_typedbytes.pyx":289
+ *         buf = <char*>malloc(sz)
+ *         if buf == NULL:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ *         try:
+ *             fread(buf, sz, 1, fp)  # = 1
+ */
+      PyErr_NoMemory(); __PYX_ERR(0, 289, __pyx_L1_error)
+
+      /* "hadoopy/_typedbytes.pyx":288
+ *         # Too large to keep around, use a buffer for just this string
+ *         buf = <char*>malloc(sz)
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         try:
+ */
+    }
+
+    /* "hadoopy/_typedbytes.pyx":290
+ *         if buf == NULL:
+ *             raise MemoryError
+ *         try:             # <<<<<<<<<<<<<<
+ *             fread(buf, sz, 1, fp)  # = 1
+ *             return _decode_utf8(buf, sz)
+ */
+    /*try:*/ {
+
+      /* "hadoopy/_typedbytes.pyx":291
+ *             raise MemoryError
+ *         try:
+ *             fread(buf, sz, 1, fp)  # = 1             # <<<<<<<<<<<<<<
+ *             return _decode_utf8(buf, sz)
+ *         finally:
+ */
+      (void)(fread(__pyx_v_buf, __pyx_v_sz, 1, __pyx_v_fp));
+
+      /* "hadoopy/_typedbytes.pyx":292
+ *         try:
+ *             fread(buf, sz, 1, fp)  # = 1
+ *             return _decode_utf8(buf, sz)             # <<<<<<<<<<<<<<
+ *         finally:
+ *             free(buf)
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__decode_utf8(__pyx_v_buf, __pyx_v_sz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 292, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_r = __pyx_t_2;
+      __pyx_t_2 = 0;
+      goto __pyx_L6_return;
+    }
+
+    /* "hadoopy/_typedbytes.pyx":294
+ *             return _decode_utf8(buf, sz)
+ *         finally:
+ *             free(buf)             # <<<<<<<<<<<<<<
+ *     if sz > _unicode_buf_size:
+ *         buf = <char*>realloc(_unicode_buf, sz)
+ */
+    /*finally:*/ {
+      __pyx_L7_error:;
+      /*exception exit:*/{
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
+        if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9) < 0)) __Pyx_ErrFetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_9);
+        __Pyx_XGOTREF(__pyx_t_10);
+        __Pyx_XGOTREF(__pyx_t_11);
+        __Pyx_XGOTREF(__pyx_t_12);
+        __pyx_t_4 = __pyx_lineno; __pyx_t_5 = __pyx_clineno; __pyx_t_6 = __pyx_filename;
+        {
+          free(__pyx_v_buf);
+        }
+        if (PY_MAJOR_VERSION >= 3) {
+          __Pyx_XGIVEREF(__pyx_t_10);
+          __Pyx_XGIVEREF(__pyx_t_11);
+          __Pyx_XGIVEREF(__pyx_t_12);
+          __Pyx_ExceptionReset(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+        }
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ErrRestore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0;
+        __pyx_lineno = __pyx_t_4; __pyx_clineno = __pyx_t_5; __pyx_filename = __pyx_t_6;
+        goto __pyx_L1_error;
+      }
+      __pyx_L6_return: {
+        __pyx_t_12 = __pyx_r;
+        __pyx_r = 0;
+        free(__pyx_v_buf);
+        __pyx_r = __pyx_t_12;
+        __pyx_t_12 = 0;
+        goto __pyx_L0;
+      }
+    }
+
+    /* "hadoopy/_typedbytes.pyx":285
+ *     if sz < 0:
+ *         raise ValueError('Bad unicode string size %d' % sz)
+ *     if sz > _UNICODE_BUF_MAX:             # <<<<<<<<<<<<<<
+ *         # Too large to keep around, use a buffer for just this string
+ *         buf = <char*>malloc(sz)
+ */
+  }
+
+  /* "hadoopy/_typedbytes.pyx":295
+ *         finally:
+ *             free(buf)
+ *     if sz > _unicode_buf_size:             # <<<<<<<<<<<<<<
+ *         buf = <char*>realloc(_unicode_buf, sz)
+ *         if buf == NULL:
+ */
+  __pyx_t_1 = ((__pyx_v_sz > __pyx_v_19_hadoopy_typedbytes__unicode_buf_size) != 0);
+  if (__pyx_t_1) {
+
+    /* "hadoopy/_typedbytes.pyx":296
+ *             free(buf)
+ *     if sz > _unicode_buf_size:
+ *         buf = <char*>realloc(_unicode_buf, sz)             # <<<<<<<<<<<<<<
+ *         if buf == NULL:
+ *             raise MemoryError
+ */
+    __pyx_v_buf = ((char *)realloc(__pyx_v_19_hadoopy_typedbytes__unicode_buf, __pyx_v_sz));
+
+    /* "hadoopy/_typedbytes.pyx":297
+ *     if sz > _unicode_buf_size:
+ *         buf = <char*>realloc(_unicode_buf, sz)
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         _unicode_buf = buf
+ */
+    __pyx_t_1 = ((__pyx_v_buf == NULL) != 0);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "hadoopy/_typedbytes.pyx":298
+ *         buf = <char*>realloc(_unicode_buf, sz)
+ *         if buf == NULL:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ *         _unicode_buf = buf
+ *         _unicode_buf_size = sz
+ */
+      PyErr_NoMemory(); __PYX_ERR(0, 298, __pyx_L1_error)
+
+      /* "hadoopy/_typedbytes.pyx":297
+ *     if sz > _unicode_buf_size:
+ *         buf = <char*>realloc(_unicode_buf, sz)
+ *         if buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         _unicode_buf = buf
+ */
+    }
+
+    /* "hadoopy/_typedbytes.pyx":299
+ *         if buf == NULL:
+ *             raise MemoryError
+ *         _unicode_buf = buf             # <<<<<<<<<<<<<<
+ *         _unicode_buf_size = sz
+ *     fread(_unicode_buf, sz, 1, fp)  # = 1
+ */
+    __pyx_v_19_hadoopy_typedbytes__unicode_buf = __pyx_v_buf;
+
+    /* "hadoopy/_typedbytes.pyx":300
+ *             raise MemoryError
+ *         _unicode_buf = buf
+ *         _unicode_buf_size = sz             # <<<<<<<<<<<<<<
+ *     fread(_unicode_buf, sz, 1, fp)  # = 1
+ *     # Decode from the reused buffer, no temporary str per value
+ */
+    __pyx_v_19_hadoopy_typedbytes__unicode_buf_size = __pyx_v_sz;
+
+    /* "hadoopy/_typedbytes.pyx":295
+ *         finally:
+ *             free(buf)
+ *     if sz > _unicode_buf_size:             # <<<<<<<<<<<<<<
+ *         buf = <char*>realloc(_unicode_buf, sz)
+ *         if buf == NULL:
+ */
+  }
+
+  /* "hadoopy/_typedbytes.pyx":301
+ *         _unicode_buf = buf
+ *         _unicode_buf_size = sz
+ *     fread(_unicode_buf, sz, 1, fp)  # = 1             # <<<<<<<<<<<<<<
+ *     # Decode from the reused buffer, no temporary str per value
+ *     return _decode_utf8(_unicode_buf, sz)
+ */
+  (void)(fread(__pyx_v_19_hadoopy_typedbytes__unicode_buf, __pyx_v_sz, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":303
+ *     fread(_unicode_buf, sz, 1, fp)  # = 1
+ *     # Decode from the reused buffer, no temporary str per value
+ *     return _decode_utf8(_unicode_buf, sz)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__decode_utf8(__pyx_v_19_hadoopy_typedbytes__unicode_buf, __pyx_v_sz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "hadoopy/_typedbytes.pyx":271
+ * 
+ * # NOTE(brandyn): This is incompatible with Dumbo's typedbytes as strings and unicode both go to string
+ * cdef inline _read_unicode(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read bytes
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_AddTraceback("_hadoopy_typedbytes._read_unicode", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_out);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":276
+/* "hadoopy/_typedbytes.pyx":306
  * 
  * 
  * cdef inline _write_bytes(void *fp, val):             # <<<<<<<<<<<<<<
@@ -1796,38 +3167,47 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_bytes(void *
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_bytes", 0);
 
-  /* "hadoopy/_typedbytes.pyx":287
+  /* "hadoopy/_typedbytes.pyx":317
  *     cdef char *bytes
  *     cdef Py_ssize_t sz
  *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1             # <<<<<<<<<<<<<<
  *     _raw_write_int(fp, sz)
  *     fwrite(bytes, sz, 1, fp)  # = 1
  */
-  PyString_AsStringAndSize(__pyx_v_val, (&__pyx_v_bytes), (&__pyx_v_sz));
+  (void)(PyString_AsStringAndSize(__pyx_v_val, (&__pyx_v_bytes), (&__pyx_v_sz)));
 
-  /* "hadoopy/_typedbytes.pyx":288
+  /* "hadoopy/_typedbytes.pyx":318
  *     cdef Py_ssize_t sz
  *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1
  *     _raw_write_int(fp, sz)             # <<<<<<<<<<<<<<
  *     fwrite(bytes, sz, 1, fp)  # = 1
  * 
  */
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_sz); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_sz); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 318, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":289
+  /* "hadoopy/_typedbytes.pyx":319
  *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1
  *     _raw_write_int(fp, sz)
  *     fwrite(bytes, sz, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite(__pyx_v_bytes, __pyx_v_sz, 1, __pyx_v_fp);
+  (void)(fwrite(__pyx_v_bytes, __pyx_v_sz, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":306
+ * 
+ * 
+ * cdef inline _write_bytes(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write bytes
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -1841,7 +3221,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_bytes(void *
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":292
+/* "hadoopy/_typedbytes.pyx":322
  * 
  * 
  * cdef inline _write_unicode(void *fp, val):             # <<<<<<<<<<<<<<
@@ -1856,65 +3236,87 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_unicode(void
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_unicode", 0);
   __Pyx_INCREF(__pyx_v_val);
 
-  /* "hadoopy/_typedbytes.pyx":303
+  /* "hadoopy/_typedbytes.pyx":333
  *     cdef char *bytes
  *     cdef Py_ssize_t sz
  *     val = val.encode('utf-8')             # <<<<<<<<<<<<<<
  *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1
  *     _raw_write_int(fp, sz)
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_val, __pyx_n_s__encode); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_k_tuple_4), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_val, __pyx_n_s_encode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 333, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_v_val);
-  __pyx_v_val = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_s_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_s_utf_8);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF_SET(__pyx_v_val, __pyx_t_1);
+  __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":304
+  /* "hadoopy/_typedbytes.pyx":334
  *     cdef Py_ssize_t sz
  *     val = val.encode('utf-8')
  *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1             # <<<<<<<<<<<<<<
  *     _raw_write_int(fp, sz)
  *     fwrite(bytes, sz, 1, fp)  # = 1
  */
-  PyString_AsStringAndSize(__pyx_v_val, (&__pyx_v_bytes), (&__pyx_v_sz));
+  (void)(PyString_AsStringAndSize(__pyx_v_val, (&__pyx_v_bytes), (&__pyx_v_sz)));
 
-  /* "hadoopy/_typedbytes.pyx":305
+  /* "hadoopy/_typedbytes.pyx":335
  *     val = val.encode('utf-8')
  *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1
  *     _raw_write_int(fp, sz)             # <<<<<<<<<<<<<<
  *     fwrite(bytes, sz, 1, fp)  # = 1
  * 
  */
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_sz); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_sz); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 335, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":306
+  /* "hadoopy/_typedbytes.pyx":336
  *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1
  *     _raw_write_int(fp, sz)
  *     fwrite(bytes, sz, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite(__pyx_v_bytes, __pyx_v_sz, 1, __pyx_v_fp);
+  (void)(fwrite(__pyx_v_bytes, __pyx_v_sz, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":322
+ * 
+ * 
+ * cdef inline _write_unicode(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write bytes
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_AddTraceback("_hadoopy_typedbytes._write_unicode", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -1924,7 +3326,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_unicode(void
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":309
+/* "hadoopy/_typedbytes.pyx":339
  * 
  * 
  * cdef inline _read_vector(void *fp):             # <<<<<<<<<<<<<<
@@ -1934,65 +3336,67 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_unicode(void
 
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_vector(void *__pyx_v_fp) {
   int32_t __pyx_v_sz;
-  PyObject *__pyx_v_out = NULL;
   CYTHON_UNUSED int32_t __pyx_v_x;
+  PyObject *__pyx_v_out = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   int32_t __pyx_t_2;
   int32_t __pyx_t_3;
-  int __pyx_t_4;
+  int32_t __pyx_t_4;
+  int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_vector", 0);
 
-  /* "hadoopy/_typedbytes.pyx":318
+  /* "hadoopy/_typedbytes.pyx":348
  *         Python tuple with nested values
  *     """
- *     sz = _read_int(fp)             # <<<<<<<<<<<<<<
+ *     cdef int32_t sz = _read_int(fp)             # <<<<<<<<<<<<<<
+ *     cdef int32_t x
  *     out = []
- *     for x in range(sz):
  */
   __pyx_v_sz = __pyx_f_19_hadoopy_typedbytes__read_int(__pyx_v_fp);
 
-  /* "hadoopy/_typedbytes.pyx":319
- *     """
- *     sz = _read_int(fp)
+  /* "hadoopy/_typedbytes.pyx":350
+ *     cdef int32_t sz = _read_int(fp)
+ *     cdef int32_t x
  *     out = []             # <<<<<<<<<<<<<<
  *     for x in range(sz):
  *         out.append(_read_tb_code(fp))
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 350, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_out = __pyx_t_1;
+  __pyx_v_out = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":320
- *     sz = _read_int(fp)
+  /* "hadoopy/_typedbytes.pyx":351
+ *     cdef int32_t x
  *     out = []
  *     for x in range(sz):             # <<<<<<<<<<<<<<
  *         out.append(_read_tb_code(fp))
  *     return tuple(out)
  */
   __pyx_t_2 = __pyx_v_sz;
-  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v_x = __pyx_t_3;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_x = __pyx_t_4;
 
-    /* "hadoopy/_typedbytes.pyx":321
+    /* "hadoopy/_typedbytes.pyx":352
  *     out = []
  *     for x in range(sz):
  *         out.append(_read_tb_code(fp))             # <<<<<<<<<<<<<<
  *     return tuple(out)
  * 
  */
-    __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = PyList_Append(__pyx_v_out, __pyx_t_1); if (unlikely(__pyx_t_4 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = __Pyx_PyList_Append(__pyx_v_out, __pyx_t_1); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 352, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
 
-  /* "hadoopy/_typedbytes.pyx":322
+  /* "hadoopy/_typedbytes.pyx":353
  *     for x in range(sz):
  *         out.append(_read_tb_code(fp))
  *     return tuple(out)             # <<<<<<<<<<<<<<
@@ -2000,16 +3404,23 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_vector(void *
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)PyList_AsTuple(__pyx_v_out)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_r = ((PyObject *)__pyx_t_1);
+  __pyx_t_1 = PyList_AsTuple(__pyx_v_out); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  /* "hadoopy/_typedbytes.pyx":339
+ * 
+ * 
+ * cdef inline _read_vector(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read fixed length vector of typedbytes
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("_hadoopy_typedbytes._read_vector", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -2019,7 +3430,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_vector(void *
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":325
+/* "hadoopy/_typedbytes.pyx":356
  * 
  * 
  * cdef inline _write_vector(void *fp, val):             # <<<<<<<<<<<<<<
@@ -2041,80 +3452,109 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_vector(void
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_vector", 0);
 
-  /* "hadoopy/_typedbytes.pyx":334
+  /* "hadoopy/_typedbytes.pyx":365
  *         val: Python tuple with nested values
  *     """
  *     cdef int sz = len(val)             # <<<<<<<<<<<<<<
  *     _raw_write_int(fp, sz)
  *     for x in val:
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_val); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 334; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Length(__pyx_v_val); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 365, __pyx_L1_error)
   __pyx_v_sz = __pyx_t_1;
 
-  /* "hadoopy/_typedbytes.pyx":335
+  /* "hadoopy/_typedbytes.pyx":366
  *     """
  *     cdef int sz = len(val)
  *     _raw_write_int(fp, sz)             # <<<<<<<<<<<<<<
  *     for x in val:
  *         _write_tb_code(fp, x)
  */
-  __pyx_t_2 = PyInt_FromLong(__pyx_v_sz); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_sz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 366, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":336
+  /* "hadoopy/_typedbytes.pyx":367
  *     cdef int sz = len(val)
  *     _raw_write_int(fp, sz)
  *     for x in val:             # <<<<<<<<<<<<<<
  *         _write_tb_code(fp, x)
  * 
  */
-  if (PyList_CheckExact(__pyx_v_val) || PyTuple_CheckExact(__pyx_v_val)) {
+  if (likely(PyList_CheckExact(__pyx_v_val)) || PyTuple_CheckExact(__pyx_v_val)) {
     __pyx_t_3 = __pyx_v_val; __Pyx_INCREF(__pyx_t_3); __pyx_t_1 = 0;
     __pyx_t_4 = NULL;
   } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_val); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_val); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 367, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = Py_TYPE(__pyx_t_3)->tp_iternext;
+    __pyx_t_4 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 367, __pyx_L1_error)
   }
   for (;;) {
-    if (!__pyx_t_4 && PyList_CheckExact(__pyx_t_3)) {
-      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else if (!__pyx_t_4 && PyTuple_CheckExact(__pyx_t_3)) {
-      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_3))) {
+        if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 367, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 367, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      } else {
+        if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 367, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 367, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      }
     } else {
       __pyx_t_2 = __pyx_t_4(__pyx_t_3);
       if (unlikely(!__pyx_t_2)) {
-        if (PyErr_Occurred()) {
-          if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) PyErr_Clear();
-          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 367, __pyx_L1_error)
         }
         break;
       }
       __Pyx_GOTREF(__pyx_t_2);
     }
-    __Pyx_XDECREF(__pyx_v_x);
-    __pyx_v_x = __pyx_t_2;
+    __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":337
+    /* "hadoopy/_typedbytes.pyx":368
  *     _raw_write_int(fp, sz)
  *     for x in val:
  *         _write_tb_code(fp, x)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_x); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 368, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "hadoopy/_typedbytes.pyx":367
+ *     cdef int sz = len(val)
+ *     _raw_write_int(fp, sz)
+ *     for x in val:             # <<<<<<<<<<<<<<
+ *         _write_tb_code(fp, x)
+ * 
+ */
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
+  /* "hadoopy/_typedbytes.pyx":356
+ * 
+ * 
+ * cdef inline _write_vector(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write fixed length vector of typedbytes
+ * 
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -2129,7 +3569,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_vector(void
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":340
+/* "hadoopy/_typedbytes.pyx":371
  * 
  * 
  * cdef inline _read_list(void *fp):             # <<<<<<<<<<<<<<
@@ -2154,19 +3594,19 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_list", 0);
 
-  /* "hadoopy/_typedbytes.pyx":349
+  /* "hadoopy/_typedbytes.pyx":380
  *         Python list of nested values
  *     """
  *     out = []             # <<<<<<<<<<<<<<
  *     while True:
  *         try:
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 349; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 380, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_out = __pyx_t_1;
+  __pyx_v_out = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":350
+  /* "hadoopy/_typedbytes.pyx":381
  *     """
  *     out = []
  *     while True:             # <<<<<<<<<<<<<<
@@ -2174,9 +3614,8 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
  *             out.append(_read_tb_code(fp))
  */
   while (1) {
-    if (!1) break;
 
-    /* "hadoopy/_typedbytes.pyx":351
+    /* "hadoopy/_typedbytes.pyx":382
  *     out = []
  *     while True:
  *         try:             # <<<<<<<<<<<<<<
@@ -2184,23 +3623,33 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
  *         except StopIteration:
  */
     {
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
       __Pyx_ExceptionSave(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4);
       __Pyx_XGOTREF(__pyx_t_2);
       __Pyx_XGOTREF(__pyx_t_3);
       __Pyx_XGOTREF(__pyx_t_4);
       /*try:*/ {
 
-        /* "hadoopy/_typedbytes.pyx":352
+        /* "hadoopy/_typedbytes.pyx":383
  *     while True:
  *         try:
  *             out.append(_read_tb_code(fp))             # <<<<<<<<<<<<<<
  *         except StopIteration:
  *             break
  */
-        __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 383, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_5 = PyList_Append(__pyx_v_out, __pyx_t_1); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 352; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
+        __pyx_t_5 = __Pyx_PyList_Append(__pyx_v_out, __pyx_t_1); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 383, __pyx_L5_error)
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+        /* "hadoopy/_typedbytes.pyx":382
+ *     out = []
+ *     while True:
+ *         try:             # <<<<<<<<<<<<<<
+ *             out.append(_read_tb_code(fp))
+ *         except StopIteration:
+ */
       }
       __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2209,22 +3658,22 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
       __pyx_L5_error:;
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "hadoopy/_typedbytes.pyx":353
+      /* "hadoopy/_typedbytes.pyx":384
  *         try:
  *             out.append(_read_tb_code(fp))
  *         except StopIteration:             # <<<<<<<<<<<<<<
  *             break
  *     return out
  */
-      __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_StopIteration);
+      __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_StopIteration);
       if (__pyx_t_6) {
         __Pyx_AddTraceback("_hadoopy_typedbytes._read_list", __pyx_clineno, __pyx_lineno, __pyx_filename);
-        if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_7, &__pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
+        if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_7, &__pyx_t_8) < 0) __PYX_ERR(0, 384, __pyx_L7_except_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_GOTREF(__pyx_t_8);
 
-        /* "hadoopy/_typedbytes.pyx":354
+        /* "hadoopy/_typedbytes.pyx":385
  *             out.append(_read_tb_code(fp))
  *         except StopIteration:
  *             break             # <<<<<<<<<<<<<<
@@ -2232,17 +3681,22 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
  * 
  */
         goto __pyx_L13_except_break;
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        goto __pyx_L6_exception_handled;
         __pyx_L13_except_break:;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
         goto __pyx_L10_try_break;
       }
+      goto __pyx_L7_except_error;
       __pyx_L7_except_error:;
+
+      /* "hadoopy/_typedbytes.pyx":382
+ *     out = []
+ *     while True:
+ *         try:             # <<<<<<<<<<<<<<
+ *             out.append(_read_tb_code(fp))
+ *         except StopIteration:
+ */
       __Pyx_XGIVEREF(__pyx_t_2);
       __Pyx_XGIVEREF(__pyx_t_3);
       __Pyx_XGIVEREF(__pyx_t_4);
@@ -2254,17 +3708,12 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
       __Pyx_XGIVEREF(__pyx_t_4);
       __Pyx_ExceptionReset(__pyx_t_2, __pyx_t_3, __pyx_t_4);
       goto __pyx_L4_break;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_t_2);
-      __Pyx_XGIVEREF(__pyx_t_3);
-      __Pyx_XGIVEREF(__pyx_t_4);
-      __Pyx_ExceptionReset(__pyx_t_2, __pyx_t_3, __pyx_t_4);
       __pyx_L12_try_end:;
     }
   }
   __pyx_L4_break:;
 
-  /* "hadoopy/_typedbytes.pyx":355
+  /* "hadoopy/_typedbytes.pyx":386
  *         except StopIteration:
  *             break
  *     return out             # <<<<<<<<<<<<<<
@@ -2272,12 +3721,19 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_out));
-  __pyx_r = ((PyObject *)__pyx_v_out);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":371
+ * 
+ * 
+ * cdef inline _read_list(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read variable length list of typedbytes
+ * 
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_7);
@@ -2291,7 +3747,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_list(void *__
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":358
+/* "hadoopy/_typedbytes.pyx":389
  * 
  * 
  * cdef inline _write_list(void *fp, val):             # <<<<<<<<<<<<<<
@@ -2313,74 +3769,103 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_list(void *_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_list", 0);
 
-  /* "hadoopy/_typedbytes.pyx":367
+  /* "hadoopy/_typedbytes.pyx":398
  *         val: Python list of nested values
  *     """
  *     for x in val:             # <<<<<<<<<<<<<<
  *         _write_tb_code(fp, x)
  *     cdef unsigned char code = 255
  */
-  if (PyList_CheckExact(__pyx_v_val) || PyTuple_CheckExact(__pyx_v_val)) {
+  if (likely(PyList_CheckExact(__pyx_v_val)) || PyTuple_CheckExact(__pyx_v_val)) {
     __pyx_t_1 = __pyx_v_val; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
     __pyx_t_3 = NULL;
   } else {
-    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_val); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_val); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 398, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext;
+    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 398, __pyx_L1_error)
   }
   for (;;) {
-    if (!__pyx_t_3 && PyList_CheckExact(__pyx_t_1)) {
-      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++;
-    } else if (!__pyx_t_3 && PyTuple_CheckExact(__pyx_t_1)) {
-      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++;
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 398, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 398, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 398, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 398, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      }
     } else {
       __pyx_t_4 = __pyx_t_3(__pyx_t_1);
       if (unlikely(!__pyx_t_4)) {
-        if (PyErr_Occurred()) {
-          if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) PyErr_Clear();
-          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 398, __pyx_L1_error)
         }
         break;
       }
       __Pyx_GOTREF(__pyx_t_4);
     }
-    __Pyx_XDECREF(__pyx_v_x);
-    __pyx_v_x = __pyx_t_4;
+    __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":368
+    /* "hadoopy/_typedbytes.pyx":399
  *     """
  *     for x in val:
  *         _write_tb_code(fp, x)             # <<<<<<<<<<<<<<
  *     cdef unsigned char code = 255
  *     fwrite(&code, 1, 1, fp)  # = 1
  */
-    __pyx_t_4 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_x); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 368; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_x); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 399, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "hadoopy/_typedbytes.pyx":398
+ *         val: Python list of nested values
+ *     """
+ *     for x in val:             # <<<<<<<<<<<<<<
+ *         _write_tb_code(fp, x)
+ *     cdef unsigned char code = 255
+ */
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":369
+  /* "hadoopy/_typedbytes.pyx":400
  *     for x in val:
  *         _write_tb_code(fp, x)
  *     cdef unsigned char code = 255             # <<<<<<<<<<<<<<
  *     fwrite(&code, 1, 1, fp)  # = 1
  * 
  */
-  __pyx_v_code = 255;
+  __pyx_v_code = 0xFF;
 
-  /* "hadoopy/_typedbytes.pyx":370
+  /* "hadoopy/_typedbytes.pyx":401
  *         _write_tb_code(fp, x)
  *     cdef unsigned char code = 255
  *     fwrite(&code, 1, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  fwrite((&__pyx_v_code), 1, 1, __pyx_v_fp);
+  (void)(fwrite((&__pyx_v_code), 1, 1, __pyx_v_fp));
+
+  /* "hadoopy/_typedbytes.pyx":389
+ * 
+ * 
+ * cdef inline _write_list(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write variable length list of typedbytes
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -2395,7 +3880,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_list(void *_
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":373
+/* "hadoopy/_typedbytes.pyx":404
  * 
  * 
  * cdef inline _read_map(void *fp):             # <<<<<<<<<<<<<<
@@ -2405,110 +3890,112 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_list(void *_
 
 static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_map(void *__pyx_v_fp) {
   int32_t __pyx_v_sz;
-  PyObject *__pyx_v_out = NULL;
   CYTHON_UNUSED int32_t __pyx_v_x;
+  PyObject *__pyx_v_out = NULL;
   PyObject *__pyx_v_k = NULL;
-  PyObject *__pyx_v_v = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   int32_t __pyx_t_2;
   int32_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
+  int32_t __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_map", 0);
 
-  /* "hadoopy/_typedbytes.pyx":382
+  /* "hadoopy/_typedbytes.pyx":413
  *         Python dict with nested values
  *     """
- *     sz = _read_int(fp)             # <<<<<<<<<<<<<<
+ *     cdef int32_t sz = _read_int(fp)             # <<<<<<<<<<<<<<
+ *     cdef int32_t x
  *     out = {}
- *     for x in range(sz):
  */
   __pyx_v_sz = __pyx_f_19_hadoopy_typedbytes__read_int(__pyx_v_fp);
 
-  /* "hadoopy/_typedbytes.pyx":383
- *     """
- *     sz = _read_int(fp)
+  /* "hadoopy/_typedbytes.pyx":415
+ *     cdef int32_t sz = _read_int(fp)
+ *     cdef int32_t x
  *     out = {}             # <<<<<<<<<<<<<<
  *     for x in range(sz):
- *         k, v = _read_tb_code(fp), _read_tb_code(fp)
+ *         k = _read_tb_code(fp)
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 383; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_v_out = __pyx_t_1;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 415, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_out = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":384
- *     sz = _read_int(fp)
+  /* "hadoopy/_typedbytes.pyx":416
+ *     cdef int32_t x
  *     out = {}
  *     for x in range(sz):             # <<<<<<<<<<<<<<
- *         k, v = _read_tb_code(fp), _read_tb_code(fp)
- *         out[k] = v
+ *         k = _read_tb_code(fp)
+ *         out[k] = _read_tb_code(fp)
  */
   __pyx_t_2 = __pyx_v_sz;
-  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v_x = __pyx_t_3;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_x = __pyx_t_4;
 
-    /* "hadoopy/_typedbytes.pyx":385
+    /* "hadoopy/_typedbytes.pyx":417
  *     out = {}
  *     for x in range(sz):
- *         k, v = _read_tb_code(fp), _read_tb_code(fp)             # <<<<<<<<<<<<<<
- *         out[k] = v
+ *         k = _read_tb_code(fp)             # <<<<<<<<<<<<<<
+ *         out[k] = _read_tb_code(fp)
  *     return out
  */
-    __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 385; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 385; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_XDECREF(__pyx_v_k);
-    __pyx_v_k = __pyx_t_1;
+    __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_1);
     __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_v_v);
-    __pyx_v_v = __pyx_t_4;
-    __pyx_t_4 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":386
+    /* "hadoopy/_typedbytes.pyx":418
  *     for x in range(sz):
- *         k, v = _read_tb_code(fp), _read_tb_code(fp)
- *         out[k] = v             # <<<<<<<<<<<<<<
+ *         k = _read_tb_code(fp)
+ *         out[k] = _read_tb_code(fp)             # <<<<<<<<<<<<<<
  *     return out
  * 
  */
-    if (PyDict_SetItem(((PyObject *)__pyx_v_out), __pyx_v_k, __pyx_v_v) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 386; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 418, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (unlikely(PyDict_SetItem(__pyx_v_out, __pyx_v_k, __pyx_t_1) < 0)) __PYX_ERR(0, 418, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
 
-  /* "hadoopy/_typedbytes.pyx":387
- *         k, v = _read_tb_code(fp), _read_tb_code(fp)
- *         out[k] = v
+  /* "hadoopy/_typedbytes.pyx":419
+ *         k = _read_tb_code(fp)
+ *         out[k] = _read_tb_code(fp)
  *     return out             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_out));
-  __pyx_r = ((PyObject *)__pyx_v_out);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":404
+ * 
+ * 
+ * cdef inline _read_map(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read fixed length pairs of typedbytes (interpreted as a dict/map)
+ * 
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("_hadoopy_typedbytes._read_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_out);
   __Pyx_XDECREF(__pyx_v_k);
-  __Pyx_XDECREF(__pyx_v_v);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":390
+/* "hadoopy/_typedbytes.pyx":422
  * 
  * 
  * cdef inline _write_map(void *fp, val):             # <<<<<<<<<<<<<<
@@ -2524,151 +4011,97 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_map(void *__
   Py_ssize_t __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *(*__pyx_t_4)(PyObject *);
-  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *(*__pyx_t_8)(PyObject *);
+  int __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_map", 0);
 
-  /* "hadoopy/_typedbytes.pyx":399
+  /* "hadoopy/_typedbytes.pyx":431
  *         val: Python dict with nested values
  *     """
  *     _raw_write_int(fp, len(val))             # <<<<<<<<<<<<<<
  *     for x, y in val.iteritems():
  *         _write_tb_code(fp, x)
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_val); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Length(__pyx_v_val); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 431, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __pyx_f_19_hadoopy_typedbytes__raw_write_int(__pyx_v_fp, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":400
+  /* "hadoopy/_typedbytes.pyx":432
  *     """
  *     _raw_write_int(fp, len(val))
  *     for x, y in val.iteritems():             # <<<<<<<<<<<<<<
  *         _write_tb_code(fp, x)
  *         _write_tb_code(fp, y)
  */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_val, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3); __pyx_t_1 = 0;
-    __pyx_t_4 = NULL;
-  } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = Py_TYPE(__pyx_t_3)->tp_iternext;
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v_val == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "iteritems");
+    __PYX_ERR(0, 432, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (!__pyx_t_4 && PyList_CheckExact(__pyx_t_3)) {
-      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else if (!__pyx_t_4 && PyTuple_CheckExact(__pyx_t_3)) {
-      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else {
-      __pyx_t_2 = __pyx_t_4(__pyx_t_3);
-      if (unlikely(!__pyx_t_2)) {
-        if (PyErr_Occurred()) {
-          if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) PyErr_Clear();
-          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    if ((likely(PyTuple_CheckExact(__pyx_t_2))) || (PyList_CheckExact(__pyx_t_2))) {
-      PyObject* sequence = __pyx_t_2;
-      if (likely(PyTuple_CheckExact(sequence))) {
-        if (unlikely(PyTuple_GET_SIZE(sequence) != 2)) {
-          if (PyTuple_GET_SIZE(sequence) > 2) __Pyx_RaiseTooManyValuesError(2);
-          else __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(sequence));
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
-        __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
-      } else {
-        if (unlikely(PyList_GET_SIZE(sequence) != 2)) {
-          if (PyList_GET_SIZE(sequence) > 2) __Pyx_RaiseTooManyValuesError(2);
-          else __Pyx_RaiseNeedMoreValuesError(PyList_GET_SIZE(sequence));
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        }
-        __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
-        __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
-      }
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    } else {
-      Py_ssize_t index = -1;
-      __pyx_t_7 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_8 = Py_TYPE(__pyx_t_7)->tp_iternext;
-      index = 0; __pyx_t_5 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_5)) goto __pyx_L5_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_5);
-      index = 1; __pyx_t_6 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_6)) goto __pyx_L5_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_6);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_7), 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      goto __pyx_L6_unpacking_done;
-      __pyx_L5_unpacking_failed:;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (PyErr_Occurred() && PyErr_ExceptionMatches(PyExc_StopIteration)) PyErr_Clear();
-      if (!PyErr_Occurred()) __Pyx_RaiseNeedMoreValuesError(index);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_L6_unpacking_done:;
-    }
-    __Pyx_XDECREF(__pyx_v_x);
-    __pyx_v_x = __pyx_t_5;
-    __pyx_t_5 = 0;
-    __Pyx_XDECREF(__pyx_v_y);
-    __pyx_v_y = __pyx_t_6;
+  __pyx_t_2 = __Pyx_dict_iterator(__pyx_v_val, 0, __pyx_n_s_iteritems, (&__pyx_t_4), (&__pyx_t_5)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 432, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __pyx_t_3 = __pyx_t_2;
+  __pyx_t_2 = 0;
+  while (1) {
+    __pyx_t_7 = __Pyx_dict_iter_next(__pyx_t_3, __pyx_t_4, &__pyx_t_1, &__pyx_t_2, &__pyx_t_6, NULL, __pyx_t_5);
+    if (unlikely(__pyx_t_7 == 0)) break;
+    if (unlikely(__pyx_t_7 == -1)) __PYX_ERR(0, 432, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_2);
+    __pyx_t_2 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_6);
     __pyx_t_6 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":401
+    /* "hadoopy/_typedbytes.pyx":433
  *     _raw_write_int(fp, len(val))
  *     for x, y in val.iteritems():
  *         _write_tb_code(fp, x)             # <<<<<<<<<<<<<<
  *         _write_tb_code(fp, y)
  * 
  */
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_x); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_6 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_x); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 433, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":402
+    /* "hadoopy/_typedbytes.pyx":434
  *     for x, y in val.iteritems():
  *         _write_tb_code(fp, x)
  *         _write_tb_code(fp, y)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_y); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_6 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_y); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 434, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
+  /* "hadoopy/_typedbytes.pyx":422
+ * 
+ * 
+ * cdef inline _write_map(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write fixed length pairs of typedbytes (interpreted as a dict/map)
+ * 
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_AddTraceback("_hadoopy_typedbytes._write_map", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -2679,7 +4112,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_map(void *__
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":405
+/* "hadoopy/_typedbytes.pyx":437
  * 
  * 
  * cdef inline _read_pickle(void *fp):             # <<<<<<<<<<<<<<
@@ -2693,12 +4126,13 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_pickle(void *
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_pickle", 0);
 
-  /* "hadoopy/_typedbytes.pyx":414
+  /* "hadoopy/_typedbytes.pyx":446
  *         Python object
  *     """
  *     return pickle.loads(_read_bytes(fp))             # <<<<<<<<<<<<<<
@@ -2706,32 +4140,47 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_pickle(void *
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pickle); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__loads); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pickle); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 446, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_bytes(__pyx_v_fp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 446, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_bytes(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":437
+ * 
+ * 
+ * cdef inline _read_pickle(void *fp):             # <<<<<<<<<<<<<<
+ *     """Read a python pickle
+ * 
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("_hadoopy_typedbytes._read_pickle", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -2740,7 +4189,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__read_pickle(void *
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":417
+/* "hadoopy/_typedbytes.pyx":449
  * 
  * 
  * cdef inline _write_pickle(void *fp, val):             # <<<<<<<<<<<<<<
@@ -2754,46 +4203,91 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_pickle(void
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_pickle", 0);
 
-  /* "hadoopy/_typedbytes.pyx":426
+  /* "hadoopy/_typedbytes.pyx":458
  *         val: Python object
  *     """
  *     _write_bytes(fp, pickle.dumps(val, -1))             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__pickle); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__dumps); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pickle); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 458, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_val);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_val);
-  __Pyx_GIVEREF(__pyx_v_val);
-  __Pyx_INCREF(__pyx_int_neg_1);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_neg_1);
-  __Pyx_GIVEREF(__pyx_int_neg_1);
-  __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_dumps); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 458, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__write_bytes(__pyx_v_fp, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 426; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = NULL;
+  __pyx_t_4 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_v_val, __pyx_int_neg_1};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_v_val, __pyx_int_neg_1};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_2) {
+      __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2); __pyx_t_2 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_val);
+    __Pyx_GIVEREF(__pyx_v_val);
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, __pyx_v_val);
+    __Pyx_INCREF(__pyx_int_neg_1);
+    __Pyx_GIVEREF(__pyx_int_neg_1);
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, __pyx_int_neg_1);
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __pyx_f_19_hadoopy_typedbytes__write_bytes(__pyx_v_fp, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "hadoopy/_typedbytes.pyx":449
+ * 
+ * 
+ * cdef inline _write_pickle(void *fp, val):             # <<<<<<<<<<<<<<
+ *     """Write a python pickle
+ * 
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_AddTraceback("_hadoopy_typedbytes._write_pickle", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -2802,7 +4296,7 @@ static CYTHON_INLINE PyObject *__pyx_f_19_hadoopy_typedbytes__write_pickle(void
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":443
+/* "hadoopy/_typedbytes.pyx":475
  * 
  * 
  * cdef _write_tb_code(void *fp, val):             # <<<<<<<<<<<<<<
@@ -2823,14 +4317,12 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__write_tb_code(void *__pyx_v_fp,
   PyObject *__pyx_t_7 = NULL;
   int __pyx_t_8;
   int __pyx_t_9;
-  int __pyx_t_10;
-  int __pyx_t_11;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_write_tb_code", 0);
 
-  /* "hadoopy/_typedbytes.pyx":445
+  /* "hadoopy/_typedbytes.pyx":477
  * cdef _write_tb_code(void *fp, val):
  *     cdef int type_code
  *     try:             # <<<<<<<<<<<<<<
@@ -2838,65 +4330,84 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__write_tb_code(void *__pyx_v_fp,
  *     except KeyError:
  */
   {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
     __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
     __Pyx_XGOTREF(__pyx_t_1);
     __Pyx_XGOTREF(__pyx_t_2);
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "hadoopy/_typedbytes.pyx":446
+      /* "hadoopy/_typedbytes.pyx":478
  *     cdef int type_code
  *     try:
  *         type_code = _out_types[type(val)]             # <<<<<<<<<<<<<<
  *     except KeyError:
  *         type_code = 100
  */
-      __pyx_t_4 = __Pyx_GetName(__pyx_m, __pyx_n_s___out_types); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_out_types); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 478, __pyx_L3_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyObject_GetItem(__pyx_t_4, ((PyObject *)Py_TYPE(__pyx_v_val))); if (!__pyx_t_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_4, ((PyObject *)Py_TYPE(__pyx_v_val))); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 478, __pyx_L3_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyInt_AsInt(__pyx_t_5); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 478, __pyx_L3_error)
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_v_type_code = __pyx_t_6;
+
+      /* "hadoopy/_typedbytes.pyx":477
+ * cdef _write_tb_code(void *fp, val):
+ *     cdef int type_code
+ *     try:             # <<<<<<<<<<<<<<
+ *         type_code = _out_types[type(val)]
+ *     except KeyError:
+ */
     }
     __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    goto __pyx_L10_try_end;
+    goto __pyx_L8_try_end;
     __pyx_L3_error:;
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":447
+    /* "hadoopy/_typedbytes.pyx":479
  *     try:
  *         type_code = _out_types[type(val)]
  *     except KeyError:             # <<<<<<<<<<<<<<
  *         type_code = 100
  *     if type_code == 3 and (val < -2147483648 or 2147483647 < val):
  */
-    __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
+    __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_KeyError);
     if (__pyx_t_6) {
       __Pyx_AddTraceback("_hadoopy_typedbytes._write_tb_code", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_4, &__pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L5_except_error;}
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_4, &__pyx_t_7) < 0) __PYX_ERR(0, 479, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "hadoopy/_typedbytes.pyx":448
+      /* "hadoopy/_typedbytes.pyx":480
  *         type_code = _out_types[type(val)]
  *     except KeyError:
  *         type_code = 100             # <<<<<<<<<<<<<<
  *     if type_code == 3 and (val < -2147483648 or 2147483647 < val):
  *         type_code = 4
  */
-      __pyx_v_type_code = 100;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_v_type_code = 0x64;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       goto __pyx_L4_exception_handled;
     }
+    goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
+
+    /* "hadoopy/_typedbytes.pyx":477
+ * cdef _write_tb_code(void *fp, val):
+ *     cdef int type_code
+ *     try:             # <<<<<<<<<<<<<<
+ *         type_code = _out_types[type(val)]
+ *     except KeyError:
+ */
     __Pyx_XGIVEREF(__pyx_t_1);
     __Pyx_XGIVEREF(__pyx_t_2);
     __Pyx_XGIVEREF(__pyx_t_3);
@@ -2907,38 +4418,38 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__write_tb_code(void *__pyx_v_fp,
     __Pyx_XGIVEREF(__pyx_t_2);
     __Pyx_XGIVEREF(__pyx_t_3);
     __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
-    __pyx_L10_try_end:;
+    __pyx_L8_try_end:;
   }
 
-  /* "hadoopy/_typedbytes.pyx":449
+  /* "hadoopy/_typedbytes.pyx":481
  *     except KeyError:
  *         type_code = 100
  *     if type_code == 3 and (val < -2147483648 or 2147483647 < val):             # <<<<<<<<<<<<<<
  *         type_code = 4
  *     if type_code == 4 and (val < -9223372036854775808L or 9223372036854775807L < val):
  */
-  __pyx_t_8 = (__pyx_v_type_code == 3);
-  if (__pyx_t_8) {
-    __pyx_t_7 = PyObject_RichCompare(__pyx_v_val, __pyx_int_neg_2147483648, Py_LT); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (!__pyx_t_9) {
-      __pyx_t_7 = PyObject_RichCompare(__pyx_int_2147483647, __pyx_v_val, Py_LT); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 449; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __pyx_t_11 = __pyx_t_10;
-    } else {
-      __pyx_t_11 = __pyx_t_9;
-    }
-    __pyx_t_9 = __pyx_t_11;
+  __pyx_t_9 = ((__pyx_v_type_code == 3) != 0);
+  if (__pyx_t_9) {
   } else {
-    __pyx_t_9 = __pyx_t_8;
+    __pyx_t_8 = __pyx_t_9;
+    goto __pyx_L12_bool_binop_done;
   }
-  if (__pyx_t_9) {
+  __pyx_t_7 = PyObject_RichCompare(__pyx_v_val, __pyx_int_neg_2147483648, Py_LT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!__pyx_t_9) {
+  } else {
+    __pyx_t_8 = __pyx_t_9;
+    goto __pyx_L12_bool_binop_done;
+  }
+  __pyx_t_7 = PyObject_RichCompare(__pyx_int_2147483647, __pyx_v_val, Py_LT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 481, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_8 = __pyx_t_9;
+  __pyx_L12_bool_binop_done:;
+  if (__pyx_t_8) {
 
-    /* "hadoopy/_typedbytes.pyx":450
+    /* "hadoopy/_typedbytes.pyx":482
  *         type_code = 100
  *     if type_code == 3 and (val < -2147483648 or 2147483647 < val):
  *         type_code = 4             # <<<<<<<<<<<<<<
@@ -2946,305 +4457,321 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__write_tb_code(void *__pyx_v_fp,
  *         type_code = 100
  */
     __pyx_v_type_code = 4;
-    goto __pyx_L13;
+
+    /* "hadoopy/_typedbytes.pyx":481
+ *     except KeyError:
+ *         type_code = 100
+ *     if type_code == 3 and (val < -2147483648 or 2147483647 < val):             # <<<<<<<<<<<<<<
+ *         type_code = 4
+ *     if type_code == 4 and (val < -9223372036854775808L or 9223372036854775807L < val):
+ */
   }
-  __pyx_L13:;
 
-  /* "hadoopy/_typedbytes.pyx":451
+  /* "hadoopy/_typedbytes.pyx":483
  *     if type_code == 3 and (val < -2147483648 or 2147483647 < val):
  *         type_code = 4
  *     if type_code == 4 and (val < -9223372036854775808L or 9223372036854775807L < val):             # <<<<<<<<<<<<<<
  *         type_code = 100
  *     fwrite(&type_code, 1, 1, fp)  # = 1
  */
-  __pyx_t_9 = (__pyx_v_type_code == 4);
+  __pyx_t_9 = ((__pyx_v_type_code == 4) != 0);
   if (__pyx_t_9) {
-    __pyx_t_7 = PyObject_RichCompare(__pyx_v_val, __pyx_int_neg_9223372036854775808, Py_LT); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_8 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (!__pyx_t_8) {
-      __pyx_t_7 = PyObject_RichCompare(__pyx_int_9223372036854775807L, __pyx_v_val, Py_LT); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 451; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __pyx_t_10 = __pyx_t_11;
-    } else {
-      __pyx_t_10 = __pyx_t_8;
-    }
-    __pyx_t_8 = __pyx_t_10;
   } else {
     __pyx_t_8 = __pyx_t_9;
+    goto __pyx_L16_bool_binop_done;
+  }
+  __pyx_t_7 = PyObject_RichCompare(__pyx_v_val, __pyx_int_neg_9223372036854775808L, Py_LT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!__pyx_t_9) {
+  } else {
+    __pyx_t_8 = __pyx_t_9;
+    goto __pyx_L16_bool_binop_done;
   }
+  __pyx_t_7 = PyObject_RichCompare(__pyx_int_9223372036854775807L, __pyx_v_val, Py_LT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_8 = __pyx_t_9;
+  __pyx_L16_bool_binop_done:;
   if (__pyx_t_8) {
 
-    /* "hadoopy/_typedbytes.pyx":452
+    /* "hadoopy/_typedbytes.pyx":484
  *         type_code = 4
  *     if type_code == 4 and (val < -9223372036854775808L or 9223372036854775807L < val):
  *         type_code = 100             # <<<<<<<<<<<<<<
  *     fwrite(&type_code, 1, 1, fp)  # = 1
  *     # TODO Use a func pointer array
  */
-    __pyx_v_type_code = 100;
-    goto __pyx_L14;
+    __pyx_v_type_code = 0x64;
+
+    /* "hadoopy/_typedbytes.pyx":483
+ *     if type_code == 3 and (val < -2147483648 or 2147483647 < val):
+ *         type_code = 4
+ *     if type_code == 4 and (val < -9223372036854775808L or 9223372036854775807L < val):             # <<<<<<<<<<<<<<
+ *         type_code = 100
+ *     fwrite(&type_code, 1, 1, fp)  # = 1
+ */
   }
-  __pyx_L14:;
 
-  /* "hadoopy/_typedbytes.pyx":453
+  /* "hadoopy/_typedbytes.pyx":485
  *     if type_code == 4 and (val < -9223372036854775808L or 9223372036854775807L < val):
  *         type_code = 100
  *     fwrite(&type_code, 1, 1, fp)  # = 1             # <<<<<<<<<<<<<<
  *     # TODO Use a func pointer array
  *     if type_code == 0:
  */
-  fwrite((&__pyx_v_type_code), 1, 1, __pyx_v_fp);
-
-  /* "hadoopy/_typedbytes.pyx":473
- *     elif type_code == 10:
- *         _write_map(fp, val)
- *     elif type_code == 100:             # <<<<<<<<<<<<<<
- *         _write_pickle(fp, val)
- *     else:
- */
-  switch (__pyx_v_type_code) {
+  (void)(fwrite((&__pyx_v_type_code), 1, 1, __pyx_v_fp));
 
-    /* "hadoopy/_typedbytes.pyx":455
+  /* "hadoopy/_typedbytes.pyx":487
  *     fwrite(&type_code, 1, 1, fp)  # = 1
  *     # TODO Use a func pointer array
  *     if type_code == 0:             # <<<<<<<<<<<<<<
  *         _write_bytes(fp, val)
  *     elif type_code == 2:
  */
+  switch (__pyx_v_type_code) {
     case 0:
 
-    /* "hadoopy/_typedbytes.pyx":456
+    /* "hadoopy/_typedbytes.pyx":488
  *     # TODO Use a func pointer array
  *     if type_code == 0:
  *         _write_bytes(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 2:
  *         _write_bool(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_bytes(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_bytes(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 488, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":457
- *     if type_code == 0:
+    /* "hadoopy/_typedbytes.pyx":487
+ *     fwrite(&type_code, 1, 1, fp)  # = 1
+ *     # TODO Use a func pointer array
+ *     if type_code == 0:             # <<<<<<<<<<<<<<
  *         _write_bytes(fp, val)
- *     elif type_code == 2:             # <<<<<<<<<<<<<<
- *         _write_bool(fp, val)
- *     elif type_code == 3:
+ *     elif type_code == 2:
  */
+    break;
     case 2:
 
-    /* "hadoopy/_typedbytes.pyx":458
+    /* "hadoopy/_typedbytes.pyx":490
  *         _write_bytes(fp, val)
  *     elif type_code == 2:
  *         _write_bool(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 3:
  *         _write_int(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_bool(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 458; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_bool(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 490, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":459
- *     elif type_code == 2:
+    /* "hadoopy/_typedbytes.pyx":489
+ *     if type_code == 0:
+ *         _write_bytes(fp, val)
+ *     elif type_code == 2:             # <<<<<<<<<<<<<<
  *         _write_bool(fp, val)
- *     elif type_code == 3:             # <<<<<<<<<<<<<<
- *         _write_int(fp, val)
- *     elif type_code == 4:
+ *     elif type_code == 3:
  */
+    break;
     case 3:
 
-    /* "hadoopy/_typedbytes.pyx":460
+    /* "hadoopy/_typedbytes.pyx":492
  *         _write_bool(fp, val)
  *     elif type_code == 3:
  *         _write_int(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 4:
  *         _write_long(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_int(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 460; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_int(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 492, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":461
- *     elif type_code == 3:
+    /* "hadoopy/_typedbytes.pyx":491
+ *     elif type_code == 2:
+ *         _write_bool(fp, val)
+ *     elif type_code == 3:             # <<<<<<<<<<<<<<
  *         _write_int(fp, val)
- *     elif type_code == 4:             # <<<<<<<<<<<<<<
- *         _write_long(fp, val)
- *     elif type_code == 6:
+ *     elif type_code == 4:
  */
+    break;
     case 4:
 
-    /* "hadoopy/_typedbytes.pyx":462
+    /* "hadoopy/_typedbytes.pyx":494
  *         _write_int(fp, val)
  *     elif type_code == 4:
  *         _write_long(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 6:
  *         _write_double(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_long(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_long(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 494, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":463
- *     elif type_code == 4:
+    /* "hadoopy/_typedbytes.pyx":493
+ *     elif type_code == 3:
+ *         _write_int(fp, val)
+ *     elif type_code == 4:             # <<<<<<<<<<<<<<
  *         _write_long(fp, val)
- *     elif type_code == 6:             # <<<<<<<<<<<<<<
- *         _write_double(fp, val)
- *     elif type_code == 7:
+ *     elif type_code == 6:
  */
+    break;
     case 6:
 
-    /* "hadoopy/_typedbytes.pyx":464
+    /* "hadoopy/_typedbytes.pyx":496
  *         _write_long(fp, val)
  *     elif type_code == 6:
  *         _write_double(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 7:
  *         _write_unicode(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_double(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 464; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_double(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 496, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":465
- *     elif type_code == 6:
+    /* "hadoopy/_typedbytes.pyx":495
+ *     elif type_code == 4:
+ *         _write_long(fp, val)
+ *     elif type_code == 6:             # <<<<<<<<<<<<<<
  *         _write_double(fp, val)
- *     elif type_code == 7:             # <<<<<<<<<<<<<<
- *         _write_unicode(fp, val)
- *     elif type_code == 8:
+ *     elif type_code == 7:
  */
+    break;
     case 7:
 
-    /* "hadoopy/_typedbytes.pyx":466
+    /* "hadoopy/_typedbytes.pyx":498
  *         _write_double(fp, val)
  *     elif type_code == 7:
  *         _write_unicode(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 8:
  *         _write_vector(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_unicode(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_unicode(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 498, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":467
- *     elif type_code == 7:
+    /* "hadoopy/_typedbytes.pyx":497
+ *     elif type_code == 6:
+ *         _write_double(fp, val)
+ *     elif type_code == 7:             # <<<<<<<<<<<<<<
  *         _write_unicode(fp, val)
- *     elif type_code == 8:             # <<<<<<<<<<<<<<
- *         _write_vector(fp, val)
- *     elif type_code == 9:
+ *     elif type_code == 8:
  */
+    break;
     case 8:
 
-    /* "hadoopy/_typedbytes.pyx":468
+    /* "hadoopy/_typedbytes.pyx":500
  *         _write_unicode(fp, val)
  *     elif type_code == 8:
  *         _write_vector(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 9:
  *         _write_list(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_vector(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 468; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_vector(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 500, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":469
- *     elif type_code == 8:
+    /* "hadoopy/_typedbytes.pyx":499
+ *     elif type_code == 7:
+ *         _write_unicode(fp, val)
+ *     elif type_code == 8:             # <<<<<<<<<<<<<<
  *         _write_vector(fp, val)
- *     elif type_code == 9:             # <<<<<<<<<<<<<<
- *         _write_list(fp, val)
- *     elif type_code == 10:
+ *     elif type_code == 9:
  */
+    break;
     case 9:
 
-    /* "hadoopy/_typedbytes.pyx":470
+    /* "hadoopy/_typedbytes.pyx":502
  *         _write_vector(fp, val)
  *     elif type_code == 9:
  *         _write_list(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 10:
  *         _write_map(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_list(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_list(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 502, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":471
- *     elif type_code == 9:
+    /* "hadoopy/_typedbytes.pyx":501
+ *     elif type_code == 8:
+ *         _write_vector(fp, val)
+ *     elif type_code == 9:             # <<<<<<<<<<<<<<
  *         _write_list(fp, val)
- *     elif type_code == 10:             # <<<<<<<<<<<<<<
- *         _write_map(fp, val)
- *     elif type_code == 100:
+ *     elif type_code == 10:
  */
+    break;
     case 10:
 
-    /* "hadoopy/_typedbytes.pyx":472
+    /* "hadoopy/_typedbytes.pyx":504
  *         _write_list(fp, val)
  *     elif type_code == 10:
  *         _write_map(fp, val)             # <<<<<<<<<<<<<<
  *     elif type_code == 100:
  *         _write_pickle(fp, val)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_map(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_map(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 504, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    break;
 
-    /* "hadoopy/_typedbytes.pyx":473
- *     elif type_code == 10:
+    /* "hadoopy/_typedbytes.pyx":503
+ *     elif type_code == 9:
+ *         _write_list(fp, val)
+ *     elif type_code == 10:             # <<<<<<<<<<<<<<
  *         _write_map(fp, val)
- *     elif type_code == 100:             # <<<<<<<<<<<<<<
- *         _write_pickle(fp, val)
- *     else:
+ *     elif type_code == 100:
  */
-    case 100:
+    break;
+    case 0x64:
 
-    /* "hadoopy/_typedbytes.pyx":474
+    /* "hadoopy/_typedbytes.pyx":506
  *         _write_map(fp, val)
  *     elif type_code == 100:
  *         _write_pickle(fp, val)             # <<<<<<<<<<<<<<
  *     else:
  *         raise IndexError('Bad index %d ' % type_code)
  */
-    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_pickle(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __pyx_f_19_hadoopy_typedbytes__write_pickle(__pyx_v_fp, __pyx_v_val); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 506, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+    /* "hadoopy/_typedbytes.pyx":505
+ *     elif type_code == 10:
+ *         _write_map(fp, val)
+ *     elif type_code == 100:             # <<<<<<<<<<<<<<
+ *         _write_pickle(fp, val)
+ *     else:
+ */
     break;
     default:
 
-    /* "hadoopy/_typedbytes.pyx":476
+    /* "hadoopy/_typedbytes.pyx":508
  *         _write_pickle(fp, val)
  *     else:
  *         raise IndexError('Bad index %d ' % type_code)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_7 = PyInt_FromLong(__pyx_v_type_code); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_type_code); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 508, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_5), __pyx_t_7); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Bad_index_d, __pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 508, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = __Pyx_PyObject_CallOneArg(__pyx_builtin_IndexError, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 508, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_t_4));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_4));
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_builtin_IndexError, ((PyObject *)__pyx_t_7), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(((PyObject *)__pyx_t_7)); __pyx_t_7 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __PYX_ERR(0, 508, __pyx_L1_error)
     break;
   }
 
+  /* "hadoopy/_typedbytes.pyx":475
+ * 
+ * 
+ * cdef _write_tb_code(void *fp, val):             # <<<<<<<<<<<<<<
+ *     cdef int type_code
+ *     try:
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -3259,7 +4786,7 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__write_tb_code(void *__pyx_v_fp,
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":479
+/* "hadoopy/_typedbytes.pyx":511
  * 
  * 
  * cdef _read_tb_code(void *fp):             # <<<<<<<<<<<<<<
@@ -3279,7 +4806,7 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_read_tb_code", 0);
 
-  /* "hadoopy/_typedbytes.pyx":480
+  /* "hadoopy/_typedbytes.pyx":512
  * 
  * cdef _read_tb_code(void *fp):
  *     cdef int type_code = getc(fp)             # <<<<<<<<<<<<<<
@@ -3288,17 +4815,17 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  */
   __pyx_v_type_code = getc(__pyx_v_fp);
 
-  /* "hadoopy/_typedbytes.pyx":482
+  /* "hadoopy/_typedbytes.pyx":514
  *     cdef int type_code = getc(fp)
  *     # TODO Use a func pointer array
  *     if type_code == 0:             # <<<<<<<<<<<<<<
  *         return _read_bytes(fp)
  *     elif type_code == 1:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 0);
+  __pyx_t_1 = ((__pyx_v_type_code == 0) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":483
+    /* "hadoopy/_typedbytes.pyx":515
  *     # TODO Use a func pointer array
  *     if type_code == 0:
  *         return _read_bytes(fp)             # <<<<<<<<<<<<<<
@@ -3306,25 +4833,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_byte(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_bytes(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 483; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_bytes(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 515, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":514
+ *     cdef int type_code = getc(fp)
+ *     # TODO Use a func pointer array
+ *     if type_code == 0:             # <<<<<<<<<<<<<<
+ *         return _read_bytes(fp)
+ *     elif type_code == 1:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":484
+  /* "hadoopy/_typedbytes.pyx":516
  *     if type_code == 0:
  *         return _read_bytes(fp)
  *     elif type_code == 1:             # <<<<<<<<<<<<<<
  *         return _read_byte(fp)
  *     elif type_code == 2:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 1);
+  __pyx_t_1 = ((__pyx_v_type_code == 1) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":485
+    /* "hadoopy/_typedbytes.pyx":517
  *         return _read_bytes(fp)
  *     elif type_code == 1:
  *         return _read_byte(fp)             # <<<<<<<<<<<<<<
@@ -3332,25 +4866,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_bool(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_byte(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 485; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_byte(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 517, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":516
+ *     if type_code == 0:
+ *         return _read_bytes(fp)
+ *     elif type_code == 1:             # <<<<<<<<<<<<<<
+ *         return _read_byte(fp)
+ *     elif type_code == 2:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":486
+  /* "hadoopy/_typedbytes.pyx":518
  *     elif type_code == 1:
  *         return _read_byte(fp)
  *     elif type_code == 2:             # <<<<<<<<<<<<<<
  *         return _read_bool(fp)
  *     elif type_code == 3:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 2);
+  __pyx_t_1 = ((__pyx_v_type_code == 2) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":487
+    /* "hadoopy/_typedbytes.pyx":519
  *         return _read_byte(fp)
  *     elif type_code == 2:
  *         return _read_bool(fp)             # <<<<<<<<<<<<<<
@@ -3358,25 +4899,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_int(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_bool(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 487; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_bool(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 519, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":518
+ *     elif type_code == 1:
+ *         return _read_byte(fp)
+ *     elif type_code == 2:             # <<<<<<<<<<<<<<
+ *         return _read_bool(fp)
+ *     elif type_code == 3:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":488
+  /* "hadoopy/_typedbytes.pyx":520
  *     elif type_code == 2:
  *         return _read_bool(fp)
  *     elif type_code == 3:             # <<<<<<<<<<<<<<
  *         return _read_int(fp)
  *     elif type_code == 4:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 3);
+  __pyx_t_1 = ((__pyx_v_type_code == 3) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":489
+    /* "hadoopy/_typedbytes.pyx":521
  *         return _read_bool(fp)
  *     elif type_code == 3:
  *         return _read_int(fp)             # <<<<<<<<<<<<<<
@@ -3384,25 +4932,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_long(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_to_py_int32_t(__pyx_f_19_hadoopy_typedbytes__read_int(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyInt_From_int32_t(__pyx_f_19_hadoopy_typedbytes__read_int(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 521, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":520
+ *     elif type_code == 2:
+ *         return _read_bool(fp)
+ *     elif type_code == 3:             # <<<<<<<<<<<<<<
+ *         return _read_int(fp)
+ *     elif type_code == 4:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":490
+  /* "hadoopy/_typedbytes.pyx":522
  *     elif type_code == 3:
  *         return _read_int(fp)
  *     elif type_code == 4:             # <<<<<<<<<<<<<<
  *         return _read_long(fp)
  *     elif type_code == 5:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 4);
+  __pyx_t_1 = ((__pyx_v_type_code == 4) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":491
+    /* "hadoopy/_typedbytes.pyx":523
  *         return _read_int(fp)
  *     elif type_code == 4:
  *         return _read_long(fp)             # <<<<<<<<<<<<<<
@@ -3410,25 +4965,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_float(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_to_py_int64_t(__pyx_f_19_hadoopy_typedbytes__read_long(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyInt_From_int64_t(__pyx_f_19_hadoopy_typedbytes__read_long(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 523, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":522
+ *     elif type_code == 3:
+ *         return _read_int(fp)
+ *     elif type_code == 4:             # <<<<<<<<<<<<<<
+ *         return _read_long(fp)
+ *     elif type_code == 5:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":492
+  /* "hadoopy/_typedbytes.pyx":524
  *     elif type_code == 4:
  *         return _read_long(fp)
  *     elif type_code == 5:             # <<<<<<<<<<<<<<
  *         return _read_float(fp)
  *     elif type_code == 6:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 5);
+  __pyx_t_1 = ((__pyx_v_type_code == 5) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":493
+    /* "hadoopy/_typedbytes.pyx":525
  *         return _read_long(fp)
  *     elif type_code == 5:
  *         return _read_float(fp)             # <<<<<<<<<<<<<<
@@ -3436,25 +4998,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_double(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_f_19_hadoopy_typedbytes__read_float(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_f_19_hadoopy_typedbytes__read_float(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 525, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":524
+ *     elif type_code == 4:
+ *         return _read_long(fp)
+ *     elif type_code == 5:             # <<<<<<<<<<<<<<
+ *         return _read_float(fp)
+ *     elif type_code == 6:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":494
+  /* "hadoopy/_typedbytes.pyx":526
  *     elif type_code == 5:
  *         return _read_float(fp)
  *     elif type_code == 6:             # <<<<<<<<<<<<<<
  *         return _read_double(fp)
  *     elif type_code == 7:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 6);
+  __pyx_t_1 = ((__pyx_v_type_code == 6) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":495
+    /* "hadoopy/_typedbytes.pyx":527
  *         return _read_float(fp)
  *     elif type_code == 6:
  *         return _read_double(fp)             # <<<<<<<<<<<<<<
@@ -3462,25 +5031,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_unicode(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_f_19_hadoopy_typedbytes__read_double(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 495; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_f_19_hadoopy_typedbytes__read_double(__pyx_v_fp)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 527, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":526
+ *     elif type_code == 5:
+ *         return _read_float(fp)
+ *     elif type_code == 6:             # <<<<<<<<<<<<<<
+ *         return _read_double(fp)
+ *     elif type_code == 7:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":496
+  /* "hadoopy/_typedbytes.pyx":528
  *     elif type_code == 6:
  *         return _read_double(fp)
  *     elif type_code == 7:             # <<<<<<<<<<<<<<
  *         return _read_unicode(fp)
  *     elif type_code == 8:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 7);
+  __pyx_t_1 = ((__pyx_v_type_code == 7) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":497
+    /* "hadoopy/_typedbytes.pyx":529
  *         return _read_double(fp)
  *     elif type_code == 7:
  *         return _read_unicode(fp)             # <<<<<<<<<<<<<<
@@ -3488,25 +5064,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_vector(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_unicode(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 497; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_unicode(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 529, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":528
+ *     elif type_code == 6:
+ *         return _read_double(fp)
+ *     elif type_code == 7:             # <<<<<<<<<<<<<<
+ *         return _read_unicode(fp)
+ *     elif type_code == 8:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":498
+  /* "hadoopy/_typedbytes.pyx":530
  *     elif type_code == 7:
  *         return _read_unicode(fp)
  *     elif type_code == 8:             # <<<<<<<<<<<<<<
  *         return _read_vector(fp)
  *     elif type_code == 9:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 8);
+  __pyx_t_1 = ((__pyx_v_type_code == 8) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":499
+    /* "hadoopy/_typedbytes.pyx":531
  *         return _read_unicode(fp)
  *     elif type_code == 8:
  *         return _read_vector(fp)             # <<<<<<<<<<<<<<
@@ -3514,25 +5097,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_list(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_vector(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 499; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_vector(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 531, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":530
+ *     elif type_code == 7:
+ *         return _read_unicode(fp)
+ *     elif type_code == 8:             # <<<<<<<<<<<<<<
+ *         return _read_vector(fp)
+ *     elif type_code == 9:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":500
+  /* "hadoopy/_typedbytes.pyx":532
  *     elif type_code == 8:
  *         return _read_vector(fp)
  *     elif type_code == 9:             # <<<<<<<<<<<<<<
  *         return _read_list(fp)
  *     elif type_code == 10:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 9);
+  __pyx_t_1 = ((__pyx_v_type_code == 9) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":501
+    /* "hadoopy/_typedbytes.pyx":533
  *         return _read_vector(fp)
  *     elif type_code == 9:
  *         return _read_list(fp)             # <<<<<<<<<<<<<<
@@ -3540,25 +5130,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_map(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_list(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 501; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_list(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 533, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":532
+ *     elif type_code == 8:
+ *         return _read_vector(fp)
+ *     elif type_code == 9:             # <<<<<<<<<<<<<<
+ *         return _read_list(fp)
+ *     elif type_code == 10:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":502
+  /* "hadoopy/_typedbytes.pyx":534
  *     elif type_code == 9:
  *         return _read_list(fp)
  *     elif type_code == 10:             # <<<<<<<<<<<<<<
  *         return _read_map(fp)
  *     elif type_code == 100:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 10);
+  __pyx_t_1 = ((__pyx_v_type_code == 10) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":503
+    /* "hadoopy/_typedbytes.pyx":535
  *         return _read_list(fp)
  *     elif type_code == 10:
  *         return _read_map(fp)             # <<<<<<<<<<<<<<
@@ -3566,25 +5163,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         return _read_pickle(fp)
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_map(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 503; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_map(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 535, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":534
+ *     elif type_code == 9:
+ *         return _read_list(fp)
+ *     elif type_code == 10:             # <<<<<<<<<<<<<<
+ *         return _read_map(fp)
+ *     elif type_code == 100:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":504
+  /* "hadoopy/_typedbytes.pyx":536
  *     elif type_code == 10:
  *         return _read_map(fp)
  *     elif type_code == 100:             # <<<<<<<<<<<<<<
  *         return _read_pickle(fp)
  *     elif type_code == 255:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 100);
+  __pyx_t_1 = ((__pyx_v_type_code == 0x64) != 0);
   if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":505
+    /* "hadoopy/_typedbytes.pyx":537
  *         return _read_map(fp)
  *     elif type_code == 100:
  *         return _read_pickle(fp)             # <<<<<<<<<<<<<<
@@ -3592,25 +5196,32 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         raise StopIteration
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_pickle(__pyx_v_fp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 505; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__read_pickle(__pyx_v_fp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 537, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
-    goto __pyx_L3;
+
+    /* "hadoopy/_typedbytes.pyx":536
+ *     elif type_code == 10:
+ *         return _read_map(fp)
+ *     elif type_code == 100:             # <<<<<<<<<<<<<<
+ *         return _read_pickle(fp)
+ *     elif type_code == 255:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":506
+  /* "hadoopy/_typedbytes.pyx":538
  *     elif type_code == 100:
  *         return _read_pickle(fp)
  *     elif type_code == 255:             # <<<<<<<<<<<<<<
  *         raise StopIteration
  *     elif type_code < 0:
  */
-  __pyx_t_1 = (__pyx_v_type_code == 255);
-  if (__pyx_t_1) {
+  __pyx_t_1 = ((__pyx_v_type_code == 0xFF) != 0);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "hadoopy/_typedbytes.pyx":507
+    /* "hadoopy/_typedbytes.pyx":539
  *         return _read_pickle(fp)
  *     elif type_code == 255:
  *         raise StopIteration             # <<<<<<<<<<<<<<
@@ -3618,21 +5229,28 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         raise StopIteration
  */
     __Pyx_Raise(__pyx_builtin_StopIteration, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 507; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L3;
+    __PYX_ERR(0, 539, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":538
+ *     elif type_code == 100:
+ *         return _read_pickle(fp)
+ *     elif type_code == 255:             # <<<<<<<<<<<<<<
+ *         raise StopIteration
+ *     elif type_code < 0:
+ */
   }
 
-  /* "hadoopy/_typedbytes.pyx":508
+  /* "hadoopy/_typedbytes.pyx":540
  *     elif type_code == 255:
  *         raise StopIteration
  *     elif type_code < 0:             # <<<<<<<<<<<<<<
  *         raise StopIteration
  *     else:
  */
-  __pyx_t_1 = (__pyx_v_type_code < 0);
-  if (__pyx_t_1) {
+  __pyx_t_1 = ((__pyx_v_type_code < 0) != 0);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "hadoopy/_typedbytes.pyx":509
+    /* "hadoopy/_typedbytes.pyx":541
  *         raise StopIteration
  *     elif type_code < 0:
  *         raise StopIteration             # <<<<<<<<<<<<<<
@@ -3640,39 +5258,47 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
  *         raise IndexError('Bad index %d ' % type_code)
  */
     __Pyx_Raise(__pyx_builtin_StopIteration, 0, 0, 0);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 509; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L3;
+    __PYX_ERR(0, 541, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":540
+ *     elif type_code == 255:
+ *         raise StopIteration
+ *     elif type_code < 0:             # <<<<<<<<<<<<<<
+ *         raise StopIteration
+ *     else:
+ */
   }
-  /*else*/ {
 
-    /* "hadoopy/_typedbytes.pyx":511
+  /* "hadoopy/_typedbytes.pyx":543
  *         raise StopIteration
  *     else:
  *         raise IndexError('Bad index %d ' % type_code)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_2 = PyInt_FromLong(__pyx_v_type_code); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /*else*/ {
+    __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_type_code); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 543, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_5), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+    __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_Bad_index_d, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 543, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_IndexError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 543, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_t_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_3));
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_builtin_IndexError, ((PyObject *)__pyx_t_2), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 511; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 543, __pyx_L1_error)
   }
-  __pyx_L3:;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":511
+ * 
+ * 
+ * cdef _read_tb_code(void *fp):             # <<<<<<<<<<<<<<
+ *     cdef int type_code = getc(fp)
+ *     # TODO Use a func pointer array
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
@@ -3684,7 +5310,7 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes__read_tb_code(void *__pyx_v_fp) {
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":514
+/* "hadoopy/_typedbytes.pyx":546
  * 
  * 
  * cdef __read_key_value_tb(void *fp):             # <<<<<<<<<<<<<<
@@ -3703,31 +5329,31 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes___read_key_value_tb(void *__pyx_v
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__read_key_value_tb", 0);
 
-  /* "hadoopy/_typedbytes.pyx":515
+  /* "hadoopy/_typedbytes.pyx":547
  * 
  * cdef __read_key_value_tb(void *fp):
  *     k = _read_tb_code(fp)             # <<<<<<<<<<<<<<
  *     v = _read_tb_code(fp)
  *     return k, v
  */
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 515; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 547, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_k = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":516
+  /* "hadoopy/_typedbytes.pyx":548
  * cdef __read_key_value_tb(void *fp):
  *     k = _read_tb_code(fp)
  *     v = _read_tb_code(fp)             # <<<<<<<<<<<<<<
  *     return k, v
  * 
  */
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 516; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes__read_tb_code(__pyx_v_fp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 548, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_v = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":517
+  /* "hadoopy/_typedbytes.pyx":549
  *     k = _read_tb_code(fp)
  *     v = _read_tb_code(fp)
  *     return k, v             # <<<<<<<<<<<<<<
@@ -3735,20 +5361,27 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes___read_key_value_tb(void *__pyx_v
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 517; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 549, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_k);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_k);
   __Pyx_GIVEREF(__pyx_v_k);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_k);
   __Pyx_INCREF(__pyx_v_v);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_v);
   __Pyx_GIVEREF(__pyx_v_v);
-  __pyx_r = ((PyObject *)__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_v);
+  __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":546
+ * 
+ * 
+ * cdef __read_key_value_tb(void *fp):             # <<<<<<<<<<<<<<
+ *     k = _read_tb_code(fp)
+ *     v = _read_tb_code(fp)
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("_hadoopy_typedbytes.__read_key_value_tb", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -3761,7 +5394,7 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes___read_key_value_tb(void *__pyx_v
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":520
+/* "hadoopy/_typedbytes.pyx":552
  * 
  * 
  * cdef __write_key_value_tb(void *fp, kv):             # <<<<<<<<<<<<<<
@@ -3783,7 +5416,7 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes___write_key_value_tb(void *__pyx_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__write_key_value_tb", 0);
 
-  /* "hadoopy/_typedbytes.pyx":521
+  /* "hadoopy/_typedbytes.pyx":553
  * 
  * cdef __write_key_value_tb(void *fp, kv):
  *     k, v = kv             # <<<<<<<<<<<<<<
@@ -3792,42 +5425,46 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes___write_key_value_tb(void *__pyx_
  */
   if ((likely(PyTuple_CheckExact(__pyx_v_kv))) || (PyList_CheckExact(__pyx_v_kv))) {
     PyObject* sequence = __pyx_v_kv;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 2)) {
+      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 553, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
     if (likely(PyTuple_CheckExact(sequence))) {
-      if (unlikely(PyTuple_GET_SIZE(sequence) != 2)) {
-        if (PyTuple_GET_SIZE(sequence) > 2) __Pyx_RaiseTooManyValuesError(2);
-        else __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(sequence));
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
       __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
       __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
     } else {
-      if (unlikely(PyList_GET_SIZE(sequence) != 2)) {
-        if (PyList_GET_SIZE(sequence) > 2) __Pyx_RaiseTooManyValuesError(2);
-        else __Pyx_RaiseNeedMoreValuesError(PyList_GET_SIZE(sequence));
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
       __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
       __pyx_t_2 = PyList_GET_ITEM(sequence, 1); 
     }
     __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx_t_2);
+    #else
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 553, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 553, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    #endif
   } else {
     Py_ssize_t index = -1;
-    __pyx_t_3 = PyObject_GetIter(__pyx_v_kv); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetIter(__pyx_v_kv); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 553, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = Py_TYPE(__pyx_t_3)->tp_iternext;
     index = 0; __pyx_t_1 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_1)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_1);
     index = 1; __pyx_t_2 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_2);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) __PYX_ERR(0, 553, __pyx_L1_error)
+    __pyx_t_4 = NULL;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L4_unpacking_done;
     __pyx_L3_unpacking_failed:;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (PyErr_Occurred() && PyErr_ExceptionMatches(PyExc_StopIteration)) PyErr_Clear();
-    if (!PyErr_Occurred()) __Pyx_RaiseNeedMoreValuesError(index);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 521; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 553, __pyx_L1_error)
     __pyx_L4_unpacking_done:;
   }
   __pyx_v_k = __pyx_t_1;
@@ -3835,28 +5472,37 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes___write_key_value_tb(void *__pyx_
   __pyx_v_v = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":522
+  /* "hadoopy/_typedbytes.pyx":554
  * cdef __write_key_value_tb(void *fp, kv):
  *     k, v = kv
  *     _write_tb_code(fp, k)             # <<<<<<<<<<<<<<
  *     _write_tb_code(fp, v)
  * 
  */
-  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_k); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 522; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_k); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 554, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":523
+  /* "hadoopy/_typedbytes.pyx":555
  *     k, v = kv
  *     _write_tb_code(fp, k)
  *     _write_tb_code(fp, v)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_v); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 523; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes__write_tb_code(__pyx_v_fp, __pyx_v_v); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 555, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
+  /* "hadoopy/_typedbytes.pyx":552
+ * 
+ * 
+ * cdef __write_key_value_tb(void *fp, kv):             # <<<<<<<<<<<<<<
+ *     k, v = kv
+ *     _write_tb_code(fp, k)
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -3873,27 +5519,28 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes___write_key_value_tb(void *__pyx_
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":558
+ * 
+ * 
+ * def read_tb():             # <<<<<<<<<<<<<<
+ *     return __read_key_value_tb(stdin)
+ * 
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_1read_tb(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_19_hadoopy_typedbytes_1read_tb = {__Pyx_NAMESTR("read_tb"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_1read_tb, METH_NOARGS, __Pyx_DOCSTR(0)};
+static PyMethodDef __pyx_mdef_19_hadoopy_typedbytes_1read_tb = {"read_tb", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_1read_tb, METH_NOARGS, 0};
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_1read_tb(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("read_tb (wrapper)", 0);
-  __pyx_self = __pyx_self;
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_read_tb(__pyx_self);
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":526
- * 
- * 
- * def read_tb():             # <<<<<<<<<<<<<<
- *     return __read_key_value_tb(stdin)
- * 
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_read_tb(CYTHON_UNUSED PyObject *__pyx_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -3903,7 +5550,7 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_read_tb(CYTHON_UNUSED PyObject *
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_tb", 0);
 
-  /* "hadoopy/_typedbytes.pyx":527
+  /* "hadoopy/_typedbytes.pyx":559
  * 
  * def read_tb():
  *     return __read_key_value_tb(stdin)             # <<<<<<<<<<<<<<
@@ -3911,14 +5558,21 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_read_tb(CYTHON_UNUSED PyObject *
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes___read_key_value_tb(stdin); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 527; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes___read_key_value_tb(stdin); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 559, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":558
+ * 
+ * 
+ * def read_tb():             # <<<<<<<<<<<<<<
+ *     return __read_key_value_tb(stdin)
+ * 
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("_hadoopy_typedbytes.read_tb", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -3929,27 +5583,28 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_read_tb(CYTHON_UNUSED PyObject *
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":562
+ * 
+ * 
+ * def write_tb(kv):             # <<<<<<<<<<<<<<
+ *     __write_key_value_tb(stdout, kv)
+ * 
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_3write_tb(PyObject *__pyx_self, PyObject *__pyx_v_kv); /*proto*/
-static PyMethodDef __pyx_mdef_19_hadoopy_typedbytes_3write_tb = {__Pyx_NAMESTR("write_tb"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_3write_tb, METH_O, __Pyx_DOCSTR(0)};
+static PyMethodDef __pyx_mdef_19_hadoopy_typedbytes_3write_tb = {"write_tb", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_3write_tb, METH_O, 0};
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_3write_tb(PyObject *__pyx_self, PyObject *__pyx_v_kv) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("write_tb (wrapper)", 0);
-  __pyx_self = __pyx_self;
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_2write_tb(__pyx_self, ((PyObject *)__pyx_v_kv));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":530
- * 
- * 
- * def write_tb(kv):             # <<<<<<<<<<<<<<
- *     __write_key_value_tb(stdout, kv)
- * 
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_2write_tb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_kv) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -3959,17 +5614,26 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_2write_tb(CYTHON_UNUSED PyObject
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("write_tb", 0);
 
-  /* "hadoopy/_typedbytes.pyx":531
+  /* "hadoopy/_typedbytes.pyx":563
  * 
  * def write_tb(kv):
  *     __write_key_value_tb(stdout, kv)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes___write_key_value_tb(stdout, __pyx_v_kv); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 531; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes___write_key_value_tb(stdout, __pyx_v_kv); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 563, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "hadoopy/_typedbytes.pyx":562
+ * 
+ * 
+ * def write_tb(kv):             # <<<<<<<<<<<<<<
+ *     __write_key_value_tb(stdout, kv)
+ * 
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -3982,6 +5646,14 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_2write_tb(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":586
+ *     cdef object _batch_error
+ *     cdef int flush_writes
+ *     def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False, read_buffer_size=0, write_buffer_size=0):             # <<<<<<<<<<<<<<
+ *         self.flush_writes = int(flush_writes)
+ *         self._read_buf = NULL
+ */
+
 /* Python wrapper */
 static int __pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static int __pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
@@ -3991,36 +5663,45 @@ static int __pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_1__init__(PyObject *_
   PyObject *__pyx_v_write_fd = 0;
   PyObject *__pyx_v_flush_writes = 0;
   PyObject *__pyx_v_unbuffered_reads = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__fn,&__pyx_n_s__mode,&__pyx_n_s__read_fd,&__pyx_n_s__write_fd,&__pyx_n_s__flush_writes,&__pyx_n_s__unbuffered_reads,0};
+  PyObject *__pyx_v_read_buffer_size = 0;
+  PyObject *__pyx_v_write_buffer_size = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    PyObject* values[6] = {0,0,0,0,0,0};
-
-    /* "hadoopy/_typedbytes.pyx":548
- *     cdef object file_method
- *     cdef int flush_writes
- *     def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False):             # <<<<<<<<<<<<<<
- *         self.flush_writes = int(flush_writes)
- *         cdef char *fnc
- */
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fn,&__pyx_n_s_mode,&__pyx_n_s_read_fd,&__pyx_n_s_write_fd,&__pyx_n_s_flush_writes,&__pyx_n_s_unbuffered_reads,&__pyx_n_s_read_buffer_size,&__pyx_n_s_write_buffer_size,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
     values[0] = ((PyObject *)Py_None);
     values[1] = ((PyObject *)Py_None);
     values[2] = ((PyObject *)Py_None);
     values[3] = ((PyObject *)Py_None);
-    values[4] = __pyx_k_6;
-    values[5] = __pyx_k_7;
+    values[4] = ((PyObject *)Py_False);
+    values[5] = ((PyObject *)Py_False);
+    values[6] = ((PyObject *)__pyx_int_0);
+    values[7] = ((PyObject *)__pyx_int_0);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
@@ -4028,46 +5709,73 @@ static int __pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_1__init__(PyObject *_
       switch (pos_args) {
         case  0:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__fn);
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fn);
           if (value) { values[0] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
         case  1:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__mode);
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mode);
           if (value) { values[1] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
         case  2:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__read_fd);
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_read_fd);
           if (value) { values[2] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
         case  3:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__write_fd);
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_write_fd);
           if (value) { values[3] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
         case  4:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__flush_writes);
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_flush_writes);
           if (value) { values[4] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
         case  5:
         if (kw_args > 0) {
-          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__unbuffered_reads);
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_unbuffered_reads);
           if (value) { values[5] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_read_buffer_size);
+          if (value) { values[6] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_write_buffer_size);
+          if (value) { values[7] = value; kw_args--; }
+        }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 586, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
@@ -4078,150 +5786,169 @@ static int __pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_1__init__(PyObject *_
     __pyx_v_write_fd = values[3];
     __pyx_v_flush_writes = values[4];
     __pyx_v_unbuffered_reads = values[5];
+    __pyx_v_read_buffer_size = values[6];
+    __pyx_v_write_buffer_size = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 8, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 586, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), __pyx_v_fn, __pyx_v_mode, __pyx_v_read_fd, __pyx_v_write_fd, __pyx_v_flush_writes, __pyx_v_unbuffered_reads);
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), __pyx_v_fn, __pyx_v_mode, __pyx_v_read_fd, __pyx_v_write_fd, __pyx_v_flush_writes, __pyx_v_unbuffered_reads, __pyx_v_read_buffer_size, __pyx_v_write_buffer_size);
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_fn, PyObject *__pyx_v_mode, PyObject *__pyx_v_read_fd, PyObject *__pyx_v_write_fd, PyObject *__pyx_v_flush_writes, PyObject *__pyx_v_unbuffered_reads) {
+static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_fn, PyObject *__pyx_v_mode, PyObject *__pyx_v_read_fd, PyObject *__pyx_v_write_fd, PyObject *__pyx_v_flush_writes, PyObject *__pyx_v_unbuffered_reads, PyObject *__pyx_v_read_buffer_size, PyObject *__pyx_v_write_buffer_size) {
   char *__pyx_v_fnc;
   char *__pyx_v_modec;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
   void *__pyx_t_8;
   int __pyx_t_9;
-  int __pyx_t_10;
-  void *__pyx_t_11;
+  size_t __pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
   __Pyx_INCREF(__pyx_v_mode);
 
-  /* "hadoopy/_typedbytes.pyx":549
+  /* "hadoopy/_typedbytes.pyx":587
  *     cdef int flush_writes
- *     def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False):
+ *     def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False, read_buffer_size=0, write_buffer_size=0):
  *         self.flush_writes = int(flush_writes)             # <<<<<<<<<<<<<<
+ *         self._read_buf = NULL
+ *         self._write_buf = NULL
+ */
+  __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_v_flush_writes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 587, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 587, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_self->flush_writes = __pyx_t_2;
+
+  /* "hadoopy/_typedbytes.pyx":588
+ *     def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False, read_buffer_size=0, write_buffer_size=0):
+ *         self.flush_writes = int(flush_writes)
+ *         self._read_buf = NULL             # <<<<<<<<<<<<<<
+ *         self._write_buf = NULL
+ *         cdef char *fnc
+ */
+  __pyx_v_self->_read_buf = NULL;
+
+  /* "hadoopy/_typedbytes.pyx":589
+ *         self.flush_writes = int(flush_writes)
+ *         self._read_buf = NULL
+ *         self._write_buf = NULL             # <<<<<<<<<<<<<<
  *         cdef char *fnc
  *         cdef char *modec
  */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_flush_writes);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_flush_writes);
-  __Pyx_GIVEREF(__pyx_v_flush_writes);
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)(&PyInt_Type))), ((PyObject *)__pyx_t_1), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_self->flush_writes = __pyx_t_3;
+  __pyx_v_self->_write_buf = NULL;
 
-  /* "hadoopy/_typedbytes.pyx":552
+  /* "hadoopy/_typedbytes.pyx":592
  *         cdef char *fnc
  *         cdef char *modec
  *         self._repr = "TypedBytesFile(%s, %s, %s, %s)" % (repr(fn), repr(mode), repr(read_fd), repr(write_fd))             # <<<<<<<<<<<<<<
  *         if fn:
  *             self.file_method = 'fn'
  */
-  __pyx_t_2 = PyObject_Repr(__pyx_v_fn); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_Repr(__pyx_v_mode); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Repr(__pyx_v_fn); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 592, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyObject_Repr(__pyx_v_read_fd); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyObject_Repr(__pyx_v_mode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 592, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyObject_Repr(__pyx_v_read_fd); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 592, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyObject_Repr(__pyx_v_write_fd); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyObject_Repr(__pyx_v_write_fd); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 592, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = PyTuple_New(4); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyTuple_New(4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 592, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_6, 3, __pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_5);
-  __pyx_t_2 = 0;
+  PyTuple_SET_ITEM(__pyx_t_6, 3, __pyx_t_5);
   __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
   __pyx_t_4 = 0;
   __pyx_t_5 = 0;
-  __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_8), ((PyObject *)__pyx_t_6)); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 552; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_5));
-  __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_5));
+  __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_TypedBytesFile_s_s_s_s, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 592, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_GIVEREF(__pyx_t_5);
   __Pyx_GOTREF(__pyx_v_self->_repr);
   __Pyx_DECREF(__pyx_v_self->_repr);
-  __pyx_v_self->_repr = ((PyObject *)__pyx_t_5);
+  __pyx_v_self->_repr = __pyx_t_5;
   __pyx_t_5 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":553
+  /* "hadoopy/_typedbytes.pyx":593
  *         cdef char *modec
  *         self._repr = "TypedBytesFile(%s, %s, %s, %s)" % (repr(fn), repr(mode), repr(read_fd), repr(write_fd))
  *         if fn:             # <<<<<<<<<<<<<<
  *             self.file_method = 'fn'
  *             if mode == None:
  */
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_v_fn); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_v_fn); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 593, __pyx_L1_error)
   if (__pyx_t_7) {
 
-    /* "hadoopy/_typedbytes.pyx":554
+    /* "hadoopy/_typedbytes.pyx":594
  *         self._repr = "TypedBytesFile(%s, %s, %s, %s)" % (repr(fn), repr(mode), repr(read_fd), repr(write_fd))
  *         if fn:
  *             self.file_method = 'fn'             # <<<<<<<<<<<<<<
  *             if mode == None:
  *                 mode = 'r'
  */
-    __Pyx_INCREF(((PyObject *)__pyx_n_s__fn));
-    __Pyx_GIVEREF(((PyObject *)__pyx_n_s__fn));
+    __Pyx_INCREF(__pyx_n_s_fn);
+    __Pyx_GIVEREF(__pyx_n_s_fn);
     __Pyx_GOTREF(__pyx_v_self->file_method);
     __Pyx_DECREF(__pyx_v_self->file_method);
-    __pyx_v_self->file_method = ((PyObject *)__pyx_n_s__fn);
+    __pyx_v_self->file_method = __pyx_n_s_fn;
 
-    /* "hadoopy/_typedbytes.pyx":555
+    /* "hadoopy/_typedbytes.pyx":595
  *         if fn:
  *             self.file_method = 'fn'
  *             if mode == None:             # <<<<<<<<<<<<<<
  *                 mode = 'r'
  *             fnc = PyString_AsString(fn)
  */
-    __pyx_t_5 = PyObject_RichCompare(__pyx_v_mode, Py_None, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = PyObject_RichCompare(__pyx_v_mode, Py_None, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 595, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 595, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     if (__pyx_t_7) {
 
-      /* "hadoopy/_typedbytes.pyx":556
+      /* "hadoopy/_typedbytes.pyx":596
  *             self.file_method = 'fn'
  *             if mode == None:
  *                 mode = 'r'             # <<<<<<<<<<<<<<
  *             fnc = PyString_AsString(fn)
  *             modec = PyString_AsString(mode)
  */
-      __Pyx_INCREF(((PyObject *)__pyx_n_s__r));
-      __Pyx_DECREF(__pyx_v_mode);
-      __pyx_v_mode = ((PyObject *)__pyx_n_s__r);
-      goto __pyx_L4;
+      __Pyx_INCREF(__pyx_n_s_r);
+      __Pyx_DECREF_SET(__pyx_v_mode, __pyx_n_s_r);
+
+      /* "hadoopy/_typedbytes.pyx":595
+ *         if fn:
+ *             self.file_method = 'fn'
+ *             if mode == None:             # <<<<<<<<<<<<<<
+ *                 mode = 'r'
+ *             fnc = PyString_AsString(fn)
+ */
     }
-    __pyx_L4:;
 
-    /* "hadoopy/_typedbytes.pyx":557
+    /* "hadoopy/_typedbytes.pyx":597
  *             if mode == None:
  *                 mode = 'r'
  *             fnc = PyString_AsString(fn)             # <<<<<<<<<<<<<<
@@ -4230,7 +5957,7 @@ static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx
  */
     __pyx_v_fnc = PyString_AsString(__pyx_v_fn);
 
-    /* "hadoopy/_typedbytes.pyx":558
+    /* "hadoopy/_typedbytes.pyx":598
  *                 mode = 'r'
  *             fnc = PyString_AsString(fn)
  *             modec = PyString_AsString(mode)             # <<<<<<<<<<<<<<
@@ -4239,7 +5966,7 @@ static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx
  */
     __pyx_v_modec = PyString_AsString(__pyx_v_mode);
 
-    /* "hadoopy/_typedbytes.pyx":559
+    /* "hadoopy/_typedbytes.pyx":599
  *             fnc = PyString_AsString(fn)
  *             modec = PyString_AsString(mode)
  *             self._write_ptr = self._read_ptr = fopen(fnc, modec)             # <<<<<<<<<<<<<<
@@ -4250,178 +5977,308 @@ static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx
     __pyx_v_self->_write_ptr = __pyx_t_8;
     __pyx_v_self->_read_ptr = __pyx_t_8;
 
-    /* "hadoopy/_typedbytes.pyx":560
+    /* "hadoopy/_typedbytes.pyx":600
  *             modec = PyString_AsString(mode)
  *             self._write_ptr = self._read_ptr = fopen(fnc, modec)
  *             if self._write_ptr == NULL:             # <<<<<<<<<<<<<<
  *                 raise IOError('Cannot open file [%s]' % fn)
  *         elif read_fd != None or write_fd != None:
  */
-    __pyx_t_7 = (__pyx_v_self->_write_ptr == NULL);
-    if (__pyx_t_7) {
+    __pyx_t_7 = ((__pyx_v_self->_write_ptr == NULL) != 0);
+    if (unlikely(__pyx_t_7)) {
 
-      /* "hadoopy/_typedbytes.pyx":561
+      /* "hadoopy/_typedbytes.pyx":601
  *             self._write_ptr = self._read_ptr = fopen(fnc, modec)
  *             if self._write_ptr == NULL:
  *                 raise IOError('Cannot open file [%s]' % fn)             # <<<<<<<<<<<<<<
  *         elif read_fd != None or write_fd != None:
  *             self.file_method = 'readwritefds'
  */
-      __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_v_fn); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(((PyObject *)__pyx_t_5));
-      __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_6, 0, ((PyObject *)__pyx_t_5));
-      __Pyx_GIVEREF(((PyObject *)__pyx_t_5));
-      __pyx_t_5 = 0;
-      __pyx_t_5 = PyObject_Call(__pyx_builtin_IOError, ((PyObject *)__pyx_t_6), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = __Pyx_PyString_FormatSafe(__pyx_kp_s_Cannot_open_file_s, __pyx_v_fn); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 601, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(((PyObject *)__pyx_t_6)); __pyx_t_6 = 0;
-      __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_IOError, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 601, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L5;
+      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __PYX_ERR(0, 601, __pyx_L1_error)
+
+      /* "hadoopy/_typedbytes.pyx":600
+ *             modec = PyString_AsString(mode)
+ *             self._write_ptr = self._read_ptr = fopen(fnc, modec)
+ *             if self._write_ptr == NULL:             # <<<<<<<<<<<<<<
+ *                 raise IOError('Cannot open file [%s]' % fn)
+ *         elif read_fd != None or write_fd != None:
+ */
     }
-    __pyx_L5:;
+
+    /* "hadoopy/_typedbytes.pyx":593
+ *         cdef char *modec
+ *         self._repr = "TypedBytesFile(%s, %s, %s, %s)" % (repr(fn), repr(mode), repr(read_fd), repr(write_fd))
+ *         if fn:             # <<<<<<<<<<<<<<
+ *             self.file_method = 'fn'
+ *             if mode == None:
+ */
     goto __pyx_L3;
   }
 
-  /* "hadoopy/_typedbytes.pyx":562
+  /* "hadoopy/_typedbytes.pyx":602
  *             if self._write_ptr == NULL:
  *                 raise IOError('Cannot open file [%s]' % fn)
  *         elif read_fd != None or write_fd != None:             # <<<<<<<<<<<<<<
  *             self.file_method = 'readwritefds'
  *             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0
  */
-  __pyx_t_5 = PyObject_RichCompare(__pyx_v_read_fd, Py_None, Py_NE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (!__pyx_t_7) {
-    __pyx_t_5 = PyObject_RichCompare(__pyx_v_write_fd, Py_None, Py_NE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_9 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_10 = __pyx_t_9;
+  __pyx_t_6 = PyObject_RichCompare(__pyx_v_read_fd, Py_None, Py_NE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 602, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 602, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!__pyx_t_9) {
   } else {
-    __pyx_t_10 = __pyx_t_7;
+    __pyx_t_7 = __pyx_t_9;
+    goto __pyx_L6_bool_binop_done;
   }
-  if (__pyx_t_10) {
+  __pyx_t_6 = PyObject_RichCompare(__pyx_v_write_fd, Py_None, Py_NE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 602, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 602, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_7 = __pyx_t_9;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_7) {
 
-    /* "hadoopy/_typedbytes.pyx":563
+    /* "hadoopy/_typedbytes.pyx":603
  *                 raise IOError('Cannot open file [%s]' % fn)
  *         elif read_fd != None or write_fd != None:
  *             self.file_method = 'readwritefds'             # <<<<<<<<<<<<<<
  *             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0
  *             if unbuffered_reads:
  */
-    __Pyx_INCREF(((PyObject *)__pyx_n_s__readwritefds));
-    __Pyx_GIVEREF(((PyObject *)__pyx_n_s__readwritefds));
+    __Pyx_INCREF(__pyx_n_s_readwritefds);
+    __Pyx_GIVEREF(__pyx_n_s_readwritefds);
     __Pyx_GOTREF(__pyx_v_self->file_method);
     __Pyx_DECREF(__pyx_v_self->file_method);
-    __pyx_v_self->file_method = ((PyObject *)__pyx_n_s__readwritefds);
+    __pyx_v_self->file_method = __pyx_n_s_readwritefds;
 
-    /* "hadoopy/_typedbytes.pyx":564
+    /* "hadoopy/_typedbytes.pyx":604
  *         elif read_fd != None or write_fd != None:
  *             self.file_method = 'readwritefds'
  *             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0             # <<<<<<<<<<<<<<
  *             if unbuffered_reads:
  *                 setvbuf(self._read_ptr, <char *>0, 2, 0)
  */
-    __pyx_t_5 = PyObject_RichCompare(__pyx_v_read_fd, Py_None, Py_NE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (__pyx_t_10) {
-      __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_v_read_fd); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_11 = fdopen(__pyx_t_3, __pyx_k__r);
+    __pyx_t_6 = PyObject_RichCompare(__pyx_v_read_fd, Py_None, Py_NE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 604, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 604, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_7) {
+      __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_read_fd); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 604, __pyx_L1_error)
+      __pyx_t_8 = fdopen(__pyx_t_2, ((char *)"r"));
     } else {
-      __pyx_t_11 = ((void *)0);
+      __pyx_t_8 = ((void *)0);
     }
-    __pyx_v_self->_read_ptr = __pyx_t_11;
+    __pyx_v_self->_read_ptr = __pyx_t_8;
 
-    /* "hadoopy/_typedbytes.pyx":565
+    /* "hadoopy/_typedbytes.pyx":605
  *             self.file_method = 'readwritefds'
  *             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0
  *             if unbuffered_reads:             # <<<<<<<<<<<<<<
  *                 setvbuf(self._read_ptr, <char *>0, 2, 0)
- *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
+ *             elif read_buffer_size > 0 and self._read_ptr != NULL:
  */
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_v_unbuffered_reads); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (__pyx_t_10) {
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_v_unbuffered_reads); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 605, __pyx_L1_error)
+    if (__pyx_t_7) {
 
-      /* "hadoopy/_typedbytes.pyx":566
+      /* "hadoopy/_typedbytes.pyx":606
  *             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0
  *             if unbuffered_reads:
  *                 setvbuf(self._read_ptr, <char *>0, 2, 0)             # <<<<<<<<<<<<<<
- *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
- *         else:
+ *             elif read_buffer_size > 0 and self._read_ptr != NULL:
+ *                 # glibc ignores the size unless we provide the buffer
+ */
+      (void)(setvbuf(__pyx_v_self->_read_ptr, ((char *)0), 2, 0));
+
+      /* "hadoopy/_typedbytes.pyx":605
+ *             self.file_method = 'readwritefds'
+ *             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0
+ *             if unbuffered_reads:             # <<<<<<<<<<<<<<
+ *                 setvbuf(self._read_ptr, <char *>0, 2, 0)
+ *             elif read_buffer_size > 0 and self._read_ptr != NULL:
  */
-      setvbuf(__pyx_v_self->_read_ptr, ((char *)0), 2, 0);
-      goto __pyx_L6;
+      goto __pyx_L8;
     }
-    __pyx_L6:;
 
-    /* "hadoopy/_typedbytes.pyx":567
+    /* "hadoopy/_typedbytes.pyx":607
  *             if unbuffered_reads:
  *                 setvbuf(self._read_ptr, <char *>0, 2, 0)
- *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0             # <<<<<<<<<<<<<<
- *         else:
- *             self.file_method = 'stdinout'
- */
-    __pyx_t_5 = PyObject_RichCompare(__pyx_v_write_fd, Py_None, Py_NE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_10 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (__pyx_t_10) {
-      __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_v_write_fd); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_11 = fdopen(__pyx_t_3, __pyx_k__w);
+ *             elif read_buffer_size > 0 and self._read_ptr != NULL:             # <<<<<<<<<<<<<<
+ *                 # glibc ignores the size unless we provide the buffer
+ *                 self._read_buf = <char*>malloc(read_buffer_size)
+ */
+    __pyx_t_6 = PyObject_RichCompare(__pyx_v_read_buffer_size, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 607, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 607, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_9) {
     } else {
-      __pyx_t_11 = ((void *)0);
+      __pyx_t_7 = __pyx_t_9;
+      goto __pyx_L9_bool_binop_done;
     }
-    __pyx_v_self->_write_ptr = __pyx_t_11;
-    goto __pyx_L3;
-  }
-  /*else*/ {
+    __pyx_t_9 = ((__pyx_v_self->_read_ptr != NULL) != 0);
+    __pyx_t_7 = __pyx_t_9;
+    __pyx_L9_bool_binop_done:;
+    if (__pyx_t_7) {
 
-    /* "hadoopy/_typedbytes.pyx":569
+      /* "hadoopy/_typedbytes.pyx":609
+ *             elif read_buffer_size > 0 and self._read_ptr != NULL:
+ *                 # glibc ignores the size unless we provide the buffer
+ *                 self._read_buf = <char*>malloc(read_buffer_size)             # <<<<<<<<<<<<<<
+ *                 setvbuf(self._read_ptr, self._read_buf, 0, read_buffer_size)  # 0 == _IOFBF
  *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
- *         else:
- *             self.file_method = 'stdinout'             # <<<<<<<<<<<<<<
- *             self._write_ptr = stdout
- *             self._read_ptr = stdin
  */
-    __Pyx_INCREF(((PyObject *)__pyx_n_s__stdinout));
-    __Pyx_GIVEREF(((PyObject *)__pyx_n_s__stdinout));
-    __Pyx_GOTREF(__pyx_v_self->file_method);
-    __Pyx_DECREF(__pyx_v_self->file_method);
-    __pyx_v_self->file_method = ((PyObject *)__pyx_n_s__stdinout);
+      __pyx_t_10 = __Pyx_PyInt_As_size_t(__pyx_v_read_buffer_size); if (unlikely((__pyx_t_10 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 609, __pyx_L1_error)
+      __pyx_v_self->_read_buf = ((char *)malloc(__pyx_t_10));
 
-    /* "hadoopy/_typedbytes.pyx":570
- *         else:
- *             self.file_method = 'stdinout'
- *             self._write_ptr = stdout             # <<<<<<<<<<<<<<
- *             self._read_ptr = stdin
- * 
+      /* "hadoopy/_typedbytes.pyx":610
+ *                 # glibc ignores the size unless we provide the buffer
+ *                 self._read_buf = <char*>malloc(read_buffer_size)
+ *                 setvbuf(self._read_ptr, self._read_buf, 0, read_buffer_size)  # 0 == _IOFBF             # <<<<<<<<<<<<<<
+ *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
+ *             if write_buffer_size > 0 and self._write_ptr != NULL:
  */
-    __pyx_v_self->_write_ptr = stdout;
+      __pyx_t_10 = __Pyx_PyInt_As_size_t(__pyx_v_read_buffer_size); if (unlikely((__pyx_t_10 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 610, __pyx_L1_error)
+      (void)(setvbuf(__pyx_v_self->_read_ptr, __pyx_v_self->_read_buf, 0, __pyx_t_10));
 
-    /* "hadoopy/_typedbytes.pyx":571
- *             self.file_method = 'stdinout'
- *             self._write_ptr = stdout
- *             self._read_ptr = stdin             # <<<<<<<<<<<<<<
- * 
+      /* "hadoopy/_typedbytes.pyx":607
+ *             if unbuffered_reads:
+ *                 setvbuf(self._read_ptr, <char *>0, 2, 0)
+ *             elif read_buffer_size > 0 and self._read_ptr != NULL:             # <<<<<<<<<<<<<<
+ *                 # glibc ignores the size unless we provide the buffer
+ *                 self._read_buf = <char*>malloc(read_buffer_size)
+ */
+    }
+    __pyx_L8:;
+
+    /* "hadoopy/_typedbytes.pyx":611
+ *                 self._read_buf = <char*>malloc(read_buffer_size)
+ *                 setvbuf(self._read_ptr, self._read_buf, 0, read_buffer_size)  # 0 == _IOFBF
+ *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0             # <<<<<<<<<<<<<<
+ *             if write_buffer_size > 0 and self._write_ptr != NULL:
+ *                 self._write_buf = <char*>malloc(write_buffer_size)
+ */
+    __pyx_t_6 = PyObject_RichCompare(__pyx_v_write_fd, Py_None, Py_NE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 611, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 611, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_7) {
+      __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_write_fd); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 611, __pyx_L1_error)
+      __pyx_t_8 = fdopen(__pyx_t_2, ((char *)"w"));
+    } else {
+      __pyx_t_8 = ((void *)0);
+    }
+    __pyx_v_self->_write_ptr = __pyx_t_8;
+
+    /* "hadoopy/_typedbytes.pyx":612
+ *                 setvbuf(self._read_ptr, self._read_buf, 0, read_buffer_size)  # 0 == _IOFBF
+ *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
+ *             if write_buffer_size > 0 and self._write_ptr != NULL:             # <<<<<<<<<<<<<<
+ *                 self._write_buf = <char*>malloc(write_buffer_size)
+ *                 setvbuf(self._write_ptr, self._write_buf, 0, write_buffer_size)  # 0 == _IOFBF
+ */
+    __pyx_t_6 = PyObject_RichCompare(__pyx_v_write_buffer_size, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 612, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 612, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_9) {
+    } else {
+      __pyx_t_7 = __pyx_t_9;
+      goto __pyx_L12_bool_binop_done;
+    }
+    __pyx_t_9 = ((__pyx_v_self->_write_ptr != NULL) != 0);
+    __pyx_t_7 = __pyx_t_9;
+    __pyx_L12_bool_binop_done:;
+    if (__pyx_t_7) {
+
+      /* "hadoopy/_typedbytes.pyx":613
+ *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
+ *             if write_buffer_size > 0 and self._write_ptr != NULL:
+ *                 self._write_buf = <char*>malloc(write_buffer_size)             # <<<<<<<<<<<<<<
+ *                 setvbuf(self._write_ptr, self._write_buf, 0, write_buffer_size)  # 0 == _IOFBF
+ *         else:
+ */
+      __pyx_t_10 = __Pyx_PyInt_As_size_t(__pyx_v_write_buffer_size); if (unlikely((__pyx_t_10 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 613, __pyx_L1_error)
+      __pyx_v_self->_write_buf = ((char *)malloc(__pyx_t_10));
+
+      /* "hadoopy/_typedbytes.pyx":614
+ *             if write_buffer_size > 0 and self._write_ptr != NULL:
+ *                 self._write_buf = <char*>malloc(write_buffer_size)
+ *                 setvbuf(self._write_ptr, self._write_buf, 0, write_buffer_size)  # 0 == _IOFBF             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.file_method = 'stdinout'
+ */
+      __pyx_t_10 = __Pyx_PyInt_As_size_t(__pyx_v_write_buffer_size); if (unlikely((__pyx_t_10 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 614, __pyx_L1_error)
+      (void)(setvbuf(__pyx_v_self->_write_ptr, __pyx_v_self->_write_buf, 0, __pyx_t_10));
+
+      /* "hadoopy/_typedbytes.pyx":612
+ *                 setvbuf(self._read_ptr, self._read_buf, 0, read_buffer_size)  # 0 == _IOFBF
+ *             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
+ *             if write_buffer_size > 0 and self._write_ptr != NULL:             # <<<<<<<<<<<<<<
+ *                 self._write_buf = <char*>malloc(write_buffer_size)
+ *                 setvbuf(self._write_ptr, self._write_buf, 0, write_buffer_size)  # 0 == _IOFBF
+ */
+    }
+
+    /* "hadoopy/_typedbytes.pyx":602
+ *             if self._write_ptr == NULL:
+ *                 raise IOError('Cannot open file [%s]' % fn)
+ *         elif read_fd != None or write_fd != None:             # <<<<<<<<<<<<<<
+ *             self.file_method = 'readwritefds'
+ *             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0
+ */
+    goto __pyx_L3;
+  }
+
+  /* "hadoopy/_typedbytes.pyx":616
+ *                 setvbuf(self._write_ptr, self._write_buf, 0, write_buffer_size)  # 0 == _IOFBF
+ *         else:
+ *             self.file_method = 'stdinout'             # <<<<<<<<<<<<<<
+ *             self._write_ptr = stdout
+ *             self._read_ptr = stdin
+ */
+  /*else*/ {
+    __Pyx_INCREF(__pyx_n_s_stdinout);
+    __Pyx_GIVEREF(__pyx_n_s_stdinout);
+    __Pyx_GOTREF(__pyx_v_self->file_method);
+    __Pyx_DECREF(__pyx_v_self->file_method);
+    __pyx_v_self->file_method = __pyx_n_s_stdinout;
+
+    /* "hadoopy/_typedbytes.pyx":617
+ *         else:
+ *             self.file_method = 'stdinout'
+ *             self._write_ptr = stdout             # <<<<<<<<<<<<<<
+ *             self._read_ptr = stdin
+ * 
+ */
+    __pyx_v_self->_write_ptr = stdout;
+
+    /* "hadoopy/_typedbytes.pyx":618
+ *             self.file_method = 'stdinout'
+ *             self._write_ptr = stdout
+ *             self._read_ptr = stdin             # <<<<<<<<<<<<<<
+ * 
  *     cdef _close(self):
  */
     __pyx_v_self->_read_ptr = stdin;
   }
   __pyx_L3:;
 
+  /* "hadoopy/_typedbytes.pyx":586
+ *     cdef object _batch_error
+ *     cdef int flush_writes
+ *     def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False, read_buffer_size=0, write_buffer_size=0):             # <<<<<<<<<<<<<<
+ *         self.flush_writes = int(flush_writes)
+ *         self._read_buf = NULL
+ */
+
+  /* function exit code */
   __pyx_r = 0;
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
@@ -4433,7 +6290,7 @@ static int __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile___init__(struct __pyx
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":573
+/* "hadoopy/_typedbytes.pyx":620
  *             self._read_ptr = stdin
  * 
  *     cdef _close(self):             # <<<<<<<<<<<<<<
@@ -4451,28 +6308,28 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile__close(struct __
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_close", 0);
 
-  /* "hadoopy/_typedbytes.pyx":574
+  /* "hadoopy/_typedbytes.pyx":621
  * 
  *     cdef _close(self):
  *         self.flush()             # <<<<<<<<<<<<<<
  *         if self.file_method == 'readwritefds':
  *             if self._write_ptr:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->flush(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 574; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->flush(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 621, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":575
+  /* "hadoopy/_typedbytes.pyx":622
  *     cdef _close(self):
  *         self.flush()
  *         if self.file_method == 'readwritefds':             # <<<<<<<<<<<<<<
  *             if self._write_ptr:
  *                 fclose(self._write_ptr)
  */
-  __pyx_t_2 = __Pyx_PyString_Equals(__pyx_v_self->file_method, ((PyObject *)__pyx_n_s__readwritefds), Py_EQ); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 575; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__Pyx_PyString_Equals(__pyx_v_self->file_method, __pyx_n_s_readwritefds, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 622, __pyx_L1_error)
   if (__pyx_t_2) {
 
-    /* "hadoopy/_typedbytes.pyx":576
+    /* "hadoopy/_typedbytes.pyx":623
  *         self.flush()
  *         if self.file_method == 'readwritefds':
  *             if self._write_ptr:             # <<<<<<<<<<<<<<
@@ -4482,19 +6339,25 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile__close(struct __
     __pyx_t_2 = (__pyx_v_self->_write_ptr != 0);
     if (__pyx_t_2) {
 
-      /* "hadoopy/_typedbytes.pyx":577
+      /* "hadoopy/_typedbytes.pyx":624
  *         if self.file_method == 'readwritefds':
  *             if self._write_ptr:
  *                 fclose(self._write_ptr)             # <<<<<<<<<<<<<<
  *             if self._read_ptr:
  *                 fclose(self._read_ptr)
  */
-      fclose(__pyx_v_self->_write_ptr);
-      goto __pyx_L4;
+      (void)(fclose(__pyx_v_self->_write_ptr));
+
+      /* "hadoopy/_typedbytes.pyx":623
+ *         self.flush()
+ *         if self.file_method == 'readwritefds':
+ *             if self._write_ptr:             # <<<<<<<<<<<<<<
+ *                 fclose(self._write_ptr)
+ *             if self._read_ptr:
+ */
     }
-    __pyx_L4:;
 
-    /* "hadoopy/_typedbytes.pyx":578
+    /* "hadoopy/_typedbytes.pyx":625
  *             if self._write_ptr:
  *                 fclose(self._write_ptr)
  *             if self._read_ptr:             # <<<<<<<<<<<<<<
@@ -4504,60 +6367,126 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile__close(struct __
     __pyx_t_2 = (__pyx_v_self->_read_ptr != 0);
     if (__pyx_t_2) {
 
-      /* "hadoopy/_typedbytes.pyx":579
+      /* "hadoopy/_typedbytes.pyx":626
  *                 fclose(self._write_ptr)
  *             if self._read_ptr:
  *                 fclose(self._read_ptr)             # <<<<<<<<<<<<<<
  *         elif self.file_method == 'stdinout':
  *             fclose(self._write_ptr)
  */
-      fclose(__pyx_v_self->_read_ptr);
-      goto __pyx_L5;
+      (void)(fclose(__pyx_v_self->_read_ptr));
+
+      /* "hadoopy/_typedbytes.pyx":625
+ *             if self._write_ptr:
+ *                 fclose(self._write_ptr)
+ *             if self._read_ptr:             # <<<<<<<<<<<<<<
+ *                 fclose(self._read_ptr)
+ *         elif self.file_method == 'stdinout':
+ */
     }
-    __pyx_L5:;
+
+    /* "hadoopy/_typedbytes.pyx":622
+ *     cdef _close(self):
+ *         self.flush()
+ *         if self.file_method == 'readwritefds':             # <<<<<<<<<<<<<<
+ *             if self._write_ptr:
+ *                 fclose(self._write_ptr)
+ */
     goto __pyx_L3;
   }
 
-  /* "hadoopy/_typedbytes.pyx":580
+  /* "hadoopy/_typedbytes.pyx":627
  *             if self._read_ptr:
  *                 fclose(self._read_ptr)
  *         elif self.file_method == 'stdinout':             # <<<<<<<<<<<<<<
  *             fclose(self._write_ptr)
  *         self._write_ptr = NULL
  */
-  __pyx_t_2 = __Pyx_PyString_Equals(__pyx_v_self->file_method, ((PyObject *)__pyx_n_s__stdinout), Py_EQ); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 580; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = (__Pyx_PyString_Equals(__pyx_v_self->file_method, __pyx_n_s_stdinout, Py_EQ)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 627, __pyx_L1_error)
   if (__pyx_t_2) {
 
-    /* "hadoopy/_typedbytes.pyx":581
+    /* "hadoopy/_typedbytes.pyx":628
  *                 fclose(self._read_ptr)
  *         elif self.file_method == 'stdinout':
  *             fclose(self._write_ptr)             # <<<<<<<<<<<<<<
  *         self._write_ptr = NULL
  *         self._read_ptr = NULL
  */
-    fclose(__pyx_v_self->_write_ptr);
-    goto __pyx_L3;
+    (void)(fclose(__pyx_v_self->_write_ptr));
+
+    /* "hadoopy/_typedbytes.pyx":627
+ *             if self._read_ptr:
+ *                 fclose(self._read_ptr)
+ *         elif self.file_method == 'stdinout':             # <<<<<<<<<<<<<<
+ *             fclose(self._write_ptr)
+ *         self._write_ptr = NULL
+ */
   }
   __pyx_L3:;
 
-  /* "hadoopy/_typedbytes.pyx":582
+  /* "hadoopy/_typedbytes.pyx":629
  *         elif self.file_method == 'stdinout':
  *             fclose(self._write_ptr)
  *         self._write_ptr = NULL             # <<<<<<<<<<<<<<
  *         self._read_ptr = NULL
- * 
+ *         free(self._read_buf)
  */
   __pyx_v_self->_write_ptr = NULL;
 
-  /* "hadoopy/_typedbytes.pyx":583
+  /* "hadoopy/_typedbytes.pyx":630
  *             fclose(self._write_ptr)
  *         self._write_ptr = NULL
  *         self._read_ptr = NULL             # <<<<<<<<<<<<<<
+ *         free(self._read_buf)
+ *         self._read_buf = NULL
+ */
+  __pyx_v_self->_read_ptr = NULL;
+
+  /* "hadoopy/_typedbytes.pyx":631
+ *         self._write_ptr = NULL
+ *         self._read_ptr = NULL
+ *         free(self._read_buf)             # <<<<<<<<<<<<<<
+ *         self._read_buf = NULL
+ *         free(self._write_buf)
+ */
+  free(__pyx_v_self->_read_buf);
+
+  /* "hadoopy/_typedbytes.pyx":632
+ *         self._read_ptr = NULL
+ *         free(self._read_buf)
+ *         self._read_buf = NULL             # <<<<<<<<<<<<<<
+ *         free(self._write_buf)
+ *         self._write_buf = NULL
+ */
+  __pyx_v_self->_read_buf = NULL;
+
+  /* "hadoopy/_typedbytes.pyx":633
+ *         free(self._read_buf)
+ *         self._read_buf = NULL
+ *         free(self._write_buf)             # <<<<<<<<<<<<<<
+ *         self._write_buf = NULL
+ * 
+ */
+  free(__pyx_v_self->_write_buf);
+
+  /* "hadoopy/_typedbytes.pyx":634
+ *         self._read_buf = NULL
+ *         free(self._write_buf)
+ *         self._write_buf = NULL             # <<<<<<<<<<<<<<
  * 
  *     def __repr__(self):
  */
-  __pyx_v_self->_read_ptr = NULL;
+  __pyx_v_self->_write_buf = NULL;
+
+  /* "hadoopy/_typedbytes.pyx":620
+ *             self._read_ptr = stdin
+ * 
+ *     cdef _close(self):             # <<<<<<<<<<<<<<
+ *         self.flush()
+ *         if self.file_method == 'readwritefds':
+ */
 
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -4570,6 +6499,14 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile__close(struct __
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":636
+ *         self._write_buf = NULL
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return self._repr
+ * 
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_3__repr__(PyObject *__pyx_v_self); /*proto*/
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_3__repr__(PyObject *__pyx_v_self) {
@@ -4577,24 +6514,18 @@ static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_3__repr__(PyObj
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_2__repr__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":585
- *         self._read_ptr = NULL
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         return self._repr
- * 
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_2__repr__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "hadoopy/_typedbytes.pyx":586
+  /* "hadoopy/_typedbytes.pyx":637
  * 
  *     def __repr__(self):
  *         return self._repr             # <<<<<<<<<<<<<<
@@ -4606,13 +6537,29 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_2__repr__(struc
   __pyx_r = __pyx_v_self->_repr;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  /* "hadoopy/_typedbytes.pyx":636
+ *         self._write_buf = NULL
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return self._repr
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":639
+ *         return self._repr
+ * 
+ *     def __enter__(self):             # <<<<<<<<<<<<<<
+ *         return self
+ * 
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_5__enter__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_5__enter__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
@@ -4620,24 +6567,18 @@ static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_5__enter__(PyOb
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__enter__ (wrapper)", 0);
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_4__enter__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":588
- *         return self._repr
- * 
- *     def __enter__(self):             # <<<<<<<<<<<<<<
- *         return self
- * 
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_4__enter__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__enter__", 0);
 
-  /* "hadoopy/_typedbytes.pyx":589
+  /* "hadoopy/_typedbytes.pyx":640
  * 
  *     def __enter__(self):
  *         return self             # <<<<<<<<<<<<<<
@@ -4649,56 +6590,77 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_4__enter__(stru
   __pyx_r = ((PyObject *)__pyx_v_self);
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  /* "hadoopy/_typedbytes.pyx":639
+ *         return self._repr
+ * 
+ *     def __enter__(self):             # <<<<<<<<<<<<<<
+ *         return self
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":642
+ *         return self
+ * 
+ *     def __exit__(self, type, value, traceback):             # <<<<<<<<<<<<<<
+ *         self._close()
+ * 
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_7__exit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_7__exit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   CYTHON_UNUSED PyObject *__pyx_v_type = 0;
   CYTHON_UNUSED PyObject *__pyx_v_value = 0;
   CYTHON_UNUSED PyObject *__pyx_v_traceback = 0;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__type,&__pyx_n_s__value,&__pyx_n_s__traceback,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__exit__ (wrapper)", 0);
   {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_type,&__pyx_n_s_value,&__pyx_n_s_traceback,0};
     PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__type);
-        if (likely(values[0])) kw_args--;
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_type)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
         case  1:
-        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__value);
-        if (likely(values[1])) kw_args--;
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__exit__", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__exit__", 1, 3, 3, 1); __PYX_ERR(0, 642, __pyx_L3_error)
         }
+        CYTHON_FALLTHROUGH;
         case  2:
-        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__traceback);
-        if (likely(values[2])) kw_args--;
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_traceback)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__exit__", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__exit__", 1, 3, 3, 2); __PYX_ERR(0, 642, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__exit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__exit__") < 0)) __PYX_ERR(0, 642, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -4713,25 +6675,19 @@ static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_7__exit__(PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__exit__", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__exit__", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 642, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.__exit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_6__exit__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), __pyx_v_type, __pyx_v_value, __pyx_v_traceback);
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":591
- *         return self
- * 
- *     def __exit__(self, type, value, traceback):             # <<<<<<<<<<<<<<
- *         self._close()
- * 
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_6__exit__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_type, CYTHON_UNUSED PyObject *__pyx_v_value, CYTHON_UNUSED PyObject *__pyx_v_traceback) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -4741,17 +6697,26 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_6__exit__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__exit__", 0);
 
-  /* "hadoopy/_typedbytes.pyx":592
+  /* "hadoopy/_typedbytes.pyx":643
  * 
  *     def __exit__(self, type, value, traceback):
  *         self._close()             # <<<<<<<<<<<<<<
  * 
  *     def __del__(self):
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->_close(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 592; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->_close(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 643, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "hadoopy/_typedbytes.pyx":642
+ *         return self
+ * 
+ *     def __exit__(self, type, value, traceback):             # <<<<<<<<<<<<<<
+ *         self._close()
+ * 
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -4764,6 +6729,14 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_6__exit__(struc
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":645
+ *         self._close()
+ * 
+ *     def __del__(self):             # <<<<<<<<<<<<<<
+ *         self._close()
+ * 
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_9__del__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_9__del__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
@@ -4771,18 +6744,12 @@ static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_9__del__(PyObje
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_8__del__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":594
- *         self._close()
- * 
- *     def __del__(self):             # <<<<<<<<<<<<<<
- *         self._close()
- * 
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_8__del__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -4792,17 +6759,26 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_8__del__(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__del__", 0);
 
-  /* "hadoopy/_typedbytes.pyx":595
+  /* "hadoopy/_typedbytes.pyx":646
  * 
  *     def __del__(self):
  *         self._close()             # <<<<<<<<<<<<<<
  * 
  *     def __iter__(self):
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->_close(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->_close(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 646, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "hadoopy/_typedbytes.pyx":645
+ *         self._close()
+ * 
+ *     def __del__(self):             # <<<<<<<<<<<<<<
+ *         self._close()
+ * 
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -4815,6 +6791,14 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_8__del__(struct
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":648
+ *         self._close()
+ * 
+ *     def __iter__(self):             # <<<<<<<<<<<<<<
+ *         return self
+ * 
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_11__iter__(PyObject *__pyx_v_self); /*proto*/
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_11__iter__(PyObject *__pyx_v_self) {
@@ -4822,24 +6806,18 @@ static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_11__iter__(PyOb
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__iter__ (wrapper)", 0);
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_10__iter__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":597
- *         self._close()
- * 
- *     def __iter__(self):             # <<<<<<<<<<<<<<
- *         return self
- * 
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_10__iter__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__iter__", 0);
 
-  /* "hadoopy/_typedbytes.pyx":598
+  /* "hadoopy/_typedbytes.pyx":649
  * 
  *     def __iter__(self):
  *         return self             # <<<<<<<<<<<<<<
@@ -4851,13 +6829,29 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_10__iter__(stru
   __pyx_r = ((PyObject *)__pyx_v_self);
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  /* "hadoopy/_typedbytes.pyx":648
+ *         self._close()
+ * 
+ *     def __iter__(self):             # <<<<<<<<<<<<<<
+ *         return self
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":651
+ *         return self
+ * 
+ *     def __next__(self):             # <<<<<<<<<<<<<<
+ *         if self._read_ptr == <void *>0:
+ *             raise ValueError("Read pointer not set!")
+ */
+
 /* Python wrapper */
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_13__next__(PyObject *__pyx_v_self); /*proto*/
 static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_13__next__(PyObject *__pyx_v_self) {
@@ -4865,18 +6859,12 @@ static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_13__next__(PyOb
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__next__ (wrapper)", 0);
   __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_12__next__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":600
- *         return self
- * 
- *     def __next__(self):             # <<<<<<<<<<<<<<
- *         if self._read_ptr == <void *>0:
- *             raise ValueError("Read pointer not set!")
- */
-
 static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_12__next__(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -4887,48 +6875,61 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_12__next__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__next__", 0);
 
-  /* "hadoopy/_typedbytes.pyx":601
+  /* "hadoopy/_typedbytes.pyx":652
  * 
  *     def __next__(self):
  *         if self._read_ptr == <void *>0:             # <<<<<<<<<<<<<<
  *             raise ValueError("Read pointer not set!")
  *         return __read_key_value_tb(self._read_ptr)
  */
-  __pyx_t_1 = (__pyx_v_self->_read_ptr == ((void *)0));
-  if (__pyx_t_1) {
+  __pyx_t_1 = ((__pyx_v_self->_read_ptr == ((void *)0)) != 0);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "hadoopy/_typedbytes.pyx":602
+    /* "hadoopy/_typedbytes.pyx":653
  *     def __next__(self):
  *         if self._read_ptr == <void *>0:
  *             raise ValueError("Read pointer not set!")             # <<<<<<<<<<<<<<
  *         return __read_key_value_tb(self._read_ptr)
  * 
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_11), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 653, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L3;
+    __PYX_ERR(0, 653, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":652
+ * 
+ *     def __next__(self):
+ *         if self._read_ptr == <void *>0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Read pointer not set!")
+ *         return __read_key_value_tb(self._read_ptr)
+ */
   }
-  __pyx_L3:;
 
-  /* "hadoopy/_typedbytes.pyx":603
+  /* "hadoopy/_typedbytes.pyx":654
  *         if self._read_ptr == <void *>0:
  *             raise ValueError("Read pointer not set!")
  *         return __read_key_value_tb(self._read_ptr)             # <<<<<<<<<<<<<<
  * 
- *     def write(self, kv):
+ *     def next_batch(self, int n=1024):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes___read_key_value_tb(__pyx_v_self->_read_ptr); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 603; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes___read_key_value_tb(__pyx_v_self->_read_ptr); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 654, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* "hadoopy/_typedbytes.pyx":651
+ *         return self
+ * 
+ *     def __next__(self):             # <<<<<<<<<<<<<<
+ *         if self._read_ptr == <void *>0:
+ *             raise ValueError("Read pointer not set!")
+ */
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.__next__", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -4939,26 +6940,471 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_12__next__(stru
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":656
+ *         return __read_key_value_tb(self._read_ptr)
+ * 
+ *     def next_batch(self, int n=1024):             # <<<<<<<<<<<<<<
+ *         """Read up to n KeyValue pairs with one call
+ * 
+ */
+
 /* Python wrapper */
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_15write(PyObject *__pyx_v_self, PyObject *__pyx_v_kv); /*proto*/
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_15write(PyObject *__pyx_v_self, PyObject *__pyx_v_kv) {
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_15next_batch(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_19_hadoopy_typedbytes_14TypedBytesFile_14next_batch[] = "Read up to n KeyValue pairs with one call\n\n        Blocks until n pairs are read or the stream ends.  If reading fails\n        after some pairs were read, those are returned and the error is raised\n        by the next call.\n\n        :param n: Max number of KeyValue pairs to read (default 1024)\n        :returns: List of (key, value), shorter than n only at the end of the stream\n        :raises: StopIteration: If there are no KeyValue pairs left\n        ";
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_15next_batch(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_n;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("write (wrapper)", 0);
-  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14write(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), ((PyObject *)__pyx_v_kv));
+  __Pyx_RefNannySetupContext("next_batch (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "next_batch") < 0)) __PYX_ERR(0, 656, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_n = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 656, __pyx_L3_error)
+    } else {
+      __pyx_v_n = ((int)0x400);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("next_batch", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 656, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.next_batch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14next_batch(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), __pyx_v_n);
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":605
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14next_batch(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, int __pyx_v_n) {
+  CYTHON_UNUSED int __pyx_v_x;
+  PyObject *__pyx_v_e = NULL;
+  PyObject *__pyx_v_out = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("next_batch", 0);
+
+  /* "hadoopy/_typedbytes.pyx":668
+ *         """
+ *         cdef int x
+ *         if self._read_ptr == <void *>0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Read pointer not set!")
+ *         if self._batch_error is not None:
+ */
+  __pyx_t_1 = ((__pyx_v_self->_read_ptr == ((void *)0)) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "hadoopy/_typedbytes.pyx":669
+ *         cdef int x
+ *         if self._read_ptr == <void *>0:
+ *             raise ValueError("Read pointer not set!")             # <<<<<<<<<<<<<<
+ *         if self._batch_error is not None:
+ *             e, self._batch_error = self._batch_error, None
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 669, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 669, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":668
+ *         """
+ *         cdef int x
+ *         if self._read_ptr == <void *>0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Read pointer not set!")
+ *         if self._batch_error is not None:
+ */
+  }
+
+  /* "hadoopy/_typedbytes.pyx":670
+ *         if self._read_ptr == <void *>0:
+ *             raise ValueError("Read pointer not set!")
+ *         if self._batch_error is not None:             # <<<<<<<<<<<<<<
+ *             e, self._batch_error = self._batch_error, None
+ *             raise e
+ */
+  __pyx_t_1 = (__pyx_v_self->_batch_error != Py_None);
+  __pyx_t_3 = (__pyx_t_1 != 0);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "hadoopy/_typedbytes.pyx":671
+ *             raise ValueError("Read pointer not set!")
+ *         if self._batch_error is not None:
+ *             e, self._batch_error = self._batch_error, None             # <<<<<<<<<<<<<<
+ *             raise e
+ *         out = []
+ */
+    __pyx_t_2 = __pyx_v_self->_batch_error;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_4 = Py_None;
+    __Pyx_INCREF(__pyx_t_4);
+    __pyx_v_e = __pyx_t_2;
+    __pyx_t_2 = 0;
+    __Pyx_GIVEREF(__pyx_t_4);
+    __Pyx_GOTREF(__pyx_v_self->_batch_error);
+    __Pyx_DECREF(__pyx_v_self->_batch_error);
+    __pyx_v_self->_batch_error = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "hadoopy/_typedbytes.pyx":672
+ *         if self._batch_error is not None:
+ *             e, self._batch_error = self._batch_error, None
+ *             raise e             # <<<<<<<<<<<<<<
+ *         out = []
+ *         for x in range(n):
+ */
+    __Pyx_Raise(__pyx_v_e, 0, 0, 0);
+    __PYX_ERR(0, 672, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":670
+ *         if self._read_ptr == <void *>0:
+ *             raise ValueError("Read pointer not set!")
+ *         if self._batch_error is not None:             # <<<<<<<<<<<<<<
+ *             e, self._batch_error = self._batch_error, None
+ *             raise e
+ */
+  }
+
+  /* "hadoopy/_typedbytes.pyx":673
+ *             e, self._batch_error = self._batch_error, None
+ *             raise e
+ *         out = []             # <<<<<<<<<<<<<<
+ *         for x in range(n):
+ *             try:
+ */
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 673, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_out = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "hadoopy/_typedbytes.pyx":674
+ *             raise e
+ *         out = []
+ *         for x in range(n):             # <<<<<<<<<<<<<<
+ *             try:
+ *                 out.append(__read_key_value_tb(self._read_ptr))
+ */
+  __pyx_t_5 = __pyx_v_n;
+  __pyx_t_6 = __pyx_t_5;
+  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+    __pyx_v_x = __pyx_t_7;
+
+    /* "hadoopy/_typedbytes.pyx":675
+ *         out = []
+ *         for x in range(n):
+ *             try:             # <<<<<<<<<<<<<<
+ *                 out.append(__read_key_value_tb(self._read_ptr))
+ *             except StopIteration:
+ */
+    {
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __Pyx_ExceptionSave(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      /*try:*/ {
+
+        /* "hadoopy/_typedbytes.pyx":676
+ *         for x in range(n):
+ *             try:
+ *                 out.append(__read_key_value_tb(self._read_ptr))             # <<<<<<<<<<<<<<
+ *             except StopIteration:
+ *                 break
+ */
+        __pyx_t_4 = __pyx_f_19_hadoopy_typedbytes___read_key_value_tb(__pyx_v_self->_read_ptr); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 676, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_11 = __Pyx_PyList_Append(__pyx_v_out, __pyx_t_4); if (unlikely(__pyx_t_11 == ((int)-1))) __PYX_ERR(0, 676, __pyx_L7_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+        /* "hadoopy/_typedbytes.pyx":675
+ *         out = []
+ *         for x in range(n):
+ *             try:             # <<<<<<<<<<<<<<
+ *                 out.append(__read_key_value_tb(self._read_ptr))
+ *             except StopIteration:
+ */
+      }
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      goto __pyx_L14_try_end;
+      __pyx_L7_error:;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "hadoopy/_typedbytes.pyx":677
+ *             try:
+ *                 out.append(__read_key_value_tb(self._read_ptr))
+ *             except StopIteration:             # <<<<<<<<<<<<<<
+ *                 break
+ *             except Exception as e:
+ */
+      __pyx_t_12 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_StopIteration);
+      if (__pyx_t_12) {
+        __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.next_batch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+        if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_2, &__pyx_t_13) < 0) __PYX_ERR(0, 677, __pyx_L9_except_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_GOTREF(__pyx_t_13);
+
+        /* "hadoopy/_typedbytes.pyx":678
+ *                 out.append(__read_key_value_tb(self._read_ptr))
+ *             except StopIteration:
+ *                 break             # <<<<<<<<<<<<<<
+ *             except Exception as e:
+ *                 if not out:
+ */
+        goto __pyx_L15_except_break;
+        __pyx_L15_except_break:;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        goto __pyx_L12_try_break;
+      }
+
+      /* "hadoopy/_typedbytes.pyx":679
+ *             except StopIteration:
+ *                 break
+ *             except Exception as e:             # <<<<<<<<<<<<<<
+ *                 if not out:
+ *                     raise
+ */
+      __pyx_t_12 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+      if (__pyx_t_12) {
+        __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.next_batch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+        if (__Pyx_GetException(&__pyx_t_13, &__pyx_t_2, &__pyx_t_4) < 0) __PYX_ERR(0, 679, __pyx_L9_except_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_2);
+        __pyx_v_e = __pyx_t_2;
+
+        /* "hadoopy/_typedbytes.pyx":680
+ *                 break
+ *             except Exception as e:
+ *                 if not out:             # <<<<<<<<<<<<<<
+ *                     raise
+ *                 self._batch_error = e
+ */
+        __pyx_t_3 = (PyList_GET_SIZE(__pyx_v_out) != 0);
+        __pyx_t_1 = ((!__pyx_t_3) != 0);
+        if (unlikely(__pyx_t_1)) {
+
+          /* "hadoopy/_typedbytes.pyx":681
+ *             except Exception as e:
+ *                 if not out:
+ *                     raise             # <<<<<<<<<<<<<<
+ *                 self._batch_error = e
+ *                 break
+ */
+          __Pyx_GIVEREF(__pyx_t_13);
+          __Pyx_GIVEREF(__pyx_t_2);
+          __Pyx_XGIVEREF(__pyx_t_4);
+          __Pyx_ErrRestoreWithState(__pyx_t_13, __pyx_t_2, __pyx_t_4);
+          __pyx_t_13 = 0; __pyx_t_2 = 0; __pyx_t_4 = 0; 
+          __PYX_ERR(0, 681, __pyx_L9_except_error)
+
+          /* "hadoopy/_typedbytes.pyx":680
+ *                 break
+ *             except Exception as e:
+ *                 if not out:             # <<<<<<<<<<<<<<
+ *                     raise
+ *                 self._batch_error = e
+ */
+        }
+
+        /* "hadoopy/_typedbytes.pyx":682
+ *                 if not out:
+ *                     raise
+ *                 self._batch_error = e             # <<<<<<<<<<<<<<
+ *                 break
+ *         if not out:
+ */
+        __Pyx_INCREF(__pyx_v_e);
+        __Pyx_GIVEREF(__pyx_v_e);
+        __Pyx_GOTREF(__pyx_v_self->_batch_error);
+        __Pyx_DECREF(__pyx_v_self->_batch_error);
+        __pyx_v_self->_batch_error = __pyx_v_e;
+
+        /* "hadoopy/_typedbytes.pyx":683
+ *                     raise
+ *                 self._batch_error = e
+ *                 break             # <<<<<<<<<<<<<<
+ *         if not out:
+ *             raise StopIteration
+ */
+        goto __pyx_L17_except_break;
+        __pyx_L17_except_break:;
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        goto __pyx_L12_try_break;
+      }
+      goto __pyx_L9_except_error;
+      __pyx_L9_except_error:;
+
+      /* "hadoopy/_typedbytes.pyx":675
+ *         out = []
+ *         for x in range(n):
+ *             try:             # <<<<<<<<<<<<<<
+ *                 out.append(__read_key_value_tb(self._read_ptr))
+ *             except StopIteration:
+ */
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      goto __pyx_L1_error;
+      __pyx_L12_try_break:;
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      goto __pyx_L6_break;
+      __pyx_L14_try_end:;
+    }
+  }
+  __pyx_L6_break:;
+
+  /* "hadoopy/_typedbytes.pyx":684
+ *                 self._batch_error = e
+ *                 break
+ *         if not out:             # <<<<<<<<<<<<<<
+ *             raise StopIteration
+ *         return out
+ */
+  __pyx_t_1 = (PyList_GET_SIZE(__pyx_v_out) != 0);
+  __pyx_t_3 = ((!__pyx_t_1) != 0);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "hadoopy/_typedbytes.pyx":685
+ *                 break
+ *         if not out:
+ *             raise StopIteration             # <<<<<<<<<<<<<<
+ *         return out
+ * 
+ */
+    __Pyx_Raise(__pyx_builtin_StopIteration, 0, 0, 0);
+    __PYX_ERR(0, 685, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":684
+ *                 self._batch_error = e
+ *                 break
+ *         if not out:             # <<<<<<<<<<<<<<
+ *             raise StopIteration
+ *         return out
+ */
+  }
+
+  /* "hadoopy/_typedbytes.pyx":686
+ *         if not out:
+ *             raise StopIteration
+ *         return out             # <<<<<<<<<<<<<<
+ * 
+ *     def write(self, kv):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
+  goto __pyx_L0;
+
+  /* "hadoopy/_typedbytes.pyx":656
  *         return __read_key_value_tb(self._read_ptr)
  * 
+ *     def next_batch(self, int n=1024):             # <<<<<<<<<<<<<<
+ *         """Read up to n KeyValue pairs with one call
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.next_batch", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e);
+  __Pyx_XDECREF(__pyx_v_out);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hadoopy/_typedbytes.pyx":688
+ *         return out
+ * 
  *     def write(self, kv):             # <<<<<<<<<<<<<<
  *         if self._write_ptr == <void *>0:
  *             raise ValueError("Write pointer not set!")
  */
 
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14write(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kv) {
+/* Python wrapper */
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_17write(PyObject *__pyx_v_self, PyObject *__pyx_v_kv); /*proto*/
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_17write(PyObject *__pyx_v_self, PyObject *__pyx_v_kv) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("write (wrapper)", 0);
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16write(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), ((PyObject *)__pyx_v_kv));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16write(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kv) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -4968,66 +7414,88 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14write(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("write", 0);
 
-  /* "hadoopy/_typedbytes.pyx":606
+  /* "hadoopy/_typedbytes.pyx":689
  * 
  *     def write(self, kv):
  *         if self._write_ptr == <void *>0:             # <<<<<<<<<<<<<<
  *             raise ValueError("Write pointer not set!")
  *         __write_key_value_tb(self._write_ptr, kv)
  */
-  __pyx_t_1 = (__pyx_v_self->_write_ptr == ((void *)0));
-  if (__pyx_t_1) {
+  __pyx_t_1 = ((__pyx_v_self->_write_ptr == ((void *)0)) != 0);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "hadoopy/_typedbytes.pyx":607
+    /* "hadoopy/_typedbytes.pyx":690
  *     def write(self, kv):
  *         if self._write_ptr == <void *>0:
  *             raise ValueError("Write pointer not set!")             # <<<<<<<<<<<<<<
  *         __write_key_value_tb(self._write_ptr, kv)
  *         if self.flush_writes:
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_13), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 690, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L3;
+    __PYX_ERR(0, 690, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":689
+ * 
+ *     def write(self, kv):
+ *         if self._write_ptr == <void *>0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Write pointer not set!")
+ *         __write_key_value_tb(self._write_ptr, kv)
+ */
   }
-  __pyx_L3:;
 
-  /* "hadoopy/_typedbytes.pyx":608
+  /* "hadoopy/_typedbytes.pyx":691
  *         if self._write_ptr == <void *>0:
  *             raise ValueError("Write pointer not set!")
  *         __write_key_value_tb(self._write_ptr, kv)             # <<<<<<<<<<<<<<
  *         if self.flush_writes:
  *             self.flush()
  */
-  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes___write_key_value_tb(__pyx_v_self->_write_ptr, __pyx_v_kv); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 608; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_19_hadoopy_typedbytes___write_key_value_tb(__pyx_v_self->_write_ptr, __pyx_v_kv); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 691, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":609
+  /* "hadoopy/_typedbytes.pyx":692
  *             raise ValueError("Write pointer not set!")
  *         __write_key_value_tb(self._write_ptr, kv)
  *         if self.flush_writes:             # <<<<<<<<<<<<<<
  *             self.flush()
  * 
  */
-  if (__pyx_v_self->flush_writes) {
+  __pyx_t_1 = (__pyx_v_self->flush_writes != 0);
+  if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":610
+    /* "hadoopy/_typedbytes.pyx":693
  *         __write_key_value_tb(self._write_ptr, kv)
  *         if self.flush_writes:
  *             self.flush()             # <<<<<<<<<<<<<<
  * 
  *     def writes(self, kvs):
  */
-    __pyx_t_2 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->flush(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->flush(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 693, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    goto __pyx_L4;
+
+    /* "hadoopy/_typedbytes.pyx":692
+ *             raise ValueError("Write pointer not set!")
+ *         __write_key_value_tb(self._write_ptr, kv)
+ *         if self.flush_writes:             # <<<<<<<<<<<<<<
+ *             self.flush()
+ * 
+ */
   }
-  __pyx_L4:;
 
+  /* "hadoopy/_typedbytes.pyx":688
+ *         return out
+ * 
+ *     def write(self, kv):             # <<<<<<<<<<<<<<
+ *         if self._write_ptr == <void *>0:
+ *             raise ValueError("Write pointer not set!")
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -5040,26 +7508,28 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_14write(struct
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":695
+ *             self.flush()
+ * 
+ *     def writes(self, kvs):             # <<<<<<<<<<<<<<
+ *         if self._write_ptr == <void *>0:
+ *             raise ValueError("Write pointer not set!")
+ */
+
 /* Python wrapper */
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_17writes(PyObject *__pyx_v_self, PyObject *__pyx_v_kvs); /*proto*/
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_17writes(PyObject *__pyx_v_self, PyObject *__pyx_v_kvs) {
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19writes(PyObject *__pyx_v_self, PyObject *__pyx_v_kvs); /*proto*/
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19writes(PyObject *__pyx_v_self, PyObject *__pyx_v_kvs) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("writes (wrapper)", 0);
-  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16writes(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), ((PyObject *)__pyx_v_kvs));
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18writes(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), ((PyObject *)__pyx_v_kvs));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":612
- *             self.flush()
- * 
- *     def writes(self, kvs):             # <<<<<<<<<<<<<<
- *         if self._write_ptr == <void *>0:
- *             raise ValueError("Write pointer not set!")
- */
-
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16writes(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kvs) {
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18writes(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, PyObject *__pyx_v_kvs) {
   PyObject *__pyx_v_kv = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -5073,105 +7543,147 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16writes(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("writes", 0);
 
-  /* "hadoopy/_typedbytes.pyx":613
+  /* "hadoopy/_typedbytes.pyx":696
  * 
  *     def writes(self, kvs):
  *         if self._write_ptr == <void *>0:             # <<<<<<<<<<<<<<
  *             raise ValueError("Write pointer not set!")
  *         for kv in kvs:
  */
-  __pyx_t_1 = (__pyx_v_self->_write_ptr == ((void *)0));
-  if (__pyx_t_1) {
+  __pyx_t_1 = ((__pyx_v_self->_write_ptr == ((void *)0)) != 0);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "hadoopy/_typedbytes.pyx":614
+    /* "hadoopy/_typedbytes.pyx":697
  *     def writes(self, kvs):
  *         if self._write_ptr == <void *>0:
  *             raise ValueError("Write pointer not set!")             # <<<<<<<<<<<<<<
  *         for kv in kvs:
  *             __write_key_value_tb(self._write_ptr, kv)
  */
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_14), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 697, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L3;
+    __PYX_ERR(0, 697, __pyx_L1_error)
+
+    /* "hadoopy/_typedbytes.pyx":696
+ * 
+ *     def writes(self, kvs):
+ *         if self._write_ptr == <void *>0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("Write pointer not set!")
+ *         for kv in kvs:
+ */
   }
-  __pyx_L3:;
 
-  /* "hadoopy/_typedbytes.pyx":615
+  /* "hadoopy/_typedbytes.pyx":698
  *         if self._write_ptr == <void *>0:
  *             raise ValueError("Write pointer not set!")
  *         for kv in kvs:             # <<<<<<<<<<<<<<
  *             __write_key_value_tb(self._write_ptr, kv)
  *         if self.flush_writes:
  */
-  if (PyList_CheckExact(__pyx_v_kvs) || PyTuple_CheckExact(__pyx_v_kvs)) {
+  if (likely(PyList_CheckExact(__pyx_v_kvs)) || PyTuple_CheckExact(__pyx_v_kvs)) {
     __pyx_t_2 = __pyx_v_kvs; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
     __pyx_t_4 = NULL;
   } else {
-    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_kvs); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 615; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_kvs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 698, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext;
+    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 698, __pyx_L1_error)
   }
   for (;;) {
-    if (!__pyx_t_4 && PyList_CheckExact(__pyx_t_2)) {
-      if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++;
-    } else if (!__pyx_t_4 && PyTuple_CheckExact(__pyx_t_2)) {
-      if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++;
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 698, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 698, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 698, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 698, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
     } else {
       __pyx_t_5 = __pyx_t_4(__pyx_t_2);
       if (unlikely(!__pyx_t_5)) {
-        if (PyErr_Occurred()) {
-          if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) PyErr_Clear();
-          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 615; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 698, __pyx_L1_error)
         }
         break;
       }
       __Pyx_GOTREF(__pyx_t_5);
     }
-    __Pyx_XDECREF(__pyx_v_kv);
-    __pyx_v_kv = __pyx_t_5;
+    __Pyx_XDECREF_SET(__pyx_v_kv, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "hadoopy/_typedbytes.pyx":616
+    /* "hadoopy/_typedbytes.pyx":699
  *             raise ValueError("Write pointer not set!")
  *         for kv in kvs:
  *             __write_key_value_tb(self._write_ptr, kv)             # <<<<<<<<<<<<<<
  *         if self.flush_writes:
  *             self.flush()
  */
-    __pyx_t_5 = __pyx_f_19_hadoopy_typedbytes___write_key_value_tb(__pyx_v_self->_write_ptr, __pyx_v_kv); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = __pyx_f_19_hadoopy_typedbytes___write_key_value_tb(__pyx_v_self->_write_ptr, __pyx_v_kv); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 699, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "hadoopy/_typedbytes.pyx":698
+ *         if self._write_ptr == <void *>0:
+ *             raise ValueError("Write pointer not set!")
+ *         for kv in kvs:             # <<<<<<<<<<<<<<
+ *             __write_key_value_tb(self._write_ptr, kv)
+ *         if self.flush_writes:
+ */
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":617
+  /* "hadoopy/_typedbytes.pyx":700
  *         for kv in kvs:
  *             __write_key_value_tb(self._write_ptr, kv)
  *         if self.flush_writes:             # <<<<<<<<<<<<<<
  *             self.flush()
  * 
  */
-  if (__pyx_v_self->flush_writes) {
+  __pyx_t_1 = (__pyx_v_self->flush_writes != 0);
+  if (__pyx_t_1) {
 
-    /* "hadoopy/_typedbytes.pyx":618
+    /* "hadoopy/_typedbytes.pyx":701
  *             __write_key_value_tb(self._write_ptr, kv)
  *         if self.flush_writes:
  *             self.flush()             # <<<<<<<<<<<<<<
  * 
  *     cpdef flush(self):
  */
-    __pyx_t_2 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->flush(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 618; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->flush(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 701, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    goto __pyx_L6;
+
+    /* "hadoopy/_typedbytes.pyx":700
+ *         for kv in kvs:
+ *             __write_key_value_tb(self._write_ptr, kv)
+ *         if self.flush_writes:             # <<<<<<<<<<<<<<
+ *             self.flush()
+ * 
+ */
   }
-  __pyx_L6:;
 
+  /* "hadoopy/_typedbytes.pyx":695
+ *             self.flush()
+ * 
+ *     def writes(self, kvs):             # <<<<<<<<<<<<<<
+ *         if self._write_ptr == <void *>0:
+ *             raise ValueError("Write pointer not set!")
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -5186,7 +7698,7 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16writes(struct
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":620
+/* "hadoopy/_typedbytes.pyx":703
  *             self.flush()
  * 
  *     cpdef flush(self):             # <<<<<<<<<<<<<<
@@ -5194,62 +7706,110 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_16writes(struct
  *             fflush(self._write_ptr)
  */
 
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
 static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile_flush(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("flush", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__flush); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19flush)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_flush); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 703, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21flush)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 703, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "hadoopy/_typedbytes.pyx":621
+  /* "hadoopy/_typedbytes.pyx":704
  * 
  *     cpdef flush(self):
  *         if self._write_ptr:             # <<<<<<<<<<<<<<
  *             fflush(self._write_ptr)
  * 
  */
-  __pyx_t_3 = (__pyx_v_self->_write_ptr != 0);
-  if (__pyx_t_3) {
+  __pyx_t_5 = (__pyx_v_self->_write_ptr != 0);
+  if (__pyx_t_5) {
 
-    /* "hadoopy/_typedbytes.pyx":622
+    /* "hadoopy/_typedbytes.pyx":705
  *     cpdef flush(self):
  *         if self._write_ptr:
  *             fflush(self._write_ptr)             # <<<<<<<<<<<<<<
  * 
  *     def close(self):
  */
-    fflush(__pyx_v_self->_write_ptr);
-    goto __pyx_L3;
+    (void)(fflush(__pyx_v_self->_write_ptr));
+
+    /* "hadoopy/_typedbytes.pyx":704
+ * 
+ *     cpdef flush(self):
+ *         if self._write_ptr:             # <<<<<<<<<<<<<<
+ *             fflush(self._write_ptr)
+ * 
+ */
   }
-  __pyx_L3:;
 
+  /* "hadoopy/_typedbytes.pyx":703
+ *             self.flush()
+ * 
+ *     cpdef flush(self):             # <<<<<<<<<<<<<<
+ *         if self._write_ptr:
+ *             fflush(self._write_ptr)
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.flush", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -5259,25 +7819,19 @@ static PyObject *__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile_flush(struct __p
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("flush (wrapper)", 0);
-  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18flush(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20flush(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":620
- *             self.flush()
- * 
- *     cpdef flush(self):             # <<<<<<<<<<<<<<
- *         if self._write_ptr:
- *             fflush(self._write_ptr)
- */
-
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18flush(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20flush(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5286,14 +7840,13 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18flush(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("flush", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->flush(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 620; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_19_hadoopy_typedbytes_14TypedBytesFile_flush(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 703, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.flush", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -5304,25 +7857,27 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_18flush(struct
   return __pyx_r;
 }
 
+/* "hadoopy/_typedbytes.pyx":707
+ *             fflush(self._write_ptr)
+ * 
+ *     def close(self):             # <<<<<<<<<<<<<<
+ *         self._close()
+ */
+
 /* Python wrapper */
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_23close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_23close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("close (wrapper)", 0);
-  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20close(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_22close(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "hadoopy/_typedbytes.pyx":624
- *             fflush(self._write_ptr)
- * 
- *     def close(self):             # <<<<<<<<<<<<<<
- *         self._close()
- */
-
-static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20close(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_22close(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5331,15 +7886,23 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20close(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("close", 0);
 
-  /* "hadoopy/_typedbytes.pyx":625
+  /* "hadoopy/_typedbytes.pyx":708
  * 
  *     def close(self):
  *         self._close()             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->_close(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 625; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = ((struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self->__pyx_vtab)->_close(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 708, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "hadoopy/_typedbytes.pyx":707
+ *             fflush(self._write_ptr)
+ * 
+ *     def close(self):             # <<<<<<<<<<<<<<
+ *         self._close()
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
@@ -5351,23 +7914,149 @@ static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_20close(struct
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_25__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_25__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_24__reduce_cython__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_27__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_27__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_26__setstate_cython__(((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_19_hadoopy_typedbytes_14TypedBytesFile_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("_hadoopy_typedbytes.TypedBytesFile.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 static struct __pyx_vtabstruct_19_hadoopy_typedbytes_TypedBytesFile __pyx_vtable_19_hadoopy_typedbytes_TypedBytesFile;
 
-static PyObject *__pyx_tp_new_19_hadoopy_typedbytes_TypedBytesFile(PyTypeObject *t, PyObject *a, PyObject *k) {
+static PyObject *__pyx_tp_new_19_hadoopy_typedbytes_TypedBytesFile(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)o);
   p->__pyx_vtab = __pyx_vtabptr_19_hadoopy_typedbytes_TypedBytesFile;
   p->_repr = Py_None; Py_INCREF(Py_None);
   p->file_method = Py_None; Py_INCREF(Py_None);
+  p->_batch_error = Py_None; Py_INCREF(Py_None);
   return o;
 }
 
 static void __pyx_tp_dealloc_19_hadoopy_typedbytes_TypedBytesFile(PyObject *o) {
   struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *p = (struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)o;
-  Py_XDECREF(p->_repr);
-  Py_XDECREF(p->file_method);
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->_repr);
+  Py_CLEAR(p->file_method);
+  Py_CLEAR(p->_batch_error);
   (*Py_TYPE(o)->tp_free)(o);
 }
 
@@ -5380,157 +8069,76 @@ static int __pyx_tp_traverse_19_hadoopy_typedbytes_TypedBytesFile(PyObject *o, v
   if (p->file_method) {
     e = (*v)(p->file_method, a); if (e) return e;
   }
+  if (p->_batch_error) {
+    e = (*v)(p->_batch_error, a); if (e) return e;
+  }
   return 0;
 }
 
 static int __pyx_tp_clear_19_hadoopy_typedbytes_TypedBytesFile(PyObject *o) {
-  struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *p = (struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)o;
   PyObject* tmp;
+  struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *p = (struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *)o;
   tmp = ((PyObject*)p->_repr);
   p->_repr = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   tmp = ((PyObject*)p->file_method);
   p->file_method = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_batch_error);
+  p->_batch_error = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
   return 0;
 }
 
+static PyObject *__pyx_specialmethod___pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_13__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {return __pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_13__next__(self);}
+
 static PyMethodDef __pyx_methods_19_hadoopy_typedbytes_TypedBytesFile[] = {
-  {__Pyx_NAMESTR("__enter__"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_5__enter__, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__exit__"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_7__exit__, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__del__"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_9__del__, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("__next__"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_13__next__, METH_NOARGS|METH_COEXIST, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("write"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_15write, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("writes"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_17writes, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("flush"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19flush, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("close"), (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21close, METH_NOARGS, __Pyx_DOCSTR(0)},
+  {"__enter__", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_5__enter__, METH_NOARGS, 0},
+  {"__exit__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_7__exit__, METH_VARARGS|METH_KEYWORDS, 0},
+  {"__del__", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_9__del__, METH_NOARGS, 0},
+  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_13__next__, METH_NOARGS|METH_COEXIST, 0},
+  {"next_batch", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_15next_batch, METH_VARARGS|METH_KEYWORDS, __pyx_doc_19_hadoopy_typedbytes_14TypedBytesFile_14next_batch},
+  {"write", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_17write, METH_O, 0},
+  {"writes", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_19writes, METH_O, 0},
+  {"flush", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_21flush, METH_NOARGS, 0},
+  {"close", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_23close, METH_NOARGS, 0},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_25__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_27__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
-static PyNumberMethods __pyx_tp_as_number_TypedBytesFile = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_long*/
-  #else
-  0, /*reserved*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if PY_VERSION_HEX >= 0x02050000
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_TypedBytesFile = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_TypedBytesFile = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_TypedBytesFile = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
 static PyTypeObject __pyx_type_19_hadoopy_typedbytes_TypedBytesFile = {
   PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("_hadoopy_typedbytes.TypedBytesFile"), /*tp_name*/
+  "_hadoopy_typedbytes.TypedBytesFile", /*tp_name*/
   sizeof(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile), /*tp_basicsize*/
   0, /*tp_itemsize*/
   __pyx_tp_dealloc_19_hadoopy_typedbytes_TypedBytesFile, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
   0, /*tp_compare*/
-  #else
-  0, /*reserved*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
   #endif
   __pyx_pw_19_hadoopy_typedbytes_14TypedBytesFile_3__repr__, /*tp_repr*/
-  &__pyx_tp_as_number_TypedBytesFile, /*tp_as_number*/
-  &__pyx_tp_as_sequence_TypedBytesFile, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_TypedBytesFile, /*tp_as_mapping*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
   0, /*tp_hash*/
   0, /*tp_call*/
   0, /*tp_str*/
   0, /*tp_getattro*/
   0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_TypedBytesFile, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  __Pyx_DOCSTR("TypedBytes interface\n\n    :param fn: File path (default None)\n    :param mode: Mode to open the file with (default None)\n    :param read_fd: Read file descriptor (int) (default None)\n    :param write_fd: Write file descriptor (int) (default None)\n    :param flush_writes: If True then flush the buffer for every write (default False)\n    "), /*tp_doc*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "TypedBytes interface\n\n    :param fn: File path (default None)\n    :param mode: Mode to open the file with (default None)\n    :param read_fd: Read file descriptor (int) (default None)\n    :param write_fd: Write file descriptor (int) (default None)\n    :param flush_writes: If True then flush the buffer for every write (default False)\n    :param unbuffered_reads: If True then reads from read_fd aren't buffered (default False)\n    :param read_buffer_size: If > 0 then reads from read_fd use a buffer of this many bytes (default 0, use the stdio size)\n    :param write_buffer_size: If > 0 then writes to write_fd use a buffer of this many bytes (default 0, use the stdio size)\n    ", /*tp_doc*/
   __pyx_tp_traverse_19_hadoopy_typedbytes_TypedBytesFile, /*tp_traverse*/
   __pyx_tp_clear_19_hadoopy_typedbytes_TypedBytesFile, /*tp_clear*/
   0, /*tp_richcompare*/
@@ -5556,8 +8164,18 @@ static PyTypeObject __pyx_type_19_hadoopy_typedbytes_TypedBytesFile = {
   0, /*tp_subclasses*/
   0, /*tp_weaklist*/
   0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
   0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
   #endif
 };
 
@@ -5566,189 +8184,215 @@ static PyMethodDef __pyx_methods[] = {
 };
 
 #if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__hadoopy_typedbytes(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__hadoopy_typedbytes},
+  {0, NULL}
+};
+#endif
+
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
-    __Pyx_NAMESTR("_hadoopy_typedbytes"),
+    "_hadoopy_typedbytes",
     0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
     -1, /* m_size */
+  #endif
     __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
     NULL, /* m_reload */
+  #endif
     NULL, /* m_traverse */
     NULL, /* m_clear */
     NULL /* m_free */
 };
 #endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
-  {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
-  {&__pyx_kp_s_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 1, 0},
-  {&__pyx_kp_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 0},
-  {&__pyx_kp_s_16, __pyx_k_16, sizeof(__pyx_k_16), 0, 0, 1, 0},
-  {&__pyx_kp_s_18, __pyx_k_18, sizeof(__pyx_k_18), 0, 0, 1, 0},
-  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
-  {&__pyx_n_s__BooleanType, __pyx_k__BooleanType, sizeof(__pyx_k__BooleanType), 0, 0, 1, 1},
-  {&__pyx_n_s__DictType, __pyx_k__DictType, sizeof(__pyx_k__DictType), 0, 0, 1, 1},
-  {&__pyx_n_s__FloatType, __pyx_k__FloatType, sizeof(__pyx_k__FloatType), 0, 0, 1, 1},
-  {&__pyx_n_s__IOError, __pyx_k__IOError, sizeof(__pyx_k__IOError), 0, 0, 1, 1},
-  {&__pyx_n_s__IndexError, __pyx_k__IndexError, sizeof(__pyx_k__IndexError), 0, 0, 1, 1},
-  {&__pyx_n_s__IntType, __pyx_k__IntType, sizeof(__pyx_k__IntType), 0, 0, 1, 1},
-  {&__pyx_n_s__KeyError, __pyx_k__KeyError, sizeof(__pyx_k__KeyError), 0, 0, 1, 1},
-  {&__pyx_n_s__ListType, __pyx_k__ListType, sizeof(__pyx_k__ListType), 0, 0, 1, 1},
-  {&__pyx_n_s__LongType, __pyx_k__LongType, sizeof(__pyx_k__LongType), 0, 0, 1, 1},
-  {&__pyx_n_s__OverflowError, __pyx_k__OverflowError, sizeof(__pyx_k__OverflowError), 0, 0, 1, 1},
-  {&__pyx_n_s__StopIteration, __pyx_k__StopIteration, sizeof(__pyx_k__StopIteration), 0, 0, 1, 1},
-  {&__pyx_n_s__StringType, __pyx_k__StringType, sizeof(__pyx_k__StringType), 0, 0, 1, 1},
-  {&__pyx_n_s__TupleType, __pyx_k__TupleType, sizeof(__pyx_k__TupleType), 0, 0, 1, 1},
-  {&__pyx_n_s__UnicodeError, __pyx_k__UnicodeError, sizeof(__pyx_k__UnicodeError), 0, 0, 1, 1},
-  {&__pyx_n_s__UnicodeType, __pyx_k__UnicodeType, sizeof(__pyx_k__UnicodeType), 0, 0, 1, 1},
-  {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
-  {&__pyx_n_s____author__, __pyx_k____author__, sizeof(__pyx_k____author__), 0, 0, 1, 1},
-  {&__pyx_n_s____license__, __pyx_k____license__, sizeof(__pyx_k____license__), 0, 0, 1, 1},
-  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
-  {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
-  {&__pyx_n_s___hadoopy_typedbytes, __pyx_k___hadoopy_typedbytes, sizeof(__pyx_k___hadoopy_typedbytes), 0, 0, 1, 1},
-  {&__pyx_n_s___out_types, __pyx_k___out_types, sizeof(__pyx_k___out_types), 0, 0, 1, 1},
-  {&__pyx_n_s__cPickle, __pyx_k__cPickle, sizeof(__pyx_k__cPickle), 0, 0, 1, 1},
-  {&__pyx_n_s__dumps, __pyx_k__dumps, sizeof(__pyx_k__dumps), 0, 0, 1, 1},
-  {&__pyx_n_s__encode, __pyx_k__encode, sizeof(__pyx_k__encode), 0, 0, 1, 1},
-  {&__pyx_n_s__flush, __pyx_k__flush, sizeof(__pyx_k__flush), 0, 0, 1, 1},
-  {&__pyx_n_s__flush_writes, __pyx_k__flush_writes, sizeof(__pyx_k__flush_writes), 0, 0, 1, 1},
-  {&__pyx_n_s__fn, __pyx_k__fn, sizeof(__pyx_k__fn), 0, 0, 1, 1},
-  {&__pyx_n_s__iteritems, __pyx_k__iteritems, sizeof(__pyx_k__iteritems), 0, 0, 1, 1},
-  {&__pyx_n_s__kv, __pyx_k__kv, sizeof(__pyx_k__kv), 0, 0, 1, 1},
-  {&__pyx_n_s__loads, __pyx_k__loads, sizeof(__pyx_k__loads), 0, 0, 1, 1},
-  {&__pyx_n_s__mode, __pyx_k__mode, sizeof(__pyx_k__mode), 0, 0, 1, 1},
-  {&__pyx_n_s__pickle, __pyx_k__pickle, sizeof(__pyx_k__pickle), 0, 0, 1, 1},
-  {&__pyx_n_s__r, __pyx_k__r, sizeof(__pyx_k__r), 0, 0, 1, 1},
-  {&__pyx_n_s__range, __pyx_k__range, sizeof(__pyx_k__range), 0, 0, 1, 1},
-  {&__pyx_n_s__read_fd, __pyx_k__read_fd, sizeof(__pyx_k__read_fd), 0, 0, 1, 1},
-  {&__pyx_n_s__read_tb, __pyx_k__read_tb, sizeof(__pyx_k__read_tb), 0, 0, 1, 1},
-  {&__pyx_n_s__readwritefds, __pyx_k__readwritefds, sizeof(__pyx_k__readwritefds), 0, 0, 1, 1},
-  {&__pyx_n_s__stdinout, __pyx_k__stdinout, sizeof(__pyx_k__stdinout), 0, 0, 1, 1},
-  {&__pyx_n_s__traceback, __pyx_k__traceback, sizeof(__pyx_k__traceback), 0, 0, 1, 1},
-  {&__pyx_n_s__type, __pyx_k__type, sizeof(__pyx_k__type), 0, 0, 1, 1},
-  {&__pyx_n_s__types, __pyx_k__types, sizeof(__pyx_k__types), 0, 0, 1, 1},
-  {&__pyx_n_s__unbuffered_reads, __pyx_k__unbuffered_reads, sizeof(__pyx_k__unbuffered_reads), 0, 0, 1, 1},
-  {&__pyx_n_s__value, __pyx_k__value, sizeof(__pyx_k__value), 0, 0, 1, 1},
-  {&__pyx_n_s__write_fd, __pyx_k__write_fd, sizeof(__pyx_k__write_fd), 0, 0, 1, 1},
-  {&__pyx_n_s__write_tb, __pyx_k__write_tb, sizeof(__pyx_k__write_tb), 0, 0, 1, 1},
+  {&__pyx_kp_s_Bad_index_d, __pyx_k_Bad_index_d, sizeof(__pyx_k_Bad_index_d), 0, 0, 1, 0},
+  {&__pyx_kp_s_Bad_unicode_string_size_d, __pyx_k_Bad_unicode_string_size_d, sizeof(__pyx_k_Bad_unicode_string_size_d), 0, 0, 1, 0},
+  {&__pyx_n_s_BooleanType, __pyx_k_BooleanType, sizeof(__pyx_k_BooleanType), 0, 0, 1, 1},
+  {&__pyx_kp_s_Brandyn_A_White_bwhite_cs_umd_ed, __pyx_k_Brandyn_A_White_bwhite_cs_umd_ed, sizeof(__pyx_k_Brandyn_A_White_bwhite_cs_umd_ed), 0, 0, 1, 0},
+  {&__pyx_kp_s_Cannot_open_file_s, __pyx_k_Cannot_open_file_s, sizeof(__pyx_k_Cannot_open_file_s), 0, 0, 1, 0},
+  {&__pyx_n_s_DictType, __pyx_k_DictType, sizeof(__pyx_k_DictType), 0, 0, 1, 1},
+  {&__pyx_kp_s_Error_decoding_unicode_string_Se, __pyx_k_Error_decoding_unicode_string_Se, sizeof(__pyx_k_Error_decoding_unicode_string_Se), 0, 0, 1, 0},
+  {&__pyx_n_s_FloatType, __pyx_k_FloatType, sizeof(__pyx_k_FloatType), 0, 0, 1, 1},
+  {&__pyx_kp_s_GPL_V3, __pyx_k_GPL_V3, sizeof(__pyx_k_GPL_V3), 0, 0, 1, 0},
+  {&__pyx_n_s_IOError, __pyx_k_IOError, sizeof(__pyx_k_IOError), 0, 0, 1, 1},
+  {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
+  {&__pyx_n_s_IntType, __pyx_k_IntType, sizeof(__pyx_k_IntType), 0, 0, 1, 1},
+  {&__pyx_n_s_KeyError, __pyx_k_KeyError, sizeof(__pyx_k_KeyError), 0, 0, 1, 1},
+  {&__pyx_n_s_ListType, __pyx_k_ListType, sizeof(__pyx_k_ListType), 0, 0, 1, 1},
+  {&__pyx_n_s_LongType, __pyx_k_LongType, sizeof(__pyx_k_LongType), 0, 0, 1, 1},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s_OverflowError, __pyx_k_OverflowError, sizeof(__pyx_k_OverflowError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Read_pointer_not_set, __pyx_k_Read_pointer_not_set, sizeof(__pyx_k_Read_pointer_not_set), 0, 0, 1, 0},
+  {&__pyx_n_s_StopIteration, __pyx_k_StopIteration, sizeof(__pyx_k_StopIteration), 0, 0, 1, 1},
+  {&__pyx_n_s_StringType, __pyx_k_StringType, sizeof(__pyx_k_StringType), 0, 0, 1, 1},
+  {&__pyx_n_s_TupleType, __pyx_k_TupleType, sizeof(__pyx_k_TupleType), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_TypedBytesFile, __pyx_k_TypedBytesFile, sizeof(__pyx_k_TypedBytesFile), 0, 0, 1, 1},
+  {&__pyx_kp_s_TypedBytesFile_s_s_s_s, __pyx_k_TypedBytesFile_s_s_s_s, sizeof(__pyx_k_TypedBytesFile_s_s_s_s), 0, 0, 1, 0},
+  {&__pyx_n_s_UnicodeError, __pyx_k_UnicodeError, sizeof(__pyx_k_UnicodeError), 0, 0, 1, 1},
+  {&__pyx_n_s_UnicodeType, __pyx_k_UnicodeType, sizeof(__pyx_k_UnicodeType), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Write_pointer_not_set, __pyx_k_Write_pointer_not_set, sizeof(__pyx_k_Write_pointer_not_set), 0, 0, 1, 0},
+  {&__pyx_n_s_author, __pyx_k_author, sizeof(__pyx_k_author), 0, 0, 1, 1},
+  {&__pyx_n_s_cPickle, __pyx_k_cPickle, sizeof(__pyx_k_cPickle), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_dumps, __pyx_k_dumps, sizeof(__pyx_k_dumps), 0, 0, 1, 1},
+  {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
+  {&__pyx_n_s_flush, __pyx_k_flush, sizeof(__pyx_k_flush), 0, 0, 1, 1},
+  {&__pyx_n_s_flush_writes, __pyx_k_flush_writes, sizeof(__pyx_k_flush_writes), 0, 0, 1, 1},
+  {&__pyx_n_s_fn, __pyx_k_fn, sizeof(__pyx_k_fn), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_kp_s_hadoopy__typedbytes_pyx, __pyx_k_hadoopy__typedbytes_pyx, sizeof(__pyx_k_hadoopy__typedbytes_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_hadoopy_typedbytes, __pyx_k_hadoopy_typedbytes, sizeof(__pyx_k_hadoopy_typedbytes), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_iteritems, __pyx_k_iteritems, sizeof(__pyx_k_iteritems), 0, 0, 1, 1},
+  {&__pyx_n_s_kv, __pyx_k_kv, sizeof(__pyx_k_kv), 0, 0, 1, 1},
+  {&__pyx_n_s_license, __pyx_k_license, sizeof(__pyx_k_license), 0, 0, 1, 1},
+  {&__pyx_n_s_loads, __pyx_k_loads, sizeof(__pyx_k_loads), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
+  {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_out_types, __pyx_k_out_types, sizeof(__pyx_k_out_types), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_r, __pyx_k_r, sizeof(__pyx_k_r), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_read_buffer_size, __pyx_k_read_buffer_size, sizeof(__pyx_k_read_buffer_size), 0, 0, 1, 1},
+  {&__pyx_n_s_read_fd, __pyx_k_read_fd, sizeof(__pyx_k_read_fd), 0, 0, 1, 1},
+  {&__pyx_n_s_read_tb, __pyx_k_read_tb, sizeof(__pyx_k_read_tb), 0, 0, 1, 1},
+  {&__pyx_n_s_readwritefds, __pyx_k_readwritefds, sizeof(__pyx_k_readwritefds), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_kp_s_self__read_ptr_self__write_ptr_c, __pyx_k_self__read_ptr_self__write_ptr_c, sizeof(__pyx_k_self__read_ptr_self__write_ptr_c), 0, 0, 1, 0},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_stdinout, __pyx_k_stdinout, sizeof(__pyx_k_stdinout), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_traceback, __pyx_k_traceback, sizeof(__pyx_k_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_type, __pyx_k_type, sizeof(__pyx_k_type), 0, 0, 1, 1},
+  {&__pyx_n_s_types, __pyx_k_types, sizeof(__pyx_k_types), 0, 0, 1, 1},
+  {&__pyx_n_s_unbuffered_reads, __pyx_k_unbuffered_reads, sizeof(__pyx_k_unbuffered_reads), 0, 0, 1, 1},
+  {&__pyx_kp_s_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 0, 1, 0},
+  {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {&__pyx_n_s_write_buffer_size, __pyx_k_write_buffer_size, sizeof(__pyx_k_write_buffer_size), 0, 0, 1, 1},
+  {&__pyx_n_s_write_fd, __pyx_k_write_fd, sizeof(__pyx_k_write_fd), 0, 0, 1, 1},
+  {&__pyx_n_s_write_tb, __pyx_k_write_tb, sizeof(__pyx_k_write_tb), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_OverflowError = __Pyx_GetName(__pyx_b, __pyx_n_s__OverflowError); if (!__pyx_builtin_OverflowError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_UnicodeError = __Pyx_GetName(__pyx_b, __pyx_n_s__UnicodeError); if (!__pyx_builtin_UnicodeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_StopIteration = __Pyx_GetName(__pyx_b, __pyx_n_s__StopIteration); if (!__pyx_builtin_StopIteration) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_KeyError = __Pyx_GetName(__pyx_b, __pyx_n_s__KeyError); if (!__pyx_builtin_KeyError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 447; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_IndexError = __Pyx_GetName(__pyx_b, __pyx_n_s__IndexError); if (!__pyx_builtin_IndexError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_IOError = __Pyx_GetName(__pyx_b, __pyx_n_s__IOError); if (!__pyx_builtin_IOError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 561; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_OverflowError = __Pyx_GetBuiltinName(__pyx_n_s_OverflowError); if (!__pyx_builtin_OverflowError) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_builtin_UnicodeError = __Pyx_GetBuiltinName(__pyx_n_s_UnicodeError); if (!__pyx_builtin_UnicodeError) __PYX_ERR(0, 266, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 284, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 289, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 351, __pyx_L1_error)
+  __pyx_builtin_StopIteration = __Pyx_GetBuiltinName(__pyx_n_s_StopIteration); if (!__pyx_builtin_StopIteration) __PYX_ERR(0, 384, __pyx_L1_error)
+  __pyx_builtin_KeyError = __Pyx_GetBuiltinName(__pyx_n_s_KeyError); if (!__pyx_builtin_KeyError) __PYX_ERR(0, 479, __pyx_L1_error)
+  __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(0, 508, __pyx_L1_error)
+  __pyx_builtin_IOError = __Pyx_GetBuiltinName(__pyx_n_s_IOError); if (!__pyx_builtin_IOError) __PYX_ERR(0, 601, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
 }
 
-static int __Pyx_InitCachedConstants(void) {
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "hadoopy/_typedbytes.pyx":273
- *         return unicode(out, 'utf-8')
+  /* "hadoopy/_typedbytes.pyx":267
+ *         return PyUnicode_DecodeUTF8(buf, sz, NULL)
  *     except UnicodeError:
  *         raise UnicodeError('Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_k_tuple_3 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_k_tuple_3);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
-  PyTuple_SET_ITEM(__pyx_k_tuple_3, 0, ((PyObject *)__pyx_kp_s_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_3));
-
-  /* "hadoopy/_typedbytes.pyx":303
- *     cdef char *bytes
- *     cdef Py_ssize_t sz
- *     val = val.encode('utf-8')             # <<<<<<<<<<<<<<
- *     PyString_AsStringAndSize(val, &bytes, &sz)  # != -1
- *     _raw_write_int(fp, sz)
- */
-  __pyx_k_tuple_4 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_k_tuple_4);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  PyTuple_SET_ITEM(__pyx_k_tuple_4, 0, ((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_4));
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_Error_decoding_unicode_string_Se); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 267, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "hadoopy/_typedbytes.pyx":602
+  /* "hadoopy/_typedbytes.pyx":653
  *     def __next__(self):
  *         if self._read_ptr == <void *>0:
  *             raise ValueError("Read pointer not set!")             # <<<<<<<<<<<<<<
  *         return __read_key_value_tb(self._read_ptr)
  * 
  */
-  __pyx_k_tuple_11 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_k_tuple_11);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_10));
-  PyTuple_SET_ITEM(__pyx_k_tuple_11, 0, ((PyObject *)__pyx_kp_s_10));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_11));
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_Read_pointer_not_set); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 653, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "hadoopy/_typedbytes.pyx":607
+  /* "hadoopy/_typedbytes.pyx":690
  *     def write(self, kv):
  *         if self._write_ptr == <void *>0:
  *             raise ValueError("Write pointer not set!")             # <<<<<<<<<<<<<<
  *         __write_key_value_tb(self._write_ptr, kv)
  *         if self.flush_writes:
  */
-  __pyx_k_tuple_13 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 607; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_k_tuple_13);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_12));
-  PyTuple_SET_ITEM(__pyx_k_tuple_13, 0, ((PyObject *)__pyx_kp_s_12));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_12));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_13));
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_Write_pointer_not_set); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 690, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "hadoopy/_typedbytes.pyx":614
- *     def writes(self, kvs):
- *         if self._write_ptr == <void *>0:
- *             raise ValueError("Write pointer not set!")             # <<<<<<<<<<<<<<
- *         for kv in kvs:
- *             __write_key_value_tb(self._write_ptr, kv)
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
  */
-  __pyx_k_tuple_14 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 614; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_k_tuple_14);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_12));
-  PyTuple_SET_ITEM(__pyx_k_tuple_14, 0, ((PyObject *)__pyx_kp_s_12));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_12));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_14));
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_self__read_ptr_self__write_ptr_c); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "hadoopy/_typedbytes.pyx":526
+  /* "(tree fragment)":4
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self._read_ptr,self._write_ptr cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_self__read_ptr_self__write_ptr_c); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "hadoopy/_typedbytes.pyx":558
  * 
  * 
  * def read_tb():             # <<<<<<<<<<<<<<
  *     return __read_key_value_tb(stdin)
  * 
  */
-  __pyx_k_codeobj_17 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_18, __pyx_n_s__read_tb, 526, __pyx_empty_bytes); if (unlikely(!__pyx_k_codeobj_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hadoopy__typedbytes_pyx, __pyx_n_s_read_tb, 558, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 558, __pyx_L1_error)
 
-  /* "hadoopy/_typedbytes.pyx":530
+  /* "hadoopy/_typedbytes.pyx":562
  * 
  * 
  * def write_tb(kv):             # <<<<<<<<<<<<<<
  *     __write_key_value_tb(stdout, kv)
  * 
  */
-  __pyx_k_tuple_19 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_k_tuple_19);
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__kv));
-  PyTuple_SET_ITEM(__pyx_k_tuple_19, 0, ((PyObject *)__pyx_n_s__kv));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__kv));
-  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_19));
-  __pyx_k_codeobj_20 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_k_tuple_19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_18, __pyx_n_s__write_tb, 530, __pyx_empty_bytes); if (unlikely(!__pyx_k_codeobj_20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_n_s_kv); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 562, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hadoopy__typedbytes_pyx, __pyx_n_s_write_tb, 562, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 562, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -5756,105 +8400,312 @@ static int __Pyx_InitCachedConstants(void) {
   return -1;
 }
 
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_9 = PyInt_FromLong(9); if (unlikely(!__pyx_int_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_2147483647 = PyInt_FromLong(2147483647); if (unlikely(!__pyx_int_2147483647)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_neg_2147483648 = PyInt_FromLong(-2147483648); if (unlikely(!__pyx_int_neg_2147483648)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_9223372036854775807L = PyLong_FromString((char *)"9223372036854775807", 0, 0); if (unlikely(!__pyx_int_9223372036854775807L)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_neg_9223372036854775808 = PyInt_FromString((char *)"-9223372036854775808", 0, 0); if (unlikely(!__pyx_int_neg_9223372036854775808)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_7 = PyInt_FromLong(7); if (unlikely(!__pyx_int_7)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_9 = PyInt_FromLong(9); if (unlikely(!__pyx_int_9)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2147483647 = PyInt_FromLong(2147483647L); if (unlikely(!__pyx_int_2147483647)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_2147483648 = PyInt_FromLong(-2147483648L); if (unlikely(!__pyx_int_neg_2147483648)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_9223372036854775807L = PyLong_FromString((char *)"9223372036854775807", 0, 0); if (unlikely(!__pyx_int_9223372036854775807L)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_9223372036854775808L = PyLong_FromString((char *)"-9223372036854775808", 0, 0); if (unlikely(!__pyx_int_neg_9223372036854775808L)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
 }
 
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC init_hadoopy_typedbytes(void); /*proto*/
-PyMODINIT_FUNC init_hadoopy_typedbytes(void)
-#else
-PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void); /*proto*/
-PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
   __Pyx_RefNannyDeclarations
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  #endif
-  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)", 0);
-  if ( __Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #ifdef __Pyx_CyFunction_USED
-  if (__Pyx_CyFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_hadoopy_typedbytes"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main__hadoopy_typedbytes) {
-    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Constants init code ---*/
-  if (unlikely(__Pyx_InitCachedConstants() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
   /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
   /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
   /*--- Function export code ---*/
-  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
   __pyx_vtabptr_19_hadoopy_typedbytes_TypedBytesFile = &__pyx_vtable_19_hadoopy_typedbytes_TypedBytesFile;
   __pyx_vtable_19_hadoopy_typedbytes_TypedBytesFile._close = (PyObject *(*)(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *))__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile__close;
   __pyx_vtable_19_hadoopy_typedbytes_TypedBytesFile.flush = (PyObject *(*)(struct __pyx_obj_19_hadoopy_typedbytes_TypedBytesFile *, int __pyx_skip_dispatch))__pyx_f_19_hadoopy_typedbytes_14TypedBytesFile_flush;
-  if (PyType_Ready(&__pyx_type_19_hadoopy_typedbytes_TypedBytesFile) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_19_hadoopy_typedbytes_TypedBytesFile.tp_dict, __pyx_vtabptr_19_hadoopy_typedbytes_TypedBytesFile) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "TypedBytesFile", (PyObject *)&__pyx_type_19_hadoopy_typedbytes_TypedBytesFile) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_19_hadoopy_typedbytes_TypedBytesFile) < 0) __PYX_ERR(0, 566, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_19_hadoopy_typedbytes_TypedBytesFile.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_19_hadoopy_typedbytes_TypedBytesFile.tp_dictoffset && __pyx_type_19_hadoopy_typedbytes_TypedBytesFile.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_19_hadoopy_typedbytes_TypedBytesFile.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_19_hadoopy_typedbytes_TypedBytesFile.tp_dict, __pyx_vtabptr_19_hadoopy_typedbytes_TypedBytesFile) < 0) __PYX_ERR(0, 566, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_TypedBytesFile, (PyObject *)&__pyx_type_19_hadoopy_typedbytes_TypedBytesFile) < 0) __PYX_ERR(0, 566, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_19_hadoopy_typedbytes_TypedBytesFile) < 0) __PYX_ERR(0, 566, __pyx_L1_error)
   __pyx_ptype_19_hadoopy_typedbytes_TypedBytesFile = &__pyx_type_19_hadoopy_typedbytes_TypedBytesFile;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
   /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
   /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
   /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_hadoopy_typedbytes(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_hadoopy_typedbytes(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__hadoopy_typedbytes(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_hadoopy_typedbytes' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_hadoopy_typedbytes", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main__hadoopy_typedbytes) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "_hadoopy_typedbytes")) {
+      if (unlikely(PyDict_SetItemString(modules, "_hadoopy_typedbytes", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
   /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
 
   /* "hadoopy/_typedbytes.pyx":17
  * # along with this program.  If not, see <http://www.gnu.org/licenses/>.
@@ -5863,7 +8714,7 @@ PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)
  * __license__ = 'GPL V3'
  * 
  */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____author__, ((PyObject *)__pyx_kp_s_15)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_author, __pyx_kp_s_Brandyn_A_White_bwhite_cs_umd_ed) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
 
   /* "hadoopy/_typedbytes.pyx":18
  * 
@@ -5872,7 +8723,7 @@ PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)
  * 
  * import types
  */
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____license__, ((PyObject *)__pyx_kp_s_16)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 18; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_license, __pyx_kp_s_GPL_V3) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
 
   /* "hadoopy/_typedbytes.pyx":20
  * __license__ = 'GPL V3'
@@ -5881,9 +8732,9 @@ PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)
  * import cPickle as pickle
  * from libc.stdint cimport int32_t, int64_t
  */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__types), 0, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 20; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_types, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 20, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__types, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 20; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_types, __pyx_t_1) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "hadoopy/_typedbytes.pyx":21
@@ -5893,229 +8744,237 @@ PyMODINIT_FUNC PyInit__hadoopy_typedbytes(void)
  * from libc.stdint cimport int32_t, int64_t
  * 
  */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__cPickle), 0, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_cPickle, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 21, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__pickle, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pickle, __pyx_t_1) < 0) __PYX_ERR(0, 21, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":432
+  /* "hadoopy/_typedbytes.pyx":258
+ * 
+ * # Reused by _read_unicode, grows to the largest string seen up to _UNICODE_BUF_MAX
+ * cdef char *_unicode_buf = NULL             # <<<<<<<<<<<<<<
+ * cdef int32_t _unicode_buf_size = 0
+ * DEF _UNICODE_BUF_MAX = 1048576
+ */
+  __pyx_v_19_hadoopy_typedbytes__unicode_buf = NULL;
+
+  /* "hadoopy/_typedbytes.pyx":259
+ * # Reused by _read_unicode, grows to the largest string seen up to _UNICODE_BUF_MAX
+ * cdef char *_unicode_buf = NULL
+ * cdef int32_t _unicode_buf_size = 0             # <<<<<<<<<<<<<<
+ * DEF _UNICODE_BUF_MAX = 1048576
+ * 
+ */
+  __pyx_v_19_hadoopy_typedbytes__unicode_buf_size = 0;
+
+  /* "hadoopy/_typedbytes.pyx":464
  * # 1: _write_byte unused
  * # 5: _write_float unused
  * _out_types = {types.BooleanType: 2,             # <<<<<<<<<<<<<<
  *               types.IntType: 3,
  *               types.LongType: 4,
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 464, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_types); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__BooleanType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_BooleanType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_2) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":433
+  /* "hadoopy/_typedbytes.pyx":465
  * # 5: _write_float unused
  * _out_types = {types.BooleanType: 2,
  *               types.IntType: 3,             # <<<<<<<<<<<<<<
  *               types.LongType: 4,
  *               types.FloatType:  6,
  */
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_types); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 465, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__IntType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_IntType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 465, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_3) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":434
+  /* "hadoopy/_typedbytes.pyx":466
  * _out_types = {types.BooleanType: 2,
  *               types.IntType: 3,
  *               types.LongType: 4,             # <<<<<<<<<<<<<<
  *               types.FloatType:  6,
  *               types.StringType: 0,
  */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_types); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__LongType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 434; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_LongType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_4) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":435
+  /* "hadoopy/_typedbytes.pyx":467
  *               types.IntType: 3,
  *               types.LongType: 4,
  *               types.FloatType:  6,             # <<<<<<<<<<<<<<
  *               types.StringType: 0,
  *               types.UnicodeType: 7,
  */
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_types); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 467, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__FloatType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 435; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_FloatType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 467, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_6) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":436
+  /* "hadoopy/_typedbytes.pyx":468
  *               types.LongType: 4,
  *               types.FloatType:  6,
  *               types.StringType: 0,             # <<<<<<<<<<<<<<
  *               types.UnicodeType: 7,
  *               types.TupleType: 8,
  */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_types); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 468, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__StringType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 436; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_StringType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 468, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_0) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_0) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":437
+  /* "hadoopy/_typedbytes.pyx":469
  *               types.FloatType:  6,
  *               types.StringType: 0,
  *               types.UnicodeType: 7,             # <<<<<<<<<<<<<<
  *               types.TupleType: 8,
  *               types.ListType: 9,
  */
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_types); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 469, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__UnicodeType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_UnicodeType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 469, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_7) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":438
+  /* "hadoopy/_typedbytes.pyx":470
  *               types.StringType: 0,
  *               types.UnicodeType: 7,
  *               types.TupleType: 8,             # <<<<<<<<<<<<<<
  *               types.ListType: 9,
  *               types.DictType: 10}
  */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_types); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 470, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__TupleType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_TupleType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 470, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_8) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":439
+  /* "hadoopy/_typedbytes.pyx":471
  *               types.UnicodeType: 7,
  *               types.TupleType: 8,
  *               types.ListType: 9,             # <<<<<<<<<<<<<<
  *               types.DictType: 10}
  * 
  */
-  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_types); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 471, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__ListType); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_ListType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 471, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, __pyx_int_9) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":440
+  /* "hadoopy/_typedbytes.pyx":472
  *               types.TupleType: 8,
  *               types.ListType: 9,
  *               types.DictType: 10}             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__types); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_types); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 472, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__DictType); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_DictType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 472, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_10) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_1, __pyx_t_3, __pyx_int_10) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s___out_types, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_out_types, __pyx_t_1) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":526
+  /* "hadoopy/_typedbytes.pyx":558
  * 
  * 
  * def read_tb():             # <<<<<<<<<<<<<<
  *     return __read_key_value_tb(stdin)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_19_hadoopy_typedbytes_1read_tb, NULL, __pyx_n_s___hadoopy_typedbytes); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_19_hadoopy_typedbytes_1read_tb, NULL, __pyx_n_s_hadoopy_typedbytes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 558, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__read_tb, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_read_tb, __pyx_t_1) < 0) __PYX_ERR(0, 558, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":530
+  /* "hadoopy/_typedbytes.pyx":562
  * 
  * 
  * def write_tb(kv):             # <<<<<<<<<<<<<<
  *     __write_key_value_tb(stdout, kv)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_19_hadoopy_typedbytes_3write_tb, NULL, __pyx_n_s___hadoopy_typedbytes); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_19_hadoopy_typedbytes_3write_tb, NULL, __pyx_n_s_hadoopy_typedbytes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 562, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__write_tb, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_write_tb, __pyx_t_1) < 0) __PYX_ERR(0, 562, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "hadoopy/_typedbytes.pyx":548
- *     cdef object file_method
- *     cdef int flush_writes
- *     def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False):             # <<<<<<<<<<<<<<
- *         self.flush_writes = int(flush_writes)
- *         cdef char *fnc
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k_6 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k_7 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-
   /* "hadoopy/_typedbytes.pyx":1
  * #!/usr/bin/env python             # <<<<<<<<<<<<<<
  * # (C) Copyright 2010 Brandyn A. White
  * #
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   if (__pyx_m) {
-    __Pyx_AddTraceback("init _hadoopy_typedbytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    Py_DECREF(__pyx_m); __pyx_m = 0;
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init _hadoopy_typedbytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
   } else if (!PyErr_Occurred()) {
     PyErr_SetString(PyExc_ImportError, "init _hadoopy_typedbytes");
   }
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
   return __pyx_m;
+  #else
+  return;
   #endif
 }
 
-/* Runtime support code */
+/* --- Runtime support code --- */
+/* Refnanny */
 #if CYTHON_REFNANNY
 static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
     PyObject *m = NULL, *p = NULL;
     void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
+    m = PyImport_ImportModule(modname);
     if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
     if (!p) goto end;
     r = PyLong_AsVoidPtr(p);
 end:
@@ -6123,57 +8982,180 @@ end:
     Py_XDECREF(m);
     return (__Pyx_RefNannyAPIStruct *)r;
 }
-#endif /* CYTHON_REFNANNY */
+#endif
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result) {
-        if (dict != __pyx_b) {
-            PyErr_Clear();
-            result = PyObject_GetAttr(__pyx_b, name);
-        }
-        if (!result) {
-            PyErr_SetObject(PyExc_NameError, name);
-        }
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
     }
     return result;
 }
 
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
     PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
     PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
     local_type = tstate->curexc_type;
     local_value = tstate->curexc_value;
     local_tb = tstate->curexc_traceback;
     tstate->curexc_type = 0;
     tstate->curexc_value = 0;
     tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
     PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
     if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
         goto bad;
     #if PY_MAJOR_VERSION >= 3
-    if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
-        goto bad;
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
     #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
     *type = local_type;
     *value = local_value;
     *tb = local_tb;
-    Py_INCREF(local_type);
-    Py_INCREF(local_value);
-    Py_INCREF(local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
     tmp_type = tstate->exc_type;
     tmp_value = tstate->exc_value;
     tmp_tb = tstate->exc_traceback;
     tstate->exc_type = local_type;
     tstate->exc_value = local_value;
     tstate->exc_traceback = local_tb;
-    /* Make sure tstate is in a consistent state when we XDECREF
-       these objects (XDECREF may run arbitrary code). */
+    #endif
     Py_XDECREF(tmp_type);
     Py_XDECREF(tmp_value);
     Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
     return 0;
 bad:
     *type = 0;
@@ -6185,90 +9167,296 @@ bad:
     return -1;
 }
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#else
-    PyErr_Restore(type, value, tb);
-#endif
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
 }
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-#else
-    PyErr_Fetch(type, value, tb);
 #endif
-}
 
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
-                        CYTHON_UNUSED PyObject *cause) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
     }
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
     }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        if (value != Py_None) {
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
             PyErr_SetString(PyExc_TypeError,
                 "instance exception may not have a separate value");
             goto raise_error;
         }
-        Py_DECREF(value);
         value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
     }
+    __Pyx_PyThreadState_assign
     __Pyx_ErrRestore(type, value, tb);
     return;
 raise_error:
@@ -6277,8 +9465,9 @@ raise_error:
     Py_XDECREF(tb);
     return;
 }
-#else /* Python 3+ */
+#else
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
     if (tb == Py_None) {
         tb = 0;
     } else if (tb && !PyTraceBack_Check(tb)) {
@@ -6296,65 +9485,181 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
         }
         value = type;
         type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
         PyErr_SetString(PyExc_TypeError,
             "raise: exception class must be a subclass of BaseException");
         goto bad;
     }
     if (cause) {
         PyObject *fixed_cause;
-        if (PyExceptionClass_Check(cause)) {
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
             fixed_cause = PyObject_CallObject(cause, NULL);
             if (fixed_cause == NULL)
                 goto bad;
-        }
-        else if (PyExceptionInstance_Check(cause)) {
+        } else if (PyExceptionInstance_Check(cause)) {
             fixed_cause = cause;
             Py_INCREF(fixed_cause);
-        }
-        else {
+        } else {
             PyErr_SetString(PyExc_TypeError,
                             "exception causes must derive from "
                             "BaseException");
             goto bad;
         }
-        if (!value) {
-            value = PyObject_CallObject(type, NULL);
-        }
         PyException_SetCause(value, fixed_cause);
     }
     PyErr_SetObject(type, value);
     if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
         PyObject* tmp_tb = tstate->curexc_traceback;
         if (tb != tmp_tb) {
             Py_INCREF(tb);
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
     }
 bad:
+    Py_XDECREF(owned_instance);
     return;
 }
 #endif
 
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-                 "need more than %"PY_FORMAT_SIZE_T"d value%s to unpack",
-                 index, (index == 1) ? "" : "s");
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
 }
+#endif
 
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %"PY_FORMAT_SIZE_T"d)", expected);
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
 }
 
-static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
-    if (unlikely(retval)) {
-        Py_DECREF(retval);
-        __Pyx_RaiseTooManyValuesError(expected);
-        return -1;
-    } else if (PyErr_Occurred()) {
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
         if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
             PyErr_Clear();
             return 0;
@@ -6363,104 +9668,647 @@ static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
         }
     }
     return 0;
+#endif
 }
 
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AS_STRING(kw_name));
-        #endif
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
 }
+#endif
 
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
         } else {
-            #if PY_MAJOR_VERSION < 3
-            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
-            #else
-            if (unlikely(!PyUnicode_Check(key))) {
-            #endif
-                goto invalid_keyword_type;
-            } else {
-                for (name = first_kw_arg; *name; name++) {
-                    #if PY_MAJOR_VERSION >= 3
-                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                        PyUnicode_Compare(**name, key) == 0) break;
-                    #else
-                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                        _PyString_Eq(**name, key)) break;
-                    #endif
-                }
-                if (*name) {
-                    values[name-argnames] = value;
-                } else {
-                    for (name=argnames; name != first_kw_arg; name++) {
-                        if (**name == key) goto arg_passed_twice;
-                        #if PY_MAJOR_VERSION >= 3
-                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
-                        #else
-                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                            _PyString_Eq(**name, key)) goto arg_passed_twice;
-                        #endif
-                    }
-                    if (kwds2) {
-                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-                    } else {
-                        goto invalid_keyword;
-                    }
-                }
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
             }
         }
     }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
     return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
 bad:
-    return -1;
+    return result;
 }
 
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
+    }
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
+    }
+    return 1;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
+    PyObject *runerr = NULL;
+    Py_ssize_t key_value;
+    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
+    if (unlikely(!(m && m->sq_item))) {
+        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    }
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
+    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(m && m->mp_subscript)) {
+        return m->mp_subscript(obj, key);
+    }
+    return __Pyx_PyObject_GetIndex(obj, key);
+}
+#endif
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
 {
     Py_ssize_t num_expected;
     const char *more_or_less;
@@ -6475,44 +10323,367 @@ static void __Pyx_RaiseArgtupleInvalid(
         more_or_less = "exactly";
     }
     PyErr_Format(PyExc_TypeError,
-                 "%s() takes %s %"PY_FORMAT_SIZE_T"d positional argument%s (%"PY_FORMAT_SIZE_T"d given)",
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
                  func_name, more_or_less, num_expected,
                  (num_expected == 1) ? "" : "s", num_found);
 }
 
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
 }
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
 }
 
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level) {
-    PyObject *py_import = 0;
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
     PyObject *empty_dict = 0;
     PyObject *list;
-    py_import = __Pyx_GetAttrString(__pyx_b, "__import__");
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
     if (!py_import)
         goto bad;
+    #endif
     if (from_list)
         list = from_list;
     else {
@@ -6527,875 +10698,1800 @@ static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level) {
     empty_dict = PyDict_New();
     if (!empty_dict)
         goto bad;
-    #if PY_VERSION_HEX >= 0x02050000
     {
         #if PY_MAJOR_VERSION >= 3
         if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
-                /* try package relative import first */
-                PyObject *py_level = PyInt_FromLong(1);
-                if (!py_level)
-                    goto bad;
-                module = PyObject_CallFunctionObjArgs(py_import,
-                    name, global_dict, empty_dict, list, py_level, NULL);
-                Py_DECREF(py_level);
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
                 if (!module) {
                     if (!PyErr_ExceptionMatches(PyExc_ImportError))
                         goto bad;
                     PyErr_Clear();
                 }
             }
-            level = 0; /* try absolute import on failure */
+            level = 0;
         }
         #endif
         if (!module) {
+            #if PY_MAJOR_VERSION < 3
             PyObject *py_level = PyInt_FromLong(level);
             if (!py_level)
                 goto bad;
             module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, NULL);
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
             Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
         }
     }
-    #else
-    if (level>0) {
-        PyErr_SetString(PyExc_RuntimeError, "Relative import is not supported for Python <=2.4.");
-        goto bad;
-    }
-    module = PyObject_CallFunctionObjArgs(py_import,
-        name, global_dict, empty_dict, list, NULL);
-    #endif
 bad:
-    Py_XDECREF(empty_list);
+    #if PY_MAJOR_VERSION < 3
     Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
     Py_XDECREF(empty_dict);
     return module;
 }
 
-static CYTHON_INLINE int32_t __Pyx_PyInt_from_py_int32_t(PyObject* x) {
-    const int32_t neg_one = (int32_t)-1, const_zero = (int32_t)0;
-    const int is_unsigned = const_zero < neg_one;
-    if (sizeof(int32_t) == sizeof(char)) {
-        if (is_unsigned)
-            return (int32_t)__Pyx_PyInt_AsUnsignedChar(x);
-        else
-            return (int32_t)__Pyx_PyInt_AsSignedChar(x);
-    } else if (sizeof(int32_t) == sizeof(short)) {
-        if (is_unsigned)
-            return (int32_t)__Pyx_PyInt_AsUnsignedShort(x);
-        else
-            return (int32_t)__Pyx_PyInt_AsSignedShort(x);
-    } else if (sizeof(int32_t) == sizeof(int)) {
-        if (is_unsigned)
-            return (int32_t)__Pyx_PyInt_AsUnsignedInt(x);
-        else
-            return (int32_t)__Pyx_PyInt_AsSignedInt(x);
-    } else if (sizeof(int32_t) == sizeof(long)) {
-        if (is_unsigned)
-            return (int32_t)__Pyx_PyInt_AsUnsignedLong(x);
-        else
-            return (int32_t)__Pyx_PyInt_AsSignedLong(x);
-    } else if (sizeof(int32_t) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return (int32_t)__Pyx_PyInt_AsUnsignedLongLong(x);
-        else
-            return (int32_t)__Pyx_PyInt_AsSignedLongLong(x);
-    }  else {
-        int32_t val;
-        PyObject *v = __Pyx_PyNumber_Int(x);
-        #if PY_VERSION_HEX < 0x03000000
-        if (likely(v) && !PyLong_Check(v)) {
-            PyObject *tmp = v;
-            v = PyNumber_Long(tmp);
-            Py_DECREF(tmp);
-        }
-        #endif
-        if (likely(v)) {
-            int one = 1; int is_little = (int)*(unsigned char *)&one;
-            unsigned char *bytes = (unsigned char *)&val;
-            int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                          bytes, sizeof(val),
-                                          is_little, !is_unsigned);
-            Py_DECREF(v);
-            if (likely(!ret))
-                return val;
-        }
-        return (int32_t)-1;
-    }
-}
-
-static CYTHON_INLINE int64_t __Pyx_PyInt_from_py_int64_t(PyObject* x) {
-    const int64_t neg_one = (int64_t)-1, const_zero = (int64_t)0;
-    const int is_unsigned = const_zero < neg_one;
-    if (sizeof(int64_t) == sizeof(char)) {
-        if (is_unsigned)
-            return (int64_t)__Pyx_PyInt_AsUnsignedChar(x);
-        else
-            return (int64_t)__Pyx_PyInt_AsSignedChar(x);
-    } else if (sizeof(int64_t) == sizeof(short)) {
-        if (is_unsigned)
-            return (int64_t)__Pyx_PyInt_AsUnsignedShort(x);
-        else
-            return (int64_t)__Pyx_PyInt_AsSignedShort(x);
-    } else if (sizeof(int64_t) == sizeof(int)) {
-        if (is_unsigned)
-            return (int64_t)__Pyx_PyInt_AsUnsignedInt(x);
-        else
-            return (int64_t)__Pyx_PyInt_AsSignedInt(x);
-    } else if (sizeof(int64_t) == sizeof(long)) {
-        if (is_unsigned)
-            return (int64_t)__Pyx_PyInt_AsUnsignedLong(x);
-        else
-            return (int64_t)__Pyx_PyInt_AsSignedLong(x);
-    } else if (sizeof(int64_t) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return (int64_t)__Pyx_PyInt_AsUnsignedLongLong(x);
-        else
-            return (int64_t)__Pyx_PyInt_AsSignedLongLong(x);
-    }  else {
-        int64_t val;
-        PyObject *v = __Pyx_PyNumber_Int(x);
-        #if PY_VERSION_HEX < 0x03000000
-        if (likely(v) && !PyLong_Check(v)) {
-            PyObject *tmp = v;
-            v = PyNumber_Long(tmp);
-            Py_DECREF(tmp);
-        }
-        #endif
-        if (likely(v)) {
-            int one = 1; int is_little = (int)*(unsigned char *)&one;
-            unsigned char *bytes = (unsigned char *)&val;
-            int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                          bytes, sizeof(val),
-                                          is_little, !is_unsigned);
-            Py_DECREF(v);
-            if (likely(!ret))
-                return val;
-        }
-        return (int64_t)-1;
-    }
-}
-
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_int32_t(int32_t val) {
-    const int32_t neg_one = (int32_t)-1, const_zero = (int32_t)0;
-    const int is_unsigned = const_zero < neg_one;
-    if ((sizeof(int32_t) == sizeof(char))  ||
-        (sizeof(int32_t) == sizeof(short))) {
-        return PyInt_FromLong((long)val);
-    } else if ((sizeof(int32_t) == sizeof(int)) ||
-               (sizeof(int32_t) == sizeof(long))) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLong((unsigned long)val);
-        else
-            return PyInt_FromLong((long)val);
-    } else if (sizeof(int32_t) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG)val);
-        else
-            return PyLong_FromLongLong((PY_LONG_LONG)val);
-    } else {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        return _PyLong_FromByteArray(bytes, sizeof(int32_t),
-                                     little, !is_unsigned);
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
     }
-}
-
-static CYTHON_INLINE PyObject *__Pyx_PyInt_to_py_int64_t(int64_t val) {
-    const int64_t neg_one = (int64_t)-1, const_zero = (int64_t)0;
-    const int is_unsigned = const_zero < neg_one;
-    if ((sizeof(int64_t) == sizeof(char))  ||
-        (sizeof(int64_t) == sizeof(short))) {
-        return PyInt_FromLong((long)val);
-    } else if ((sizeof(int64_t) == sizeof(int)) ||
-               (sizeof(int64_t) == sizeof(long))) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLong((unsigned long)val);
-        else
-            return PyInt_FromLong((long)val);
-    } else if (sizeof(int64_t) == sizeof(PY_LONG_LONG)) {
-        if (is_unsigned)
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG)val);
-        else
-            return PyLong_FromLongLong((PY_LONG_LONG)val);
-    } else {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        return _PyLong_FromByteArray(bytes, sizeof(int64_t),
-                                     little, !is_unsigned);
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
     }
-}
-
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
-    if (s1 == s2) {
-        return (equals == Py_EQ);
-    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
-        if (PyBytes_GET_SIZE(s1) != PyBytes_GET_SIZE(s2)) {
-            return (equals == Py_NE);
-        } else if (PyBytes_GET_SIZE(s1) == 1) {
-            if (equals == Py_EQ)
-                return (PyBytes_AS_STRING(s1)[0] == PyBytes_AS_STRING(s2)[0]);
-            else
-                return (PyBytes_AS_STRING(s1)[0] != PyBytes_AS_STRING(s2)[0]);
-        } else {
-            int result = memcmp(PyBytes_AS_STRING(s1), PyBytes_AS_STRING(s2), (size_t)PyBytes_GET_SIZE(s1));
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
-        return (equals == Py_NE);
-    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
-        return (equals == Py_NE);
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
 }
+#endif
 
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
-    if (s1 == s2) {
-        return (equals == Py_EQ);
-    } else if (PyUnicode_CheckExact(s1) & PyUnicode_CheckExact(s2)) {
-        #if CYTHON_PEP393_ENABLED
-        if ((PyUnicode_READY(s1) < 0) || (PyUnicode_READY(s2) < 0))
-            return -1;
-        if (PyUnicode_GET_LENGTH(s1) != PyUnicode_GET_LENGTH(s2)) {
-            return (equals == Py_NE);
-        } else if (PyUnicode_GET_LENGTH(s1) == 1) {
-            Py_UCS4 ch1 = PyUnicode_READ_CHAR(s1, 0);
-            Py_UCS4 ch2 = PyUnicode_READ_CHAR(s2, 0);
-            return (equals == Py_EQ) ? (ch1 == ch2) : (ch1 != ch2);
-        #else
-        if (PyUnicode_GET_SIZE(s1) != PyUnicode_GET_SIZE(s2)) {
-            return (equals == Py_NE);
-        } else if (PyUnicode_GET_SIZE(s1) == 1) {
-            Py_UNICODE ch1 = PyUnicode_AS_UNICODE(s1)[0];
-            Py_UNICODE ch2 = PyUnicode_AS_UNICODE(s2)[0];
-            return (equals == Py_EQ) ? (ch1 == ch2) : (ch1 != ch2);
-        #endif
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
         } else {
-            int result = PyUnicode_Compare(s1, s2);
-            if ((result == -1) && unlikely(PyErr_Occurred()))
-                return -1;
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+            return mid;
         }
-    } else if ((s1 == Py_None) & PyUnicode_CheckExact(s2)) {
-        return (equals == Py_NE);
-    } else if ((s2 == Py_None) & PyUnicode_CheckExact(s1)) {
-        return (equals == Py_NE);
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
     } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
+        return mid + 1;
     }
 }
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
-    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned char" :
-                    "value too large to convert to unsigned char");
-            }
-            return (unsigned char)-1;
-        }
-        return (unsigned char)val;
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
     }
-    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
-    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned short" :
-                    "value too large to convert to unsigned short");
-            }
-            return (unsigned short)-1;
-        }
-        return (unsigned short)val;
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
     }
-    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
 }
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
-    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned int" :
-                    "value too large to convert to unsigned int");
-            }
-            return (unsigned int)-1;
-        }
-        return (unsigned int)val;
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
     }
-    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
-    const char neg_one = (char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to char" :
-                    "value too large to convert to char");
-            }
-            return (char)-1;
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
         }
-        return (char)val;
+        return;
     }
-    return (char)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
-    const short neg_one = (short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to short" :
-                    "value too large to convert to short");
-            }
-            return (short)-1;
-        }
-        return (short)val;
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
     }
-    return (short)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
         }
-        return (int)val;
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
     }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
-    const signed char neg_one = (signed char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed char" :
-                    "value too large to convert to signed char");
-            }
-            return (signed char)-1;
-        }
-        return (signed char)val;
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
     }
-    return (signed char)__Pyx_PyInt_AsSignedLong(x);
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
 }
 
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
-    const signed short neg_one = (signed short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed short" :
-                    "value too large to convert to signed short");
-            }
-            return (signed short)-1;
-        }
-        return (signed short)val;
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
     }
-    return (signed short)__Pyx_PyInt_AsSignedLong(x);
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
 }
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
-    const signed int neg_one = (signed int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed int" :
-                    "value too large to convert to signed int");
-            }
-            return (signed int)-1;
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
         }
-        return (signed int)val;
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
-    return (signed int)__Pyx_PyInt_AsSignedLong(x);
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
 }
 
-static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
     }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
 
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
-    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
+#if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned long");
-            return (unsigned long)-1;
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
         }
-        return (unsigned long)val;
     } else
 #endif
     if (likely(PyLong_Check(x))) {
         if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned long");
-                return (unsigned long)-1;
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
-            return (unsigned long)PyLong_AsUnsignedLong(x);
         } else {
-            return (unsigned long)PyLong_AsLong(x);
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
         }
     } else {
-        unsigned long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned long)-1;
-        val = __Pyx_PyInt_AsUnsignedLong(tmp);
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
         Py_DECREF(tmp);
         return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
 }
 
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
+/* CIntFromPy */
+static CYTHON_INLINE int32_t __Pyx_PyInt_As_int32_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
+#if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned PY_LONG_LONG");
-            return (unsigned PY_LONG_LONG)-1;
+        if (sizeof(int32_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int32_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int32_t) val;
         }
-        return (unsigned PY_LONG_LONG)val;
     } else
 #endif
     if (likely(PyLong_Check(x))) {
         if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int32_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int32_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 2 * PyLong_SHIFT) {
+                            return (int32_t) (((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 3 * PyLong_SHIFT) {
+                            return (int32_t) (((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 4 * PyLong_SHIFT) {
+                            return (int32_t) (((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned PY_LONG_LONG");
-                return (unsigned PY_LONG_LONG)-1;
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int32_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int32_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
-            return (unsigned PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
         } else {
-            return (unsigned PY_LONG_LONG)PyLong_AsLongLong(x);
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int32_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int32_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int32_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int32_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int32_t) ((((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int32_t) ((((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int32_t) ((((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int32_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int32_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int32_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int32_t) -1;
         }
     } else {
-        unsigned PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
+        int32_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int32_t) -1;
+        val = __Pyx_PyInt_As_int32_t(tmp);
         Py_DECREF(tmp);
         return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int32_t");
+    return (int32_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int32_t");
+    return (int32_t) -1;
 }
 
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
-    const long neg_one = (long)-1, const_zero = 0;
+/* CIntFromPy */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
+#if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to long");
-            return (long)-1;
+        if (sizeof(int64_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int64_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int64_t) val;
         }
-        return (long)val;
     } else
 #endif
     if (likely(PyLong_Check(x))) {
         if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 2 * PyLong_SHIFT) {
+                            return (int64_t) (((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 3 * PyLong_SHIFT) {
+                            return (int64_t) (((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 4 * PyLong_SHIFT) {
+                            return (int64_t) (((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to long");
-                return (long)-1;
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int64_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
-            return (long)PyLong_AsUnsignedLong(x);
         } else {
-            return (long)PyLong_AsLong(x);
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int64_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int64_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) ((((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int64_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int64_t) -1;
         }
     } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long)-1;
-        val = __Pyx_PyInt_AsLong(tmp);
+        int64_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int64_t) -1;
+        val = __Pyx_PyInt_As_int64_t(tmp);
         Py_DECREF(tmp);
         return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int64_t");
+    return (int64_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int64_t");
+    return (int64_t) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_signed__char(signed char value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const signed char neg_one = (signed char) -1, const_zero = (signed char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(signed char) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(signed char) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(signed char) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(signed char) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(signed char) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(signed char),
+                                     little, !is_unsigned);
+    }
 }
 
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
+/* CIntFromPy */
+static CYTHON_INLINE signed char __Pyx_PyInt_As_signed__char(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const signed char neg_one = (signed char) -1, const_zero = (signed char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
+#if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to PY_LONG_LONG");
-            return (PY_LONG_LONG)-1;
+        if (sizeof(signed char) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(signed char, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (signed char) val;
         }
-        return (PY_LONG_LONG)val;
     } else
 #endif
     if (likely(PyLong_Check(x))) {
         if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (signed char) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(signed char, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(signed char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) >= 2 * PyLong_SHIFT) {
+                            return (signed char) (((((signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(signed char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) >= 3 * PyLong_SHIFT) {
+                            return (signed char) (((((((signed char)digits[2]) << PyLong_SHIFT) | (signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(signed char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) >= 4 * PyLong_SHIFT) {
+                            return (signed char) (((((((((signed char)digits[3]) << PyLong_SHIFT) | (signed char)digits[2]) << PyLong_SHIFT) | (signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to PY_LONG_LONG");
-                return (PY_LONG_LONG)-1;
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (signed char) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(signed char) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(signed char, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(signed char) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(signed char, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
-            return (PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
         } else {
-            return (PY_LONG_LONG)PyLong_AsLongLong(x);
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (signed char) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(signed char, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(signed char,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(signed char) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) - 1 > 2 * PyLong_SHIFT) {
+                            return (signed char) (((signed char)-1)*(((((signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(signed char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) - 1 > 2 * PyLong_SHIFT) {
+                            return (signed char) ((((((signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(signed char) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) - 1 > 3 * PyLong_SHIFT) {
+                            return (signed char) (((signed char)-1)*(((((((signed char)digits[2]) << PyLong_SHIFT) | (signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(signed char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) - 1 > 3 * PyLong_SHIFT) {
+                            return (signed char) ((((((((signed char)digits[2]) << PyLong_SHIFT) | (signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(signed char) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) - 1 > 4 * PyLong_SHIFT) {
+                            return (signed char) (((signed char)-1)*(((((((((signed char)digits[3]) << PyLong_SHIFT) | (signed char)digits[2]) << PyLong_SHIFT) | (signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(signed char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(signed char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(signed char) - 1 > 4 * PyLong_SHIFT) {
+                            return (signed char) ((((((((((signed char)digits[3]) << PyLong_SHIFT) | (signed char)digits[2]) << PyLong_SHIFT) | (signed char)digits[1]) << PyLong_SHIFT) | (signed char)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(signed char) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(signed char, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(signed char) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(signed char, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            signed char val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (signed char) -1;
         }
     } else {
-        PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsLongLong(tmp);
+        signed char val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (signed char) -1;
+        val = __Pyx_PyInt_As_signed__char(tmp);
         Py_DECREF(tmp);
         return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to signed char");
+    return (signed char) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to signed char");
+    return (signed char) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int32_t(int32_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int32_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int32_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int32_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int32_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int32_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int64_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int64_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int64_t),
+                                     little, !is_unsigned);
+    }
 }
 
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
-    const signed long neg_one = (signed long)-1, const_zero = 0;
+/* CIntFromPy */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
+#if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed long");
-            return (signed long)-1;
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (size_t) val;
         }
-        return (signed long)val;
     } else
 #endif
     if (likely(PyLong_Check(x))) {
         if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed long");
-                return (signed long)-1;
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (size_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
-            return (signed long)PyLong_AsUnsignedLong(x);
         } else {
-            return (signed long)PyLong_AsLong(x);
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            size_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (size_t) -1;
         }
     } else {
-        signed long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed long)-1;
-        val = __Pyx_PyInt_AsSignedLong(tmp);
+        size_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
         Py_DECREF(tmp);
         return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to size_t");
+    return (size_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to size_t");
+    return (size_t) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
 }
 
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
-    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
+#if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed PY_LONG_LONG");
-            return (signed PY_LONG_LONG)-1;
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
         }
-        return (signed PY_LONG_LONG)val;
     } else
 #endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed PY_LONG_LONG");
-                return (signed PY_LONG_LONG)-1;
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
             }
-            return (signed PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
-        } else {
-            return (signed PY_LONG_LONG)PyLong_AsLongLong(x);
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
         }
     } else {
-        signed PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsSignedLongLong(tmp);
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
         Py_DECREF(tmp);
         return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
 }
 
-static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
-        char message[200];
-        PyOS_snprintf(message, sizeof(message),
-                      "compiletime version %s of module '%.100s' "
-                      "does not match runtime version %s",
-                      ctversion, __Pyx_MODULE_NAME, rtversion);
-        #if PY_VERSION_HEX < 0x02050000
-        return PyErr_Warn(NULL, message);
-        #else
-        return PyErr_WarnEx(NULL, message, 1);
-        #endif
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
     }
-    return 0;
+    return b == &PyBaseObject_Type;
 }
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-#if PY_VERSION_HEX >= 0x02070000 && !(PY_MAJOR_VERSION==3&&PY_MINOR_VERSION==0)
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-#else
-    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
-#endif
-    if (!ob)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__pyx_vtable__", ob) < 0)
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
 }
-
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
-    int start = 0, mid = 0, end = count - 1;
-    if (end >= 0 && code_line > entries[end].code_line) {
-        return count;
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
     }
-    while (start < end) {
-        mid = (start + end) / 2;
-        if (code_line < entries[mid].code_line) {
-            end = mid;
-        } else if (code_line > entries[mid].code_line) {
-             start = mid + 1;
-        } else {
-            return mid;
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
         }
     }
-    if (code_line <= entries[mid].code_line) {
-        return mid;
-    } else {
-        return mid + 1;
-    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
 }
-static PyCodeObject *__pyx_find_code_object(int code_line) {
-    PyCodeObject* code_object;
-    int pos;
-    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
-        return NULL;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
-        return NULL;
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
     }
-    code_object = __pyx_code_cache.entries[pos].code_object;
-    Py_INCREF(code_object);
-    return code_object;
+    return res;
 }
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
-    int pos, i;
-    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
-    if (unlikely(!code_line)) {
-        return;
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
     }
-    if (unlikely(!entries)) {
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (likely(entries)) {
-            __pyx_code_cache.entries = entries;
-            __pyx_code_cache.max_count = 64;
-            __pyx_code_cache.count = 1;
-            entries[0].code_line = code_line;
-            entries[0].code_object = code_object;
-            Py_INCREF(code_object);
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
         }
-        return;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
-        PyCodeObject* tmp = entries[pos].code_object;
-        entries[pos].code_object = code_object;
-        Py_DECREF(tmp);
-        return;
     }
-    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
-        int new_max = __pyx_code_cache.max_count + 64;
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, new_max*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (unlikely(!entries)) {
-            return;
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
         }
-        __pyx_code_cache.entries = entries;
-        __pyx_code_cache.max_count = new_max;
     }
-    for (i=__pyx_code_cache.count; i>pos; i--) {
-        entries[i] = entries[i-1];
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
     }
-    entries[pos].code_line = code_line;
-    entries[pos].code_object = code_object;
-    __pyx_code_cache.count++;
-    Py_INCREF(code_object);
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
 }
+#endif
 
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
-            const char *funcname, int c_line,
-            int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (c_line) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
     }
-    if (!py_funcname) goto bad;
-    py_code = __Pyx_PyCode_New(
-        0,            /*int argcount,*/
-        0,            /*int kwonlyargcount,*/
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple, /*PyObject *consts,*/
-        __pyx_empty_tuple, /*PyObject *names,*/
-        __pyx_empty_tuple, /*PyObject *varnames,*/
-        __pyx_empty_tuple, /*PyObject *freevars,*/
-        __pyx_empty_tuple, /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        py_line,      /*int firstlineno,*/
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
-    return py_code;
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    return NULL;
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_globals = 0;
-    PyFrameObject *py_frame = 0;
-    py_code = __pyx_find_code_object(c_line ? c_line : py_line);
-    if (!py_code) {
-        py_code = __Pyx_CreateCodeObjectForTraceback(
-            funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
-        __pyx_insert_code_object(c_line ? c_line : py_line, py_code);
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
     }
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = py_line;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
+    return 0;
 }
 
+/* InitStrings */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
@@ -7406,7 +12502,7 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
         } else {
             *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
         }
-        #else  /* Python 3+ has unicode identifiers */
+        #else
         if (t->is_unicode | t->is_str) {
             if (t->intern) {
                 *t->p = PyUnicode_InternFromString(t->s);
@@ -7421,57 +12517,158 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
         #endif
         if (!*t->p)
             return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
         ++t;
     }
     return 0;
 }
 
-
-/* Type Conversion Functions */
-
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
    int is_true = x == Py_True;
    if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
    else return PyObject_IsTrue(x);
 }
-
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
   PyNumberMethods *m;
+#endif
   const char *name = NULL;
   PyObject *res = NULL;
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(x) || PyLong_Check(x))
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
 #else
-  if (PyLong_Check(x))
+  if (likely(PyLong_Check(x)))
 #endif
-    return Py_INCREF(x), x;
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
   m = Py_TYPE(x)->tp_as_number;
-#if PY_VERSION_HEX < 0x03000000
+  #if PY_MAJOR_VERSION < 3
   if (m && m->nb_int) {
     name = "int";
-    res = PyNumber_Int(x);
+    res = m->nb_int(x);
   }
   else if (m && m->nb_long) {
     name = "long";
-    res = PyNumber_Long(x);
+    res = m->nb_long(x);
   }
-#else
-  if (m && m->nb_int) {
+  #else
+  if (likely(m && m->nb_int)) {
     name = "int";
-    res = PyNumber_Long(x);
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
   }
 #endif
-  if (res) {
-#if PY_VERSION_HEX < 0x03000000
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
 #else
-    if (!PyLong_Check(res)) {
+    if (unlikely(!PyLong_CheckExact(res))) {
 #endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%s__ returned non-%s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
     }
   }
   else if (!PyErr_Occurred()) {
@@ -7480,40 +12677,90 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
   }
   return res;
 }
-
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
   if (!x) return -1;
   ival = PyInt_AsSsize_t(x);
   Py_DECREF(x);
   return ival;
 }
-
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-#if PY_VERSION_HEX < 0x02050000
-   if (ival <= LONG_MAX)
-       return PyInt_FromLong((long)ival);
-   else {
-       unsigned char *bytes = (unsigned char *) &ival;
-       int one = 1; int little = (int)*(unsigned char*)&one;
-       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
-   }
-#else
-   return PyInt_FromSize_t(ival);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
 #endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
 }
-
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
-   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
-   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
-       return (size_t)-1;
-   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
-       PyErr_SetString(PyExc_OverflowError,
-                       "value too large to convert to size_t");
-       return (size_t)-1;
-   }
-   return (size_t)val;
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
 }
 
 
@@ -23,6 +23,7 @@ from libc.stdint cimport int32_t, int64_t
 
 cdef extern from "stdlib.h":
     void *malloc(size_t size)
+    void *realloc(void *ptr, size_t size)
     void free(void *ptr)            
 
 cdef extern from "stdio.h":
@@ -49,6 +50,8 @@ cdef extern from "Python.h":
     object PyString_FromStringAndSize(char *s, Py_ssize_t len)
     int PyString_AsStringAndSize(object obj, char **buffer, Py_ssize_t *length)
     char* PyString_AsString(object string)
+    char* PyString_AS_STRING(object string)
+    object PyUnicode_DecodeUTF8(char *s, Py_ssize_t size, char *errors)
     
 
 cdef inline int32_t _read_int(void *fp):
@@ -244,14 +247,26 @@ cdef inline _read_bytes(void *fp):
     Returns:
         Python string of bytes
     """
-    sz = _read_int(fp)
-    cdef char *bytes = <char*>malloc(sz)
-    fread(bytes, sz, 1, fp)  # = 1
-    out = PyString_FromStringAndSize(bytes, sz)
-    free(bytes)
+    cdef int32_t sz = _read_int(fp)
+    # Read directly into the new string, no temporary buffer
+    out = PyString_FromStringAndSize(NULL, sz)
+    fread(PyString_AS_STRING(out), sz, 1, fp)  # = 1
     return out
 
 
+# Reused by _read_unicode, grows to the largest string seen up to _UNICODE_BUF_MAX
+cdef char *_unicode_buf = NULL
+cdef int32_t _unicode_buf_size = 0
+DEF _UNICODE_BUF_MAX = 1048576
+
+
+cdef inline _decode_utf8(char *buf, int32_t sz):
+    try:
+        return PyUnicode_DecodeUTF8(buf, sz, NULL)
+    except UnicodeError:
+        raise UnicodeError('Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.')
+
+
 # NOTE(brandyn): This is incompatible with Dumbo's typedbytes as strings and unicode both go to string
 cdef inline _read_unicode(void *fp):
     """Read bytes
@@ -262,15 +277,30 @@ cdef inline _read_unicode(void *fp):
     Returns:
         Python unicode
     """
-    sz = _read_int(fp)
-    cdef char *bytes = <char*>malloc(sz)
-    fread(bytes, sz, 1, fp)  # = 1
-    out = PyString_FromStringAndSize(bytes, sz)
-    free(bytes)
-    try:
-        return unicode(out, 'utf-8')
-    except UnicodeError:
-        raise UnicodeError('Error decoding unicode string.  See hadoopy.com for details on TypedBytes encoding.')
+    global _unicode_buf, _unicode_buf_size
+    cdef int32_t sz = _read_int(fp)
+    cdef char *buf
+    if sz < 0:
+        raise ValueError('Bad unicode string size %d' % sz)
+    if sz > _UNICODE_BUF_MAX:
+        # Too large to keep around, use a buffer for just this string
+        buf = <char*>malloc(sz)
+        if buf == NULL:
+            raise MemoryError
+        try:
+            fread(buf, sz, 1, fp)  # = 1
+            return _decode_utf8(buf, sz)
+        finally:
+            free(buf)
+    if sz > _unicode_buf_size:
+        buf = <char*>realloc(_unicode_buf, sz)
+        if buf == NULL:
+            raise MemoryError
+        _unicode_buf = buf
+        _unicode_buf_size = sz
+    fread(_unicode_buf, sz, 1, fp)  # = 1
+    # Decode from the reused buffer, no temporary str per value
+    return _decode_utf8(_unicode_buf, sz)
 
 
 cdef inline _write_bytes(void *fp, val):
@@ -315,7 +345,8 @@ cdef inline _read_vector(void *fp):
     Returns:
         Python tuple with nested values
     """
-    sz = _read_int(fp)
+    cdef int32_t sz = _read_int(fp)
+    cdef int32_t x
     out = []
     for x in range(sz):
         out.append(_read_tb_code(fp))
@@ -379,11 +410,12 @@ cdef inline _read_map(void *fp):
     Returns:
         Python dict with nested values
     """
-    sz = _read_int(fp)
+    cdef int32_t sz = _read_int(fp)
+    cdef int32_t x
     out = {}
     for x in range(sz):
-        k, v = _read_tb_code(fp), _read_tb_code(fp)
-        out[k] = v
+        k = _read_tb_code(fp)
+        out[k] = _read_tb_code(fp)
     return out
 
 
@@ -539,14 +571,22 @@ cdef class TypedBytesFile(object):
     :param read_fd: Read file descriptor (int) (default None)
     :param write_fd: Write file descriptor (int) (default None)
     :param flush_writes: If True then flush the buffer for every write (default False)
+    :param unbuffered_reads: If True then reads from read_fd aren't buffered (default False)
+    :param read_buffer_size: If > 0 then reads from read_fd use a buffer of this many bytes (default 0, use the stdio size)
+    :param write_buffer_size: If > 0 then writes to write_fd use a buffer of this many bytes (default 0, use the stdio size)
     """
     cdef void* _write_ptr
     cdef void* _read_ptr
+    cdef char* _read_buf
+    cdef char* _write_buf
     cdef object _repr
     cdef object file_method
+    cdef object _batch_error
     cdef int flush_writes
-    def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False):
+    def __init__(self, fn=None, mode=None, read_fd=None, write_fd=None, flush_writes=False, unbuffered_reads=False, read_buffer_size=0, write_buffer_size=0):
         self.flush_writes = int(flush_writes)
+        self._read_buf = NULL
+        self._write_buf = NULL
         cdef char *fnc
         cdef char *modec
         self._repr = "TypedBytesFile(%s, %s, %s, %s)" % (repr(fn), repr(mode), repr(read_fd), repr(write_fd))
@@ -564,7 +604,14 @@ cdef class TypedBytesFile(object):
             self._read_ptr = fdopen(read_fd, 'r') if read_fd != None else <void *>0
             if unbuffered_reads:
                 setvbuf(self._read_ptr, <char *>0, 2, 0)
+            elif read_buffer_size > 0 and self._read_ptr != NULL:
+                # glibc ignores the size unless we provide the buffer
+                self._read_buf = <char*>malloc(read_buffer_size)
+                setvbuf(self._read_ptr, self._read_buf, 0, read_buffer_size)  # 0 == _IOFBF
             self._write_ptr = fdopen(write_fd, 'w') if write_fd != None else <void *>0
+            if write_buffer_size > 0 and self._write_ptr != NULL:
+                self._write_buf = <char*>malloc(write_buffer_size)
+                setvbuf(self._write_ptr, self._write_buf, 0, write_buffer_size)  # 0 == _IOFBF
         else:
             self.file_method = 'stdinout'
             self._write_ptr = stdout
@@ -581,6 +628,10 @@ cdef class TypedBytesFile(object):
             fclose(self._write_ptr)
         self._write_ptr = NULL
         self._read_ptr = NULL
+        free(self._read_buf)
+        self._read_buf = NULL
+        free(self._write_buf)
+        self._write_buf = NULL
 
     def __repr__(self):
         return self._repr
@@ -602,6 +653,38 @@ cdef class TypedBytesFile(object):
             raise ValueError("Read pointer not set!")
         return __read_key_value_tb(self._read_ptr)
 
+    def next_batch(self, int n=1024):
+        """Read up to n KeyValue pairs with one call
+
+        Blocks until n pairs are read or the stream ends.  If reading fails
+        after some pairs were read, those are returned and the error is raised
+        by the next call.
+
+        :param n: Max number of KeyValue pairs to read (default 1024)
+        :returns: List of (key, value), shorter than n only at the end of the stream
+        :raises: StopIteration: If there are no KeyValue pairs left
+        """
+        cdef int x
+        if self._read_ptr == <void *>0:
+            raise ValueError("Read pointer not set!")
+        if self._batch_error is not None:
+            e, self._batch_error = self._batch_error, None
+            raise e
+        out = []
+        for x in range(n):
+            try:
+                out.append(__read_key_value_tb(self._read_ptr))
+            except StopIteration:
+                break
+            except Exception as e:
+                if not out:
+                    raise
+                self._batch_error = e
+                break
+        if not out:
+            raise StopIteration
+        return out
+
     def write(self, kv):
         if self._write_ptr == <void *>0:
             raise ValueError("Write pointer not set!")
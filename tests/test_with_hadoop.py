@@ -81,10 +81,9 @@ def readtb(paths, ignore_logs=True):
             keep_file = lambda x: os.path.basename(x)[0] != '_'
             all_paths = filter(keep_file, all_paths)
         for cur_path in all_paths:
-            cmd = 'hadoop jar %s dumptb %s' % (hstreaming, cur_path)
             read_fd, write_fd = os.pipe()
             write_fp = os.fdopen(write_fd, 'w')
-            p = hadoopy._hdfs._hadoop_fs_command(cmd, stdout=write_fp)
+            p = hadoopy._hdfs._hadoop_fs_command(['hadoop', 'jar', hstreaming, 'dumptb', cur_path], stdout=write_fp)
             write_fp.close()
             with hadoopy.TypedBytesFile(read_fd=read_fd) as tb_fp:
                 for kv in tb_fp:
@@ -226,6 +225,7 @@ class TestUsingHadoop(unittest.TestCase):
         self.assertTrue(line in cat_output)
         ls_output = hadoopy.ls(self.data_path)
         self.assertTrue([x for x in ls_output if x.rsplit('/', 1)[-1] == fn])
+        self.assertEqual(list(hadoopy.ils(self.data_path)), ls_output)
         ls_output = hadoopy.ls(file_path)
         self.assertTrue(ls_output[0].rsplit('/', 1)[-1] == fn)
 
@@ -250,11 +250,16 @@ class TestUsingHadoop(unittest.TestCase):
         self.assertFalse(hadoopy.exists(working_path))
         self.assertFalse(hadoopy.isdir(working_path))
         self.assertFalse(hadoopy.isempty(working_path))
+        fns = []
         for x in range(10):
             fn = '%s/%.5d' % (working_path, x)
             print(fn)
             data = [('1', 1), (1.3, np.array([1, 2, 3])), (True, {'1': 3})]
             hadoopy.writetb(fn, data)
+            fns.append(fn)
+        self.assertEqual(hadoopy.exists_many(fns + [working_path + '/missing']), [True] * 10 + [False])
+        self.assertEqual(hadoopy.isdir_many([fn, working_path]), [False, True])
+        self.assertEqual(hadoopy.isempty_many([fn, working_path]), [False, True])
         self.assertFalse(hadoopy.isdir(fn))
         self.assertFalse(hadoopy.isempty(fn))
         self.assertTrue(hadoopy.isdir(working_path))
@@ -262,6 +267,17 @@ class TestUsingHadoop(unittest.TestCase):
         self.assertEqual(self._readtb(readtb, working_path),
                          self._readtb(hadoopy.readtb, working_path))
 
+    @unittest.skipIf(not hadoop_installed(), 'Hadoop not installed')
+    def test_writetb_from_fd(self):
+        data = [('1', 1), (1.3, 'a'), (True, {'1': 3})]
+        with tempfile.NamedTemporaryFile() as fp:
+            with hadoopy.TypedBytesFile(fp.name, 'w') as tb_fp:
+                tb_fp.writes(data)
+            path = self.data_path + 'writetb_from_fd'
+            hadoopy.writetb_from_fd(path, fp.fileno())
+        self.assertEqual(sorted(hadoopy.readtb(path)), sorted(data))
+        hadoopy.rmr(path)
+
     @unittest.skipIf(not hadoop_installed(), 'Hadoop not installed')
     def test_find(self):
         self.assertTrue(hadoopy._runner._find_hstreaming())
@@ -22,6 +22,10 @@ import tempfile
 import subprocess
 import os
 import re
+import time
+import shutil
+import posixpath
+import StringIO
 
 try:
     import unittest2 as unittest
@@ -77,6 +81,17 @@ class Test(unittest.TestCase):
             k, v = hadoopy.TypedBytesFile(f.name, 'r').next()
             self.assertEquals((unicode(k, 'utf-8'), unicode(v, 'utf-8')), kv)
 
+    def test_unicode_sizes(self):
+        f = tempfile.NamedTemporaryFile()
+        big = u'\xe9' * 2000000  # Larger than the reused buffer
+        kvs = [(u'', u'a'), (big, u'\xe9'), (u'b', big)]
+        with hadoopy.TypedBytesFile(f.name, 'w') as fp:
+            fp.writes(kvs)
+        self.assertEquals(list(hadoopy.TypedBytesFile(f.name, 'r')), kvs)
+        with open(f.name, 'wb') as fp:
+            fp.write('\x07\xff\xff\xff\xf0')  # Negative size
+        self.assertRaises(ValueError, hadoopy.TypedBytesFile(f.name, 'r').next)
+
     @unittest.skipIf(not has_endian(), 'Needs endian.h which is in a newer glibc')
     def test_fail(self):
         subprocess.check_call('gcc -o endian_test endian_test.c -Wall -D FAIL_TEST'.split())
@@ -121,6 +136,345 @@ class Test(unittest.TestCase):
             # Try to read one even when there are none left
             self.assertRaises(StopIteration, fp1.next)
 
+    def test_buffer_size_pipe(self):
+        read_fd, write_fd = os.pipe()
+        kvs = [(x, 'a' * (x % 10)) for x in range(1000)]  # Fits in the pipe
+        with hadoopy.TypedBytesFile(write_fd=write_fd, write_buffer_size=65536) as fp:
+            for kv in kvs:
+                fp.write(kv)
+        with hadoopy.TypedBytesFile(read_fd=read_fd, read_buffer_size=65536) as fp:
+            self.assertEquals(list(fp), kvs)
+
+    def test_next_batch(self):
+        f = tempfile.NamedTemporaryFile()
+        kvs = [(x, str(x)) for x in range(10)]
+        with hadoopy.TypedBytesFile(f.name, 'w') as fp:
+            fp.writes(kvs)
+        fp = hadoopy.TypedBytesFile(f.name, 'r')
+        self.assertEquals(fp.next_batch(4), kvs[:4])
+        self.assertEquals(fp.next_batch(4), kvs[4:8])
+        self.assertEquals(fp.next_batch(4), kvs[8:])
+        self.assertRaises(StopIteration, fp.next_batch, 4)
+
+    def test_next_batch_error(self):
+        f = tempfile.NamedTemporaryFile()
+        kvs = [(x, str(x)) for x in range(3)]
+        with hadoopy.TypedBytesFile(f.name, 'w') as fp:
+            fp.writes(kvs)
+        with open(f.name, 'ab') as fp:
+            fp.write('\x50\x00')  # Bad type code
+        fp = hadoopy.TypedBytesFile(f.name, 'r')
+        self.assertEquals(fp.next_batch(4), kvs)
+        self.assertRaises(IndexError, fp.next_batch, 4)
+
+    def test_strip_scheme(self):
+        from hadoopy._hdfs import _strip_scheme
+        self.assertEquals(_strip_scheme('hdfs://nn:8020/data/a#b?c'), '/data/a#b?c')
+        self.assertEquals(_strip_scheme('/data/a'), '/data/a')
+
+    def test_cloexec(self):
+        import fcntl
+        from hadoopy._hdfs import _pipe, _ReadPoller
+        fds = list(_pipe())
+        poller = _ReadPoller()
+        if poller._epoll:
+            fds.append(poller._epoll.fileno())
+        for fd in fds:
+            self.assertTrue(fcntl.fcntl(fd, fcntl.F_GETFD) & fcntl.FD_CLOEXEC)
+        poller.close()
+        os.close(fds[0])
+        os.close(fds[1])
+
+
+class _FakeProc(object):
+
+    def __init__(self, returncode, stdout=''):
+        self.returncode = returncode
+        self.stdout = StringIO.StringIO(stdout)
+
+    def communicate(self):
+        return self.stdout.read(), ''
+
+    def wait(self):
+        return self.returncode
+
+    def poll(self):
+        return self.returncode
+
+
+class HDFSTest(unittest.TestCase):
+
+    def setUp(self):
+        self._saved = dict((x, getattr(hadoopy._hdfs, x))
+                           for x in ['_HDFS_CLIENT', '_META_TTL', '_hadoop_fs_command',
+                                     '_checked_hadoop_fs_command'])
+        hadoopy._hdfs._HDFS_CLIENT = False  # Use the CLI path
+        hadoopy._hdfs._META_CACHE.clear()
+        self.argvs = []
+
+        def _command(argv, *args, **kw):
+            self.argvs.append(argv)
+            return _FakeProc(0 if argv[-1].startswith('/yes') else 1)
+        hadoopy._hdfs._hadoop_fs_command = _command
+        hadoopy._hdfs._checked_hadoop_fs_command = lambda argv, *args, **kw: _command(argv) and (0, '', '')
+
+    def tearDown(self):
+        for x, y in self._saved.items():
+            setattr(hadoopy._hdfs, x, y)
+        hadoopy._hdfs._META_CACHE.clear()
+
+    def test_metadata_ttl(self):
+        hadoopy._hdfs._META_TTL = 0
+        self.assertTrue(hadoopy.exists('/yes'))
+        self.assertTrue(hadoopy.exists('/yes'))
+        self.assertEquals(len(self.argvs), 2)
+        hadoopy._hdfs._META_TTL = .2
+        self.assertTrue(hadoopy.exists('/yes'))
+        self.assertTrue(hadoopy.exists('/yes'))
+        self.assertFalse(hadoopy.isdir('/no'))
+        self.assertFalse(hadoopy.isdir('/no'))
+        self.assertEquals(len(self.argvs), 4)
+        time.sleep(.3)
+        self.assertTrue(hadoopy.exists('/yes'))
+        self.assertEquals(len(self.argvs), 5)
+
+    def test_metadata_invalidation(self):
+        hadoopy._hdfs._META_TTL = 60
+        for func in [hadoopy.mkdir, hadoopy.rmr]:
+            hadoopy._hdfs._META_CACHE.clear()
+            self.argvs = []
+            hadoopy.exists('/yes')
+            hadoopy.exists('/yes')
+            func('/yes/b')
+            hadoopy.exists('/yes')
+            self.assertEquals(len(self.argvs), 3)
+
+    def test_metadata_invalidation_launch(self):
+        hadoopy._hdfs._META_TTL = 60
+        for func in [hadoopy.launch, hadoopy.launch_frozen, hadoopy.launch_local]:
+            hadoopy.exists('/yes')
+            self.assertTrue(hadoopy._hdfs._META_CACHE)
+            self.assertRaises(ValueError, func, '/yes/in', '/yes/out', '/no/script.py')
+            self.assertFalse(hadoopy._hdfs._META_CACHE)
+        launch = hadoopy._runner._clears_metadata(lambda: hadoopy.exists('/yes/out'))
+        launch()  # The job's output was cached while it ran
+        self.assertFalse(hadoopy._hdfs._META_CACHE)
+
+    def test_exists_many_ttl(self):
+        hadoopy._hdfs._META_TTL = 60
+        paths = ['/yes0', '/no0', '/yes1', '/no1', '/yes2']
+        out = [True, False, True, False, True]
+        self.assertEquals(hadoopy.exists_many(paths, num_procs=2), out)
+        self.assertEquals(len(self.argvs), 5)
+        self.assertTrue(hadoopy.exists('/yes1'))
+        self.assertEquals(hadoopy.exists_many(paths + ['/yes3']), out + [True])
+        self.assertEquals(len(self.argvs), 6)
+
+
+class AbspathTest(unittest.TestCase):
+
+    def setUp(self):
+        self._home_dir = hadoopy._hdfs._USER_HOME_DIR
+        hadoopy._hdfs._USER_HOME_DIR = '/user/a'
+        hadoopy._hdfs._ABSPATH_CACHE.clear()
+
+    def tearDown(self):
+        hadoopy._hdfs._USER_HOME_DIR = self._home_dir
+        hadoopy._hdfs._ABSPATH_CACHE.clear()
+
+    def test_abspath(self):
+        self.assertEquals(hadoopy.abspath('/b//c/../d/'), '/b/d')
+        self.assertEquals(hadoopy.abspath('b/./c/'), '/user/a/b/c')
+        hadoopy._hdfs._USER_HOME_DIR = '/user/other'
+        self.assertEquals(hadoopy.abspath('b/./c/'), '/user/a/b/c')  # Cached
+        hadoopy._hdfs._ABSPATH_CACHE_SIZE, size = 1, hadoopy._hdfs._ABSPATH_CACHE_SIZE
+        try:
+            self.assertEquals(hadoopy.abspath('e'), '/user/other/e')  # Clears when full
+            self.assertEquals(hadoopy.abspath('b/./c/'), '/user/other/b/c')
+        finally:
+            hadoopy._hdfs._ABSPATH_CACHE_SIZE = size
+
+
+class _FakeHDFSFile(object):
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def seek(self, pos):
+        self.pos = pos
+
+    def read(self, size):
+        out = self.data[self.pos:self.pos + size]
+        self.pos += len(out)
+        return out
+
+
+class _FakeHDFSClient(object):
+    """In memory stand in for the pyarrow client, files maps path -> data"""
+
+    def __init__(self, files=None, dirs=()):
+        self.files = dict(files or {})
+        self.dirs = set(dirs)
+
+    def open(self, path, mode):
+        return _FakeHDFSFile(self.files[path])
+
+    def exists(self, path):
+        return path in self.files or path in self.dirs
+
+    def isdir(self, path):
+        return path in self.dirs
+
+    def info(self, path):
+        if path in self.dirs:
+            return {'kind': 'directory', 'size': 0}
+        try:
+            return {'kind': 'file', 'size': len(self.files[path])}
+        except KeyError:
+            raise IOError('No such file or directory: %s' % path)
+
+    def ls(self, path):
+        if path not in self.dirs:
+            raise IOError('No such file or directory: %s' % path)
+        return sorted('hdfs://nn:8020' + x for x in self.files.keys() + list(self.dirs)
+                      if posixpath.dirname(x) == path and x != path)
+
+    def upload(self, path, fp):
+        self.files[path] = fp.read()
+
+    def download(self, path, fp):
+        fp.write(self.files[path])
+
+
+class ClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self._saved = dict((x, getattr(hadoopy._hdfs, x))
+                           for x in ['_HDFS_CLIENT', '_hadoop_fs_command',
+                                     '_checked_hadoop_fs_command'])
+        self.client = _FakeHDFSClient({'/d/a': 'abc', '/d/e': ''}, ['/d', '/u'])
+        hadoopy._hdfs._HDFS_CLIENT = self.client
+        self.argvs = []
+
+        def _command(argv, *args, **kw):
+            self.argvs.append(argv)
+            return _FakeProc(0, 'Found 1 items\n-rw-r--r--   1 u g 3 2012-01-01 00:00 /o/a\n')
+        hadoopy._hdfs._hadoop_fs_command = _command
+        hadoopy._hdfs._checked_hadoop_fs_command = lambda argv, *args, **kw: _command(argv) and (0, '', '')
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for x, y in self._saved.items():
+            setattr(hadoopy._hdfs, x, y)
+        shutil.rmtree(self.temp_dir)
+
+    def test_put_glob(self):
+        for x in ['a.txt', 'b.txt']:
+            open(os.path.join(self.temp_dir, x), 'w').close()
+        local_path = os.path.join(self.temp_dir, '*.txt')
+        hadoopy.put(local_path, '/u')
+        self.assertEquals(self.argvs, [['hadoop', 'fs', '-put', local_path, '/u']])
+
+    def test_metadata(self):
+        self.assertTrue(hadoopy.exists('/d/a'))
+        self.assertFalse(hadoopy.exists('/d/x'))
+        self.assertTrue(hadoopy.isdir('/d'))
+        self.assertFalse(hadoopy.isdir('/d/a'))
+        self.assertTrue(hadoopy.isempty('/d'))
+        self.assertTrue(hadoopy.isempty('/d/e'))
+        self.assertFalse(hadoopy.isempty('/d/a'))
+        self.assertFalse(hadoopy.isempty('/d/x'))  # info fails
+        self.assertEquals(hadoopy.exists_many(['/d/a', '/d/x']), [True, False])
+        self.assertEquals(self.argvs, [])
+
+    def test_ls(self):
+        self.assertEquals(hadoopy.ls('/d'), ['/d/a', '/d/e'])
+        self.assertRaises(IOError, hadoopy.ls, '/x')
+        self.assertEquals(self.argvs, [])
+
+    def test_put(self):
+        local_path = os.path.join(self.temp_dir, 'b')
+        with open(local_path, 'w') as fp:
+            fp.write('bcd')
+        hadoopy.put(local_path, '/d/b')
+        hadoopy.put(local_path, '/u')  # Directory target
+        self.assertEquals(self.client.files['/d/b'], 'bcd')
+        self.assertEquals(self.client.files['/u/b'], 'bcd')
+        self.assertRaises(IOError, hadoopy.put, local_path, '/d/b')  # Existing target
+        self.assertRaises(IOError, hadoopy.put, local_path, '/u')
+        self.assertEquals(self.argvs, [])
+        hadoopy.put(self.temp_dir, '/u')  # Directory source
+        self.assertEquals(self.argvs, [['hadoop', 'fs', '-put', self.temp_dir, '/u']])
+
+    def test_get(self):
+        local_path = os.path.join(self.temp_dir, 'b')
+        hadoopy.get('/d/a', local_path)
+        hadoopy.get('/d/a', self.temp_dir)  # Directory target
+        self.assertEquals(open(local_path).read(), 'abc')
+        self.assertEquals(open(os.path.join(self.temp_dir, 'a')).read(), 'abc')
+        self.assertRaises(IOError, hadoopy.get, '/d/a', local_path)  # Existing target
+        self.assertRaises(IOError, hadoopy.get, '/d/a', self.temp_dir)
+        self.assertEquals(self.argvs, [])
+        hadoopy.get('/d', self.temp_dir)  # Directory source
+        self.assertEquals(self.argvs, [['hadoop', 'fs', '-get', '/d', self.temp_dir]])
+
+    def test_get_failed(self):
+        local_path = os.path.join(self.temp_dir, 'b')
+
+        def _download(path, fp):
+            fp.write('ab')
+            raise IOError('Lost connection')
+        self.client.download = _download
+        self.assertRaises(IOError, hadoopy.get, '/d/a', local_path)
+        self.assertFalse(os.path.exists(local_path))
+
+    def test_scheme_uses_cli(self):
+        # The client is only connected to the default filesystem
+        for path in ['s3n://b/d/a', 'hdfs://other-nn/d/a', 'file:///d/a']:
+            self.argvs = []
+            self.assertTrue(hadoopy.exists(path))
+            self.assertTrue(hadoopy.isdir(path))
+            self.assertTrue(hadoopy.isempty(path))
+            self.assertEquals(hadoopy.ls(path), ['/o/a'])
+            self.assertEquals(hadoopy.exists_many([path, '/d/a']), [True, True])
+            hadoopy.get(path, self.temp_dir)
+            hadoopy.put(os.path.join(self.temp_dir, 'x'), path)
+            self.assertEquals([x[2] for x in self.argvs],
+                              ['-test', '-test', '-test', '-ls', '-test', '-test', '-get', '-put'])
+
+
+class DownloadRangesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._range_size = hadoopy._hdfs._GET_RANGE_SIZE
+        hadoopy._hdfs._GET_RANGE_SIZE = 1000
+        self.temp_dir = tempfile.mkdtemp()
+        self.local_path = os.path.join(self.temp_dir, 'out')
+
+    def tearDown(self):
+        hadoopy._hdfs._GET_RANGE_SIZE = self._range_size
+        if os.path.exists(self.local_path):
+            os.remove(self.local_path)
+        os.rmdir(self.temp_dir)
+
+    def test_reassembly(self):
+        data = os.urandom(10500)  # 10 full ranges and a partial one
+        hadoopy._hdfs._download_ranges(_FakeHDFSClient({'/a': data}), '/a', self.local_path, len(data))
+        self.assertEquals(open(self.local_path, 'rb').read(), data)
+
+    def test_short_read(self):
+        data = os.urandom(5000)
+        self.assertRaises(IOError, hadoopy._hdfs._download_ranges, _FakeHDFSClient({'/a': data}),
+                          '/a', self.local_path, 5500)
+        self.assertFalse(os.path.exists(self.local_path))
+
 
 class HadoopyTest(hadoopy.Test):
     def test_wc(self):